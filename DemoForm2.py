@@ -4,7 +4,7 @@
 import urllib.request
 
 #크롤링
-from bs4 import BeautifulSoup   
+from html_parsing import select_nodes
 #정규표현식: 특정 문자열 패턴 찾기
 
 import sys
@@ -32,8 +32,7 @@ class DemoForm(QMainWindow, form_class):
 
             data = urllib.request.urlopen(url).read()   
 
-            soup = BeautifulSoup(data, 'html.parser')
-            list = soup.find_all("span", attrs={"data-role":"list-title-text"})
+            list = select_nodes(data, 'span[data-role="list-title-text"]', url)
             for item in list:   
                 title = item.text.strip()
                 print(title)        
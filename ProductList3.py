@@ -4,17 +4,29 @@ from PyQt5.QtCore import pyqtSlot, Qt
 from PyQt5 import uic
 import sqlite3
 import os
+from sqlite_tuning import TimedConnection, apply_profile, is_read_only
 
 # DB 관련 로직을 분리
 class ProductDB:
-    def __init__(self, db_path=None):
+    def __init__(self, db_path=None, profile=None, query_timer=None):
+        """
+        profile: sqlite_tuning 프로파일 이름 ('oltp', 'bulk_load', 'read_only' - 테이블을 만들지 않음)
+        query_timer: sqlite_tuning.QueryTimer (문장별 지연 기록)
+        """
         if db_path is None:
             base = os.path.dirname(__file__) if '__file__' in globals() else os.getcwd()
             db_path = os.path.join(base, "ProductList.db")
         self.db_path = db_path
-        self.con = sqlite3.connect(self.db_path, isolation_level=None)
+        self.con = sqlite3.connect(self.db_path, isolation_level=None,
+                                   factory=TimedConnection if query_timer is not None else sqlite3.Connection)
+        if profile:
+            apply_profile(self.con, profile)
+        self.query_timer = query_timer
+        if query_timer is not None:
+            query_timer.attach(self.con)
         self.cur = self.con.cursor()
-        self._ensure_table()
+        if not is_read_only(profile):
+            self._ensure_table()
 
     def _ensure_table(self):
         self.cur.execute(
@@ -1,7 +1,7 @@
 import sys
 from PyQt5.QtWidgets import *
 import urllib.request
-from bs4 import BeautifulSoup
+from html_parsing import make_soup
 import webbrowser   #브라우저로 넘기는 경우 
 import re 
 
@@ -41,12 +41,12 @@ class Form(QMainWindow):
         hdr = {'User-agent':'Mozila/5.0 (compatible; MSIE 5.5; Windows NT)'}
         for n in range(0,5):
             #클리앙의 중고장터 주소 
-            data ='https://www.clien.net/service/board/sold?&od=T31&po=' + str(n)
-            req = urllib.request.Request(data, 
+            url ='https://www.clien.net/service/board/sold?&od=T31&po=' + str(n)
+            req = urllib.request.Request(url, 
                 headers = hdr)
             data = urllib.request.urlopen(req).read()
             page = data.decode('utf-8', 'ignore')
-            soup = BeautifulSoup(page, 'html.parser')
+            soup = make_soup(page, url)
             list = soup.find_all('a', attrs={'class':'list_subject'})
 
             f = open("clien.txt", "a+", encoding="utf-8")
@@ -0,0 +1,175 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+스크래퍼 공용 HTML 파싱 모듈
+
+모든 스크래퍼가 BeautifulSoup 생성을 이 모듈에 맡기고,
+사이트별로 파서 백엔드를 바꿀 수 있도록 한다.
+
+백엔드:
+    - 'html.parser': 파이썬 내장 파서 (가장 느리지만 의존성 없음)
+    - 'lxml': lxml 기반 BeautifulSoup (기본값, requirements.txt 에 포함)
+    - 'selectolax': CSS 선택자만 쓰는 빠른 경로 (설치된 경우에만, select_nodes 전용)
+
+사용 예:
+    soup = make_soup(html, url)              # 사이트별 설정에 따른 BeautifulSoup
+    nodes = select_nodes(html, "a.subject")  # 텍스트/속성만 필요할 때의 빠른 경로
+"""
+
+import glob
+import os
+import time
+from urllib.parse import urlparse
+
+from bs4 import BeautifulSoup
+
+try:
+    import lxml  # noqa: F401
+    HAVE_LXML = True
+except ImportError:
+    HAVE_LXML = False
+
+try:
+    from selectolax.parser import HTMLParser
+    HAVE_SELECTOLAX = True
+except ImportError:
+    HAVE_SELECTOLAX = False
+
+SOUP_BACKENDS = ('html.parser', 'lxml')
+
+# 환경변수 HTML_PARSER 로 전체 기본 백엔드를 바꿀 수 있다.
+DEFAULT_BACKEND = os.environ.get('HTML_PARSER') or ('lxml' if HAVE_LXML else 'html.parser')
+
+# 사이트(호스트)별 백엔드 설정: 파서 차이로 결과가 달라지는 사이트만 여기서 고정한다.
+SITE_BACKENDS = {}
+
+
+class Node:
+    """빠른 경로(select_nodes)의 결과 요소: 텍스트와 속성만 가진다."""
+
+    __slots__ = ('text', 'attrs')
+
+    def __init__(self, text, attrs):
+        self.text = text
+        self.attrs = attrs
+
+    def get(self, name, default=None):
+        return self.attrs.get(name, default)
+
+    def __repr__(self):
+        return f"Node({self.text[:30]!r})"
+
+
+def set_site_backend(site, backend):
+    """
+    특정 사이트의 파서 백엔드를 지정합니다.
+
+    Args:
+        site (str): 호스트명 (예: 'www.clien.net') 또는 URL
+        backend (str): SOUP_BACKENDS 중 하나
+    """
+    if backend not in SOUP_BACKENDS:
+        raise ValueError(f"지원하지 않는 파서 백엔드: {backend}")
+    SITE_BACKENDS[_host(site)] = backend
+
+
+def backend_for(url=None):
+    """URL에 적용될 BeautifulSoup 파서 백엔드를 반환합니다."""
+    backend = SITE_BACKENDS.get(_host(url), DEFAULT_BACKEND) if url else DEFAULT_BACKEND
+    if backend == 'lxml' and not HAVE_LXML:
+        return 'html.parser'
+    return backend
+
+
+def make_soup(markup, url=None, backend=None):
+    """
+    사이트별 설정에 맞는 파서로 BeautifulSoup 객체를 생성합니다.
+
+    Args:
+        markup (str | bytes): HTML 문서
+        url (str): 문서 URL (사이트별 백엔드 선택에 사용)
+        backend (str): 백엔드를 직접 지정할 때 사용
+
+    Returns:
+        BeautifulSoup: 파싱된 문서
+    """
+    return BeautifulSoup(markup, backend or backend_for(url))
+
+
+def select_nodes(markup, selector, url=None):
+    """
+    CSS 선택자에 맞는 요소의 텍스트와 속성만 추출합니다 (빠른 경로).
+
+    selectolax 가 설치되어 있으면 트리를 BeautifulSoup 객체로 만들지 않고 처리하며,
+    없으면 make_soup + soup.select 로 처리합니다.
+
+    Args:
+        markup (str | bytes): HTML 문서
+        selector (str): CSS 선택자
+        url (str): 문서 URL (대체 경로의 백엔드 선택에 사용)
+
+    Returns:
+        list[Node]: 선택된 요소 목록
+    """
+    if HAVE_SELECTOLAX:
+        if isinstance(markup, bytes):
+            markup = markup.decode('utf-8', 'ignore')
+        return [Node(node.text(), dict(node.attributes)) for node in HTMLParser(markup).css(selector)]
+
+    soup = make_soup(markup, url)
+    return [Node(el.get_text(), dict(el.attrs)) for el in soup.select(selector)]
+
+
+def benchmark_backends(paths=None, repeat=20, selector='a'):
+    """
+    저장된 HTML 파일로 백엔드별 파싱 시간을 측정합니다.
+
+    Args:
+        paths (list): HTML 파일 경로 목록 (None이면 현재 폴더의 *.html)
+        repeat (int): 파일 전체 반복 횟수
+        selector (str): 빠른 경로 측정에 사용할 CSS 선택자
+
+    Returns:
+        dict: 백엔드명 -> 소요 시간(초)
+    """
+    paths = paths or sorted(glob.glob('*.html'))
+    documents = []
+    for path in paths:
+        with open(path, 'rb') as f:
+            documents.append(f.read())
+    if not documents:
+        print("벤치마크할 HTML 파일이 없습니다.")
+        return {}
+
+    results = {}
+    for backend in SOUP_BACKENDS:
+        if backend == 'lxml' and not HAVE_LXML:
+            continue
+        start = time.perf_counter()
+        for _ in range(repeat):
+            for document in documents:
+                BeautifulSoup(document, backend).select(selector)
+        results[backend] = time.perf_counter() - start
+
+    if HAVE_SELECTOLAX:
+        start = time.perf_counter()
+        for _ in range(repeat):
+            for document in documents:
+                HTMLParser(document.decode('utf-8', 'ignore')).css(selector)
+        results['selectolax'] = time.perf_counter() - start
+
+    total_kb = sum(len(document) for document in documents) / 1024
+    print(f"HTML {len(documents)}개 ({total_kb:.1f}KB) x {repeat}회, 선택자 '{selector}'")
+    for backend, seconds in results.items():
+        print(f"  {backend:<12} {seconds:.3f}초")
+    return results
+
+
+def _host(url_or_host):
+    if not url_or_host:
+        return ''
+    return urlparse(url_or_host).netloc or url_or_host
+
+
+if __name__ == "__main__":
+    benchmark_backends()
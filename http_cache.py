@@ -0,0 +1,255 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+스크래퍼 공용 HTTP 디스크 캐시 (조건부 GET)
+
+본문은 URL 별로 디스크에 저장하고, 다시 요청할 때
+    - Cache-Control max-age 가 남아 있으면 네트워크 없이 캐시에서 반환하고
+    - 만료됐으면 If-None-Match / If-Modified-Since 를 보내 304 면 본문 전송 없이 캐시를 쓴다.
+전체 크기가 max_bytes 를 넘으면 가장 오래 쓰지 않은 항목부터 지운다 (LRU).
+
+사용 예:
+    response = cached_get(url, headers=HEADERS, timeout=10)            # 기본 캐시 + requests.get
+    response = cached_get(url, session=session, cache=my_cache)        # 세션/캐시 지정
+    response.from_cache  # 캐시 본문을 썼으면 True (신선한 적중 또는 304)
+"""
+
+import hashlib
+import json
+import os
+import re
+import tempfile
+import threading
+import time
+
+import requests
+
+DEFAULT_CACHE_DIR = os.environ.get('HTTP_CACHE_DIR', '.http_cache')
+DEFAULT_MAX_BYTES = 200 * 1024 * 1024
+
+MAX_AGE_RE = re.compile(r'max-age\s*=\s*(\d+)')
+
+# 304 응답이나 캐시 적중 시 되살릴 필요가 없는 헤더
+HOP_HEADERS = {'connection', 'keep-alive', 'transfer-encoding', 'content-encoding', 'content-length'}
+
+
+class HttpCache:
+    """
+    URL -> 응답 본문 디스크 캐시 (스레드 안전).
+
+    디렉터리 구조:
+        <directory>/index.json       URL 별 메타데이터 (ETag, Last-Modified, 만료 시각, 크기, 마지막 사용 시각)
+        <directory>/<sha1>.body      응답 본문
+    """
+
+    def __init__(self, directory=DEFAULT_CACHE_DIR, max_bytes=DEFAULT_MAX_BYTES):
+        """
+        Args:
+            directory (str): 캐시 폴더
+            max_bytes (int): 본문 전체 크기 상한 (넘으면 LRU 삭제)
+        """
+        self.directory = directory
+        self.max_bytes = max_bytes
+        self.index_path = os.path.join(directory, 'index.json')
+        self._lock = threading.Lock()
+        self.stats = {'hit': 0, 'revalidated': 0, 'miss': 0}
+
+        os.makedirs(directory, exist_ok=True)
+        self._entries = {}
+        if os.path.exists(self.index_path):
+            try:
+                with open(self.index_path, 'r', encoding='utf-8') as f:
+                    self._entries = json.load(f)
+            except (OSError, ValueError):
+                self._entries = {}
+
+    def get(self, url, session=None, **kwargs):
+        """
+        캐시를 거쳐 GET 요청을 보냅니다.
+
+        Args:
+            url (str): 요청 URL
+            session (requests.Session): 사용할 세션 (None이면 requests.get)
+            **kwargs: requests 의 get 인자 (headers, timeout 등)
+
+        Returns:
+            requests.Response: 응답 (캐시 본문을 쓴 경우 from_cache=True, status_code=200)
+        """
+        key = self._key(url)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry and not os.path.exists(self._body_path(key)):
+                self._entries.pop(key)
+                entry = None
+
+        if entry and entry.get('expires', 0) > time.time():
+            cached = self._cached_response(url, key, entry)
+            if cached is not None:
+                with self._lock:
+                    self.stats['hit'] += 1
+                    entry['last_used'] = time.time()
+                return cached
+            entry = None  # 읽기 직전에 다른 스레드가 LRU 로 지웠으면 미스로 처리
+
+        request_headers = dict(kwargs.pop('headers', None) or {})
+        headers = dict(request_headers)
+        if entry:
+            if entry.get('etag'):
+                headers['If-None-Match'] = entry['etag']
+            if entry.get('last_modified'):
+                headers['If-Modified-Since'] = entry['last_modified']
+
+        fetch = session.get if session is not None else requests.get
+        response = fetch(url, headers=headers, **kwargs)
+
+        if response.status_code == 304 and entry:
+            cached = self._cached_response(url, key, entry)
+            if cached is not None:
+                with self._lock:
+                    self.stats['revalidated'] += 1
+                    entry.update(self._validators(response, entry))
+                    entry['headers'].update({k: v for k, v in response.headers.items() if k.lower() not in HOP_HEADERS})
+                    entry['last_used'] = time.time()
+                    self._save_index()
+                return cached
+            # 재검증 중에 본문이 지워졌으면 조건 없이 다시 받는다
+            response = fetch(url, headers=request_headers, **kwargs)
+
+        with self._lock:
+            self.stats['miss'] += 1
+        response.from_cache = False
+        if response.status_code == 200:
+            self._store(key, url, response)
+        return response
+
+    def clear(self):
+        """캐시를 모두 비웁니다."""
+        with self._lock:
+            for key in list(self._entries):
+                self._remove(key)
+            self._save_index()
+
+    def size(self):
+        """캐시된 본문의 전체 크기(바이트)"""
+        with self._lock:
+            return sum(entry['size'] for entry in self._entries.values())
+
+    def _store(self, key, url, response):
+        cache_control = response.headers.get('Cache-Control', '').lower()
+        if 'no-store' in cache_control:
+            return
+
+        entry = self._validators(response, {})
+        if not (entry.get('etag') or entry.get('last_modified') or entry.get('expires', 0) > time.time()):
+            return  # 재검증도, 신선도 판단도 할 수 없는 응답은 저장해도 쓸 일이 없다
+
+        body = response.content
+        if len(body) > self.max_bytes:
+            return
+
+        entry.update({
+            'url': url,
+            'size': len(body),
+            'encoding': response.encoding,
+            'headers': {k: v for k, v in response.headers.items() if k.lower() not in HOP_HEADERS},
+            'last_used': time.time(),
+        })
+
+        # 같은 URL을 동시에 저장하는 스레드/프로세스가 임시 파일을 공유하지 않도록 고유 이름을 쓴다
+        with tempfile.NamedTemporaryFile(dir=self.directory, suffix='.tmp', delete=False) as f:
+            f.write(body)
+            tmp_path = f.name
+        with self._lock:
+            os.replace(tmp_path, self._body_path(key))
+            self._entries[key] = entry
+            self._evict()
+            self._save_index()
+
+    def _validators(self, response, entry):
+        """응답 헤더에서 ETag/Last-Modified/만료 시각을 뽑습니다 (없으면 기존 값 유지)."""
+        headers = response.headers
+        cache_control = headers.get('Cache-Control', '').lower()
+        match = MAX_AGE_RE.search(cache_control)
+        max_age = int(match.group(1)) if match and 'no-cache' not in cache_control else 0
+        return {
+            'etag': headers.get('ETag', entry.get('etag')),
+            'last_modified': headers.get('Last-Modified', entry.get('last_modified')),
+            'expires': time.time() + max_age,
+        }
+
+    def _cached_response(self, url, key, entry):
+        """캐시 본문으로 응답을 만듭니다 (본문 파일이 그새 지워졌으면 None)."""
+        try:
+            with open(self._body_path(key), 'rb') as f:
+                body = f.read()
+        except FileNotFoundError:
+            with self._lock:
+                if self._entries.get(key) is entry:  # 그사이 새로 저장된 항목은 남긴다
+                    self._entries.pop(key)
+            return None
+        response = requests.Response()
+        response.status_code = 200
+        response.url = url
+        response._content = body
+        response.headers.update(entry.get('headers', {}))
+        response.encoding = entry.get('encoding')
+        response.from_cache = True
+        return response
+
+    def _evict(self):
+        """전체 크기가 상한 이하가 될 때까지 가장 오래 쓰지 않은 항목을 지웁니다 (락 안에서 호출)."""
+        total = sum(entry['size'] for entry in self._entries.values())
+        for key in sorted(self._entries, key=lambda k: self._entries[k]['last_used']):
+            if total <= self.max_bytes:
+                break
+            total -= self._entries[key]['size']
+            self._remove(key)
+
+    def _remove(self, key):
+        self._entries.pop(key, None)
+        try:
+            os.remove(self._body_path(key))
+        except OSError:
+            pass
+
+    def _save_index(self):
+        with tempfile.NamedTemporaryFile('w', encoding='utf-8', dir=self.directory, suffix='.tmp',
+                                         delete=False) as f:
+            json.dump(self._entries, f, ensure_ascii=False)
+        os.replace(f.name, self.index_path)
+
+    def _body_path(self, key):
+        return os.path.join(self.directory, key + '.body')
+
+    @staticmethod
+    def _key(url):
+        return hashlib.sha1(url.encode('utf-8')).hexdigest()
+
+
+_default_cache = None
+_default_lock = threading.Lock()
+
+
+def default_cache():
+    """스크래퍼들이 함께 쓰는 기본 캐시 (처음 호출할 때 생성)"""
+    global _default_cache
+    with _default_lock:
+        if _default_cache is None:
+            _default_cache = HttpCache()
+        return _default_cache
+
+
+def cached_get(url, session=None, cache=None, **kwargs):
+    """
+    캐시를 거친 GET 요청 (requests.get 대신 사용).
+
+    Args:
+        url (str): 요청 URL
+        session (requests.Session): 사용할 세션 (None이면 requests.get)
+        cache (HttpCache): 사용할 캐시 (None이면 default_cache())
+        **kwargs: requests 의 get 인자
+
+    Returns:
+        requests.Response: 응답
+    """
+    return (cache or default_cache()).get(url, session=session, **kwargs)
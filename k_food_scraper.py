@@ -1,5 +1,5 @@
-import requests
-from bs4 import BeautifulSoup
+from html_parsing import make_soup
+from http_cache import cached_get
 from docx import Document
 from docx.shared import Pt
 import re
@@ -31,9 +31,9 @@ def first_paragraph(soup, min_len=120):
 
 def fetch_summary(url):
     try:
-        r = requests.get(url, headers=HEADERS, timeout=10)
+        r = cached_get(url, headers=HEADERS, timeout=10)
         r.raise_for_status()
-        soup = BeautifulSoup(r.text, "html.parser")
+        soup = make_soup(r.text, url)
         title = (soup.title.string or "").strip() if soup.title else url
         summary = first_paragraph(soup)
         if not summary:
@@ -0,0 +1,198 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+한국식 가격/면적 문자열을 숫자로 바꾸는 유틸리티
+
+    parse_price_krw("3억 5000만원")  -> 350000000
+    parse_price_krw("1,200만원")     -> 12000000
+    parse_area_m2("84.5㎡")          -> 84.5
+    parse_area_m2("25평")            -> 82.64...
+
+pandas Series/리스트는 normalize_price / normalize_area 로 한 번에 변환한다.
+고유값만 파싱한 뒤 코드로 펼치므로 반복 값이 많은 크롤링 결과에서 특히 빠르다.
+
+    df = normalize_listing_frame(df)  # '가격_원'(Int64), '면적_㎡'(float64) 컬럼 추가
+"""
+
+import random
+import re
+import time
+
+import numpy as np
+import pandas as pd
+
+PYEONG_TO_M2 = 400 / 121  # 1평 = 3.3058㎡
+
+# 억 단위(+ 만 단위 나머지) 또는 만 단위 가격. '14억 5,000' 처럼 만이 생략된 나머지도 만 단위로 보되,
+# 나머지 숫자 뒤에 만/천/백/십/원이 오거나 가격 토큰이 끝날 때만 인정한다 ('3억 2층'의 2는 제외).
+PRICE_RE = re.compile(
+    r'(?P<eok>\d[\d,]*(?:\.\d+)?)\s*억'
+    r'(?:\s*(?P<man>\d[\d,]*)(?:\s*(?P<unit>[천백십])\s*만?|\s*만|(?=\s*(?:원|$|[/|,·~()\[\]\-]))))?'
+    r'|(?P<man_only>\d[\d,]*)\s*(?P<unit_only>[천백십])?\s*만'
+)
+AREA_RE = re.compile(r'(?P<value>\d[\d,]*(?:\.\d+)?)\s*(?P<unit>㎡|m²|m2|평|py)')
+
+MAN_UNIT_MULTIPLIERS = {None: 1, '천': 1000, '백': 100, '십': 10}
+
+
+def parse_price_krw(text):
+    """
+    가격 문자열을 원 단위 정수로 변환합니다.
+
+    Args:
+        text (str): '3억 5000만원', '1,200만원', '3억 5천만원' 등
+
+    Returns:
+        int | None: 원 단위 가격 (해석할 수 없으면 None)
+    """
+    if not isinstance(text, str):
+        return None
+    match = PRICE_RE.search(text)
+    if not match:
+        return None
+
+    if match.group('eok') is not None:
+        eok = float(match.group('eok').replace(',', ''))
+        man_text, unit = match.group('man'), match.group('unit')
+    else:
+        eok = 0
+        man_text, unit = match.group('man_only'), match.group('unit_only')
+
+    man = int(man_text.replace(',', '')) * MAN_UNIT_MULTIPLIERS[unit] if man_text else 0
+    return int(round(eok * 100_000_000)) + man * 10_000
+
+
+def parse_area_m2(text):
+    """
+    면적 문자열을 ㎡ 단위 실수로 변환합니다 (평/py는 ㎡로 환산).
+
+    Args:
+        text (str): '84.5㎡', '25평', '30py' 등
+
+    Returns:
+        float | None: ㎡ 단위 면적 (해석할 수 없으면 None)
+    """
+    if not isinstance(text, str):
+        return None
+    match = AREA_RE.search(text)
+    if not match:
+        return None
+
+    value = float(match.group('value').replace(',', ''))
+    if match.group('unit') in ('평', 'py'):
+        value *= PYEONG_TO_M2
+    return value
+
+
+def normalize_price(values):
+    """
+    가격을 원 단위로 변환합니다 (단일 값 또는 Series/리스트 일괄 변환).
+
+    Args:
+        values (str | pandas.Series | list): 가격 문자열 또는 그 모음
+
+    Returns:
+        int | None | pandas.Series: 단일 값이면 int/None, 모음이면 Int64 Series (해석 불가 값은 <NA>)
+    """
+    if values is None or isinstance(values, str):
+        return parse_price_krw(values)
+
+    series = values if isinstance(values, pd.Series) else pd.Series(values, dtype=object)
+    codes, uniques = pd.factorize(series)
+    parts = pd.Series(uniques, dtype=object).astype(str).str.extract(PRICE_RE)
+
+    eok = _to_number(parts['eok'])
+    man_text = parts['man'].fillna(parts['man_only'])
+    unit = parts['unit'].fillna(parts['unit_only'])
+    man = _to_number(man_text) * unit.map(MAN_UNIT_MULTIPLIERS).fillna(1)
+
+    krw = ((eok.fillna(0) * 100_000_000).round() + man.fillna(0) * 10_000).where(eok.notna() | man_text.notna())
+    result = pd.array(krw.to_numpy(), dtype='Int64').take(codes, allow_fill=True)
+    return pd.Series(result, index=series.index, name=series.name)
+
+
+def normalize_area(values):
+    """
+    면적을 ㎡ 단위로 변환합니다 (단일 값 또는 Series/리스트 일괄 변환, 평/py는 환산).
+
+    Args:
+        values (str | pandas.Series | list): 면적 문자열 또는 그 모음
+
+    Returns:
+        float | None | pandas.Series: 단일 값이면 float/None, 모음이면 float64 Series (해석 불가 값은 NaN)
+    """
+    if values is None or isinstance(values, str):
+        return parse_area_m2(values)
+
+    series = values if isinstance(values, pd.Series) else pd.Series(values, dtype=object)
+    codes, uniques = pd.factorize(series)
+    parts = pd.Series(uniques, dtype=object).astype(str).str.extract(AREA_RE)
+
+    area = _to_number(parts['value']) * np.where(parts['unit'].isin(['평', 'py']), PYEONG_TO_M2, 1.0)
+    result = np.append(area.to_numpy(dtype=float), np.nan)[codes]  # 코드 -1(결측) -> NaN
+    return pd.Series(result, index=series.index, name=series.name)
+
+
+def normalize_listing_frame(df, price_column='가격', area_column='면적'):
+    """
+    매물 DataFrame에 숫자 컬럼 '가격_원', '면적_㎡' 를 추가한 사본을 반환합니다.
+
+    Args:
+        df (pandas.DataFrame): 크롤링 결과
+        price_column (str): 가격 문자열 컬럼명
+        area_column (str): 면적 문자열 컬럼명
+    """
+    df = df.copy()
+    if price_column in df:
+        df['가격_원'] = normalize_price(df[price_column])
+    if area_column in df:
+        df['면적_㎡'] = normalize_area(df[area_column])
+    return df
+
+
+def benchmark_normalizers(n=1_000_000, seed=0):
+    """
+    합성 가격/면적 문자열 n개로 행 단위 apply 와 일괄 변환 속도를 비교합니다.
+
+    Returns:
+        dict: 방식별 소요 시간(초)
+    """
+    rng = random.Random(seed)
+    price_formats = [
+        lambda: f"{rng.randint(1, 30)}억 {rng.randint(0, 19) * 500:,}만원",
+        lambda: f"{rng.randint(1, 30)}억 {rng.randint(1, 9)}천만원",
+        lambda: f"{rng.randint(1, 99) * 100:,}만원",
+        lambda: f"{rng.randint(1, 30)}억원",
+        lambda: "정보 없음",
+    ]
+    area_formats = [
+        lambda: f"{rng.randint(20, 200)}.{rng.randint(0, 9)}㎡",
+        lambda: f"{rng.randint(10, 60)}평",
+        lambda: "정보 없음",
+    ]
+    prices = pd.Series([rng.choice(price_formats)() for _ in range(n)])
+    areas = pd.Series([rng.choice(area_formats)() for _ in range(n)])
+
+    results = {}
+    start = time.perf_counter()
+    prices.apply(parse_price_krw)
+    areas.apply(parse_area_m2)
+    results['apply'] = time.perf_counter() - start
+
+    start = time.perf_counter()
+    normalize_price(prices)
+    normalize_area(areas)
+    results['vectorized'] = time.perf_counter() - start
+
+    print(f"합성 문자열 {n:,}개 x 2컬럼 (고유 가격 {prices.nunique():,}개, 고유 면적 {areas.nunique():,}개)")
+    print(f"  행 단위 apply : {results['apply']:.2f}초")
+    print(f"  일괄 변환     : {results['vectorized']:.2f}초 ({results['apply'] / results['vectorized']:.1f}배)")
+    return results
+
+
+def _to_number(text_series):
+    return pd.to_numeric(text_series.str.replace(',', '', regex=False), errors='coerce')
+
+
+if __name__ == "__main__":
+    benchmark_normalizers()
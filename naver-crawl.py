@@ -14,20 +14,37 @@ from selenium.webdriver.chrome.options import Options
 from selenium.webdriver.common.action_chains import ActionChains
 from selenium.webdriver.common.keys import Keys
 from webdriver_manager.chrome import ChromeDriverManager
-from bs4 import BeautifulSoup
-from urllib.parse import urljoin, urlparse
+from html_parsing import make_soup
+from urllib.parse import urljoin, urlparse, parse_qsl, urlencode, urlunparse
+from abc import ABC, abstractmethod
 try:
     import undetected_chromedriver as uc
     HAVE_UC = True
 except Exception:
     HAVE_UC = False
 
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+    HAVE_PYARROW = True
+except Exception:
+    HAVE_PYARROW = False
+
 from fake_useragent import UserAgent
+from korean_units import normalize_price, normalize_area
 from selenium.common.exceptions import MoveTargetOutOfBoundsException, NoSuchElementException
 
+import argparse
+import glob
+import gzip
+import hashlib
 import logging
+import multiprocessing as mp
+import queue
 import requests
 import random
+import sqlite3
+import tempfile
 import time
 import re
 import json
@@ -37,18 +54,687 @@ import os
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
 
+# 매물 목록 요소 선택자 (우선순위 순)
+PROPERTY_SELECTORS = [
+    ".item_list .item",
+    ".list .item",
+    ".item",
+    "[class*='item']",
+    ".card",
+    "[class*='card']",
+    "li[class*='item']",
+    "div[class*='property']",
+    "tr[class*='item']",
+    ".complex_item",
+    "[data-testid*='item']",
+    ".article_item",
+    ".property_item",
+    ".listing_item",
+    "[class*='listing']",
+    "[class*='article']",
+    "[class*='property']"
+]
+
+# 페이지 준비 대기용 목록 선택자 — [class*='item'] 같은 포괄 선택자는 내비게이션 요소에도
+# 바로 걸리므로, 캐시된 선택자가 없을 때는 목록 전용 클래스만 기다린다
+LISTING_READY_SELECTORS = [
+    ".item_list .item",
+    ".list .item",
+    ".complex_item",
+    ".article_item",
+    ".property_item",
+    ".listing_item"
+]
+
+# 다음 페이지 버튼 선택자 (우선순위 순)
+NEXT_BUTTON_SELECTORS = [
+    "a[class*='next']",
+    "button[class*='next']",
+    ".pagination .next",
+    ".paging .next",
+    "a[aria-label*='다음']",
+    "button[aria-label*='다음']",
+    ".page_next",
+    "[data-testid*='next']",
+    "a[title*='다음']",
+    "button[title*='다음']"
+]
+
+# 해석된 chromedriver 경로 캐시 (한 번 설치 후에는 네트워크 확인 없이 재사용)
+DRIVER_CACHE_PATH = os.path.join(os.path.expanduser("~"), ".naver_land_crawler", "chromedriver.json")
+
+# JSON API 페이지 번호로 쓰이는 파라미터 이름 (쿼리스트링 또는 JSON 본문)
+API_PAGE_KEYS = ('page', 'pageNo', 'page_no', 'pageNumber', 'pageIndex')
+
+# 네트워크 리소스 수와 DOM 변경 횟수를 함께 반환 (최초 호출 시 MutationObserver 설치)
+ACTIVITY_SCRIPT = """
+if (!window.__stealthMutations) {
+    window.__stealthMutations = {count: 0};
+    new MutationObserver(function (records) {
+        window.__stealthMutations.count += records.length;
+    }).observe(document, {childList: true, subtree: true, attributes: true});
+}
+return [performance.getEntriesByType('resource').length, window.__stealthMutations.count];
+"""
+
+NO_INFO = '정보 없음'
+PROPERTY_TYPES = ['매매', '전세', '월세', '아파트', '오피스텔', '빌라', '단독주택', '투룸', '원룸', '쓰리룸', '포룸']
+# 복합 방향을 먼저 두어 '남동향'이 '동향'으로 잘리지 않도록 함
+DIRECTIONS = ['남동향', '남서향', '북동향', '북서향', '남향', '북향', '동향', '서향']
+
+# 매물 텍스트 단일 패스 스캐너: 숫자+단위 토큰과 한글 구(句) 토큰을 한 번에 훑는다
+TEXT_TOKEN_RE = re.compile(
+    r'(?P<num>\d+(?:[.,]\d+)*)(?P<unit>억\s*\d*(?P<sub>[천백십])?만원|억원|만원|㎡|평|py|층|F|f)?'
+    r'|(?P<word>[가-힣]+(?:\s+[가-힣]+)*)'
+)
+KEYWORD_RE = re.compile('|'.join(sorted(PROPERTY_TYPES + DIRECTIONS, key=len, reverse=True)))
+ADDRESS_RES = [
+    re.compile(r'[가-힣]+시\s*[가-힣]+구'),
+    re.compile(r'[가-힣]+구\s*[가-힣]+동'),
+    re.compile(r'[가-힣]+동')
+]
+# (필드, 우선순위) — 우선순위는 기존 _extract_*_from_text 패턴 순서와 동일
+KEYWORD_RANKS = {keyword: ('매물타입', rank) for rank, keyword in enumerate(PROPERTY_TYPES)}
+KEYWORD_RANKS.update({keyword: ('방향', rank) for rank, keyword in enumerate(DIRECTIONS)})
+UNIT_RANKS = {
+    '억원': ('가격', 2), '만원': ('가격', 3),
+    '㎡': ('면적', 1), '평': ('면적', 2), 'py': ('면적', 5),
+    '층': ('층수', 0), 'F': ('층수', 1), 'f': ('층수', 2)
+}
+DECIMAL_AREA_RANKS = {1: 0, 2: 3, 5: 4}  # 소수점 면적(84.5㎡ 등)의 우선순위
+EOK_PRICE_RANKS = {None: 0, '천': 4, '백': 5, '십': 6}
+
+
+def scan_property_text(text):
+    """
+    매물 텍스트에서 타입/가격/면적/층수/방향/주소를 한 번의 스캔으로 추출
+
+    필드마다 기존 패턴 우선순위가 가장 높은 값을 고르며,
+    같은 우선순위면 텍스트에서 먼저 나온 값을 사용한다.
+
+    Args:
+        text (str): 매물 요소 또는 페이지 라인 텍스트
+
+    Returns:
+        dict: 필드명 -> 값 (찾지 못한 필드는 '정보 없음')
+    """
+    best = {}
+
+    def offer(field, rank, value):
+        current = best.get(field)
+        if current is None or rank < current[0]:
+            best[field] = (rank, value)
+
+    for match in TEXT_TOKEN_RE.finditer(text):
+        word = match.group('word')
+        if word is not None:
+            for keyword in KEYWORD_RE.findall(word):
+                field, rank = KEYWORD_RANKS[keyword]
+                offer(field, rank, keyword)
+            if '동' in word or '구' in word:
+                for rank, address_re in enumerate(ADDRESS_RES):
+                    address_match = address_re.search(word)
+                    if address_match:
+                        offer('주소', rank, address_match.group(0))
+                        break
+            continue
+
+        unit = match.group('unit')
+        if unit is None:
+            continue
+        number = match.group('num')
+        # 기존 패턴은 단위 바로 앞의 숫자만 잡으므로('3.5억원' -> '5억원') 마지막 구분자에서 자른다.
+        # 구분자가 패턴에 포함된 경우('1,200만원', '84.5㎡')만 앞 숫자 묶음까지 붙인다.
+        cut = max(number.rfind(','), number.rfind('.'))
+        last = number[cut + 1:]
+        separator = number[cut] if cut >= 0 else ''
+        if separator:
+            with_separator = number[max(number.rfind(',', 0, cut), number.rfind('.', 0, cut)) + 1:] + unit
+
+        if unit[0] == '억' and unit != '억원':
+            offer('가격', EOK_PRICE_RANKS[match.group('sub')], last + unit)
+            continue
+
+        field, rank = UNIT_RANKS[unit]
+        if field == '층수':
+            offer(field, rank, last + '층')
+            continue
+        if unit == '만원' and separator == ',':
+            offer(field, 1, with_separator)
+        elif field == '면적' and separator == '.':
+            offer(field, DECIMAL_AREA_RANKS[rank], with_separator)
+        else:
+            offer(field, rank, last + unit)
+
+    return {
+        field: best[field][1] if field in best else NO_INFO
+        for field in ('매물타입', '가격', '면적', '층수', '방향', '주소')
+    }
+
+
+def write_json_atomic(path, data, indent=None):
+    """
+    JSON 파일을 원자적으로 교체 저장
+
+    같은 폴더에 프로세스/스레드마다 고유한 임시 파일을 만들어 쓴 뒤 os.replace 하므로
+    여러 워커가 같은 파일을 동시에 저장해도 임시 파일이 섞이지 않는다.
+    """
+    directory = os.path.dirname(os.path.abspath(path))
+    with tempfile.NamedTemporaryFile('w', encoding='utf-8', dir=directory,
+                                     prefix=os.path.basename(path) + '.', suffix='.tmp',
+                                     delete=False) as f:
+        temp_path = f.name
+        try:
+            json.dump(data, f, ensure_ascii=False, indent=indent)
+        except BaseException:
+            f.close()
+            os.remove(temp_path)
+            raise
+    try:
+        os.replace(temp_path, path)
+    except OSError:
+        os.remove(temp_path)
+        raise
+
+
+def resolve_driver_path(refresh=False):
+    """
+    chromedriver 실행 파일 경로 반환 (오프라인 캐시 우선)
+
+    환경변수 CHROMEDRIVER_PATH -> 캐시 파일 -> ChromeDriverManager().install() 순으로 찾고,
+    설치한 경로는 DRIVER_CACHE_PATH 에 기록한다.
+
+    Args:
+        refresh (bool): 캐시를 무시하고 다시 설치할지 여부
+    """
+    env_path = os.environ.get("CHROMEDRIVER_PATH")
+    if env_path and os.path.exists(env_path):
+        return env_path
+
+    if not refresh and os.path.exists(DRIVER_CACHE_PATH):
+        try:
+            with open(DRIVER_CACHE_PATH, 'r', encoding='utf-8') as f:
+                cached_path = json.load(f).get('path')
+            if cached_path and os.path.exists(cached_path):
+                return cached_path
+        except (OSError, ValueError):
+            pass
+
+    driver_path = ChromeDriverManager().install()
+    try:
+        os.makedirs(os.path.dirname(DRIVER_CACHE_PATH), exist_ok=True)
+        with open(DRIVER_CACHE_PATH, 'w', encoding='utf-8') as f:
+            json.dump({'path': driver_path, 'installed_at': time.strftime('%Y-%m-%d %H:%M:%S')}, f)
+    except OSError as e:
+        logger.warning(f"드라이버 경로 캐시 저장 실패(무시): {e}")
+    return driver_path
+
+
+class SelectorCache:
+    """
+    URL 패턴별로 마지막에 성공한 선택자를 기억하는 디스크 캐시
+
+    URL 패턴은 호스트 + 숫자를 '*'로 바꾼 경로 (예: fin.land.naver.com/complexes/*)
+    이므로 같은 형태의 단지/지역 페이지끼리 선택자를 공유한다.
+    """
+
+    def __init__(self, path="naver_selector_cache.json"):
+        self.path = path
+        self.entries = {}
+        if path and os.path.exists(path):
+            try:
+                with open(path, 'r', encoding='utf-8') as f:
+                    self.entries = json.load(f)
+            except (OSError, ValueError) as e:
+                logger.warning(f"선택자 캐시 로드 실패(무시): {e}")
+
+    @staticmethod
+    def url_pattern(url):
+        """캐시 키로 쓸 URL 패턴"""
+        parsed = urlparse(url or '')
+        return parsed.netloc + re.sub(r'\d+', '*', parsed.path)
+
+    def get(self, kind, url):
+        """URL 패턴에 캐시된 선택자 (없으면 None)"""
+        return self.entries.get(kind, {}).get(self.url_pattern(url))
+
+    def ordered(self, kind, url, selectors):
+        """캐시된 선택자를 맨 앞에 둔 탐색 순서 반환"""
+        cached = self.get(kind, url)
+        if cached is None:
+            return list(selectors)
+        return [cached] + [selector for selector in selectors if selector != cached]
+
+    def remember(self, kind, url, selector):
+        """
+        성공한 선택자를 기록 (바뀐 경우에만 디스크에 저장)
+
+        저장 직전에 디스크의 캐시를 다시 읽어 합치므로, 같은 파일을 쓰는
+        다른 워커가 먼저 기록한 패턴을 지우지 않는다 (동시에 저장하면 마지막 저장이 이긴다).
+        """
+        pattern = self.url_pattern(url)
+        if self.entries.get(kind, {}).get(pattern) == selector:
+            return
+        if self.path and os.path.exists(self.path):
+            try:
+                with open(self.path, 'r', encoding='utf-8') as f:
+                    for disk_kind, disk_bucket in json.load(f).items():
+                        self.entries.setdefault(disk_kind, {}).update(disk_bucket)
+            except (OSError, ValueError):
+                pass
+        self.entries.setdefault(kind, {})[pattern] = selector
+        if not self.path:
+            return
+        try:
+            write_json_atomic(self.path, self.entries, indent=2)
+        except OSError as e:
+            logger.warning(f"선택자 캐시 저장 실패(무시): {e}")
+
+
+class CrawlJournal:
+    """
+    재개 가능한 크롤링 저널
+
+    페이지마다 추출한 매물을 즉시 JSONL로 추가 기록하고(<path>.jsonl),
+    시작 URL별 페이지 커서를 상태 파일(<path>.state.json)에 남긴다.
+    커서는 다음 페이지로 이동한 뒤에 기록하며, 다음에 처리할 페이지 인덱스와
+    그 페이지로 돌아가는 방법(열 URL + 그 뒤로 눌러야 할 '다음' 횟수)을 담는다.
+    URL이 바뀌지 않는 SPA/스크롤 페이지도 클릭 횟수로 같은 페이지에 다시 도달할 수 있다.
+    resume=True 이면 기존 기록을 읽어 이미 수집한 매물(내용 해시)을 건너뛴다.
+    resume 없이 기록이 남은 저널을 열면, 실수로 지우지 않도록 fresh=True 일 때만 새로 시작한다.
+    """
+
+    def __init__(self, path="naver_land_crawl_journal", resume=False, fresh=False):
+        self.records_path = f"{path}.jsonl"
+        self.state_path = f"{path}.state.json"
+        self.seen_hashes = set()
+        self.state = {}
+
+        if resume:
+            self._load()
+        else:
+            if not fresh and os.path.exists(self.records_path) and os.path.getsize(self.records_path) > 0:
+                raise FileExistsError(
+                    f"기존 저널에 수집 기록이 있습니다: {self.records_path} "
+                    f"(이어서 수집하려면 --resume, 지우고 새로 시작하려면 --fresh)"
+                )
+            # 새 저널 시작
+            open(self.records_path, 'w', encoding='utf-8').close()
+            self._save_state()
+
+    @staticmethod
+    def content_hash(property_info):
+        """매물 링크 + 텍스트 기반 내용 해시"""
+        key = f"{property_info.get('링크', '')}|{property_info.get('전체텍스트', '')}"
+        return hashlib.sha1(key.encode('utf-8')).hexdigest()
+
+    def resume_point(self, url):
+        """
+        시작 URL의 재개 지점 반환
+
+        Returns:
+            tuple: (다음에 처리할 페이지 인덱스 또는 끝까지 수집했으면 None,
+                    먼저 열 URL, 연 뒤에 눌러야 할 '다음' 횟수)
+        """
+        entry = self.state.get(url)
+        if not entry or 'next_page' not in entry:
+            return 0, url, 0
+        if entry.get('finished'):
+            return None, url, 0
+        return entry['next_page'], entry['replay_url'], entry['replay_clicks']
+
+    def record_page(self, url, page, properties):
+        """
+        페이지 결과를 기록하고 새로 수집된 매물만 반환
+
+        커서는 옮기지 않는다 (다음 페이지 이동 전에 중단되면 이 페이지부터 다시 처리).
+
+        Args:
+            url (str): 작업 시작 URL (상태 키)
+            page (int): 완료한 페이지 인덱스(0부터)
+            properties (list): 페이지에서 추출한 매물
+        """
+        new_properties = []
+        with open(self.records_path, 'a', encoding='utf-8') as f:
+            for property_info in properties:
+                content_hash = self.content_hash(property_info)
+                if content_hash in self.seen_hashes:
+                    continue
+                self.seen_hashes.add(content_hash)
+                property_info['내용해시'] = content_hash
+                f.write(json.dumps(property_info, ensure_ascii=False) + "\n")
+                new_properties.append(property_info)
+            f.flush()
+            os.fsync(f.fileno())
+        return new_properties
+
+    def advance(self, url, next_page, page_url, next_url):
+        """
+        다음 페이지로 이동한 뒤 커서를 기록
+
+        Args:
+            url (str): 작업 시작 URL (상태 키)
+            next_page (int): 이동해 온 페이지 인덱스 (다음에 처리할 페이지)
+            page_url (str): 이동 전(완료한 페이지) 브라우저 URL
+            next_url (str): 이동 후 브라우저 URL
+        """
+        entry = self.state.get(url) or {'replay_url': url, 'replay_clicks': 0}
+        if next_url and next_url != page_url:
+            # URL로 페이지가 구분되면 그 URL을 바로 연다
+            replay_url, replay_clicks = next_url, 0
+        else:
+            # URL이 그대로면 마지막으로 구분되던 URL에서 '다음'을 한 번 더 눌러야 한다
+            replay_url, replay_clicks = entry['replay_url'], entry['replay_clicks'] + 1
+        self.state[url] = {
+            'next_page': next_page,
+            'replay_url': replay_url,
+            'replay_clicks': replay_clicks,
+            'updated_at': time.strftime('%Y-%m-%d %H:%M:%S')
+        }
+        self._save_state()
+
+    def finish(self, url, page):
+        """마지막 페이지(page)까지 수집해 더 넘길 페이지가 없음을 기록"""
+        self.state[url] = {
+            'next_page': page + 1,
+            'finished': True,
+            'updated_at': time.strftime('%Y-%m-%d %H:%M:%S')
+        }
+        self._save_state()
+
+    def records(self):
+        """저널에 기록된 전체 매물"""
+        if not os.path.exists(self.records_path):
+            return []
+        with open(self.records_path, 'r', encoding='utf-8') as f:
+            return [json.loads(line) for line in f if line.strip()]
+
+    def _load(self):
+        for property_info in self.records():
+            self.seen_hashes.add(property_info.get('내용해시') or self.content_hash(property_info))
+        if os.path.exists(self.state_path):
+            with open(self.state_path, 'r', encoding='utf-8') as f:
+                self.state = json.load(f)
+        logger.info(f"저널 재개: 기존 매물 {len(self.seen_hashes)}개, 작업 {len(self.state)}개")
+
+    def _save_state(self):
+        write_json_atomic(self.state_path, self.state, indent=2)
+
+
+class ListingIndex:
+    """
+    실행 간 매물 중복 제거 인덱스 (SQLite)
+
+    매물 링크(없으면 정규화 텍스트 해시)를 키로, 정규화 텍스트 해시를 내용 지문으로 저장한다.
+    이미 본 매물이 내용까지 같으면 건너뛰고, 새 매물/바뀐 매물만 통과시킨다.
+    observe()는 판정만 하고 본 매물을 대기 목록에 모으며, 결과가 저널/싱크에
+    저장된 뒤 commit()해야 인덱스에 기록된다 (저장 전에 죽으면 다음 실행에서 다시 수집).
+    """
+
+    def __init__(self, db_path="naver_land_listings.db"):
+        self.db_path = db_path
+        self.pending = {}  # listingKey -> (contentHash, 관측 시각)
+        self.conn = sqlite3.connect(db_path, timeout=30)
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS Listings (
+                listingKey TEXT PRIMARY KEY,
+                contentHash TEXT NOT NULL,
+                firstSeen TEXT NOT NULL,
+                lastSeen TEXT NOT NULL,
+                timesSeen INTEGER NOT NULL DEFAULT 1
+            )
+            """
+        )
+        self.conn.commit()
+
+    @staticmethod
+    def text_hash(text):
+        """공백을 정규화한 텍스트의 해시"""
+        normalized = re.sub(r'\s+', ' ', text or '').strip().lower()
+        return hashlib.sha1(normalized.encode('utf-8')).hexdigest()
+
+    def observe(self, link, text):
+        """
+        매물 상태를 판정하고 대기 목록에 추가 (commit() 전까지 인덱스에 쓰지 않음)
+
+        Args:
+            link (str): 매물 링크 ('정보 없음'/None 이면 텍스트 해시를 키로 사용)
+            text (str): 매물 전체 텍스트
+
+        Returns:
+            str | None: '신규', '변경' 또는 변경 없음이면 None
+        """
+        content_hash = self.text_hash(text)
+        key = link if link and link != NO_INFO else f"text:{content_hash}"
+
+        if key in self.pending:
+            previous = self.pending[key][0]
+        else:
+            row = self.conn.execute(
+                "SELECT contentHash FROM Listings WHERE listingKey = ?", (key,)
+            ).fetchone()
+            previous = row[0] if row else None
+        self.pending[key] = (content_hash, time.strftime('%Y-%m-%d %H:%M:%S'))
+
+        if previous is None:
+            return '신규'
+        return '변경' if previous != content_hash else None
+
+    def commit(self):
+        """대기 중인 매물을 본 매물로 기록"""
+        if self.pending:
+            self.conn.executemany(
+                """
+                INSERT INTO Listings (listingKey, contentHash, firstSeen, lastSeen) VALUES (?, ?, ?, ?)
+                ON CONFLICT(listingKey) DO UPDATE SET
+                    contentHash = excluded.contentHash,
+                    lastSeen = excluded.lastSeen,
+                    timesSeen = timesSeen + 1
+                """,
+                [(key, content_hash, seen_at, seen_at) for key, (content_hash, seen_at) in self.pending.items()],
+            )
+            self.pending = {}
+        self.conn.commit()
+
+    def discard(self):
+        """저장하지 못한 대기 매물을 버림"""
+        self.pending = {}
+
+    def close(self):
+        """인덱스를 닫음 (commit()하지 않은 대기 매물은 기록하지 않는다)"""
+        if self.pending:
+            logger.info(f"저장되지 않은 매물 {len(self.pending)}개는 중복 제거 인덱스에 기록하지 않습니다.")
+        self.conn.close()
+
+
+class RecordSink(ABC):
+    """
+    매물 레코드 스트리밍 출력의 기반 클래스
+
+    write()로 받은 레코드를 버퍼에 모았다가 batch_size 개가 쌓이거나
+    flush_interval 초가 지나면 _write_batch()로 내보낸다.
+    """
+
+    def __init__(self, path, flush_interval=5.0, batch_size=500):
+        self.path = path
+        self.flush_interval = flush_interval
+        self.batch_size = batch_size
+        self.count = 0
+        self._buffer = []
+        self._last_flush = time.monotonic()
+
+    def write(self, record):
+        self._buffer.append(record)
+        if len(self._buffer) >= self.batch_size or time.monotonic() - self._last_flush >= self.flush_interval:
+            self.flush()
+
+    def write_many(self, records):
+        for record in records:
+            self.write(record)
+
+    def flush(self):
+        if self._buffer:
+            self._write_batch(self._buffer)
+            self.count += len(self._buffer)
+            self._buffer = []
+        self._last_flush = time.monotonic()
+
+    def close(self):
+        self.flush()
+        self._close()
+        logger.info(f"{self.count}개 레코드가 {self.path}에 저장되었습니다.")
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    @abstractmethod
+    def _write_batch(self, records):
+        """버퍼에 모인 레코드 묶음을 출력에 기록 (하위 클래스 구현)"""
+
+    def _close(self):
+        pass
+
+
+class JsonlSink(RecordSink):
+    """한 줄에 레코드 하나씩 JSONL (compress=True면 gzip) 로 기록"""
+
+    def __init__(self, path, compress=False, flush_interval=5.0, batch_size=500):
+        super().__init__(path, flush_interval, batch_size)
+        if compress:
+            self.file = gzip.open(path, 'at', encoding='utf-8')
+        else:
+            self.file = open(path, 'a', encoding='utf-8')
+
+    def _write_batch(self, records):
+        self.file.writelines(json.dumps(record, ensure_ascii=False) + "\n" for record in records)
+        self.file.flush()
+
+    def _close(self):
+        self.file.close()
+
+
+class ColumnarSink(RecordSink):
+    """
+    Parquet/Feather 컬럼형 기록 (pyarrow 필요)
+
+    표준 매물 필드는 문자열 컬럼으로, 가격/면적은 숫자 컬럼('가격_원' int64, '면적_㎡' float64)으로
+    함께 기록한다. 표준 필드에 없는 키는 저장하지 않는다.
+    """
+
+    STRING_FIELDS = ['매물타입', '가격', '면적', '층수', '방향', '주소', '링크', '추출방법', '전체텍스트', '수집URL', '내용해시', '수집상태']
+
+    def __init__(self, path, fmt='parquet', flush_interval=5.0, batch_size=5000):
+        if not HAVE_PYARROW:
+            raise RuntimeError("Parquet/Feather 저장에는 pyarrow 설치가 필요합니다.")
+        super().__init__(path, flush_interval, batch_size)
+        self.fmt = fmt
+        self.schema = pa.schema(
+            [('매물번호', pa.int64())]
+            + [(field, pa.string()) for field in self.STRING_FIELDS]
+            + [('가격_원', pa.int64()), ('면적_㎡', pa.float64())]
+        )
+        if fmt == 'parquet':
+            self.writer = pq.ParquetWriter(path, self.schema)
+        else:
+            self.writer = pa.ipc.new_file(path, self.schema)  # Feather v2 = Arrow IPC 파일
+
+    def _write_batch(self, records):
+        columns = {'매물번호': [record.get('매물번호') for record in records]}
+        for field in self.STRING_FIELDS:
+            columns[field] = [record.get(field) for record in records]
+        columns['가격_원'] = pa.Array.from_pandas(normalize_price(columns['가격']), type=pa.int64())
+        columns['면적_㎡'] = pa.Array.from_pandas(normalize_area(columns['면적']), type=pa.float64())
+
+        batch = pa.RecordBatch.from_pydict(columns, schema=self.schema)
+        if self.fmt == 'parquet':
+            self.writer.write_table(pa.Table.from_batches([batch]))
+        else:
+            self.writer.write_batch(batch)
+
+    def _close(self):
+        self.writer.close()
+
+
+SINK_EXTENSIONS = {'jsonl': '.jsonl', 'jsonl.gz': '.jsonl.gz', 'parquet': '.parquet', 'feather': '.feather'}
+
+
+def open_sink(filename, fmt='jsonl', flush_interval=5.0):
+    """
+    출력 형식에 맞는 스트리밍 싱크 생성
+
+    Args:
+        filename (str): 확장자를 제외한 파일 경로
+        fmt (str): 'jsonl', 'jsonl.gz', 'parquet', 'feather'
+        flush_interval (float): 버퍼를 디스크로 내보낼 최대 간격(초)
+    """
+    if fmt not in SINK_EXTENSIONS:
+        raise ValueError(f"지원하지 않는 출력 형식: {fmt}")
+    path = filename + SINK_EXTENSIONS[fmt]
+    if fmt in ('jsonl', 'jsonl.gz'):
+        return JsonlSink(path, compress=(fmt == 'jsonl.gz'), flush_interval=flush_interval)
+    return ColumnarSink(path, fmt=fmt, flush_interval=flush_interval)
+
+
+class _PageQuiet:
+    """WebDriverWait 조건: 리소스 수/DOM 변경 카운터가 quiet_period 동안 변하지 않으면 True"""
+
+    def __init__(self, quiet_period=0.5):
+        self.quiet_period = quiet_period
+        self.last_snapshot = None
+        self.since = time.monotonic()
+
+    def __call__(self, driver):
+        snapshot = driver.execute_script(ACTIVITY_SCRIPT)
+        now = time.monotonic()
+        if snapshot != self.last_snapshot:
+            self.last_snapshot = snapshot
+            self.since = now
+            return False
+        return now - self.since >= self.quiet_period
+
 
 class StealthNaverLandCrawler:
-    def __init__(self, headless=False, use_undetected=True):
+    def __init__(self, headless=False, use_undetected=True, adaptive_waits=True, jitter_floor=(0.8, 2.0),
+                 selector_cache_path="naver_selector_cache.json", profile_dir=None, dedup_index_path=None,
+                 api_mode=False):
         """
         네이버 부동산 Stealth 크롤러 초기화
         
         Args:
             headless (bool): 브라우저를 백그라운드에서 실행할지 여부
             use_undetected (bool): undetected-chromedriver 사용 여부
+            adaptive_waits (bool): 고정 sleep 대신 페이지 준비 상태를 감지해 대기할지 여부
+            jitter_floor (tuple): 적응형 대기 시 최소 랜덤 지연 범위(초, Stealth용)
+            selector_cache_path (str): 성공 선택자 캐시 파일 경로 (None이면 메모리에만 유지)
+            profile_dir (str): 재사용할 Chrome user-data-dir (None이면 매번 새 프로필)
+            dedup_index_path (str): 실행 간 중복 제거 인덱스(SQLite) 경로 (None이면 사용 안 함)
+            api_mode (bool): JSON API 모드(fetch_api_listings)용으로 CDP 네트워크 로그를 켤지 여부
         """
+        # 풀 워커가 같은 설정으로 크롤러를 만들 수 있도록 생성자 인자를 그대로 보관
+        self.settings = {
+            'headless': headless,
+            'use_undetected': use_undetected,
+            'adaptive_waits': adaptive_waits,
+            'jitter_floor': jitter_floor,
+            'selector_cache_path': selector_cache_path,
+            'profile_dir': profile_dir,
+            'dedup_index_path': dedup_index_path,
+            'api_mode': api_mode,
+        }
         self.headless = headless
         self.use_undetected = use_undetected
+        self.adaptive_waits = adaptive_waits
+        self.jitter_floor = jitter_floor
+        self.wait_timings = []  # 대기 측정 기록: {'label', 'seconds', 'ready'}
+        self.selector_cache = SelectorCache(selector_cache_path)
+        self.profile_dir = profile_dir
+        self.dedup_index = ListingIndex(dedup_index_path) if dedup_index_path else None
+        self.api_mode = api_mode
         self.driver = None
         self.wait = None
         self.session = requests.Session()
@@ -67,30 +753,24 @@ class StealthNaverLandCrawler:
             'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Edge/120.0.0.0 Safari/537.36'
         ]
         
-    def setup_driver(self):
-        """Chrome 드라이버 설정 (Stealth 모드)"""
+    def setup_driver(self, user_agent=None):
+        """
+        Chrome 드라이버 설정 (Stealth 모드)
+
+        캐시된 chromedriver 로 세션을 만들지 못하면 (Chrome 업데이트로 버전이 어긋난 경우 등)
+        resolve_driver_path(refresh=True) 로 드라이버를 다시 받아 한 번 더 시도한다.
+
+        Args:
+            user_agent (str): 고정할 User-Agent (None이면 풀에서 랜덤 선택)
+        """
+        user_agent = user_agent or random.choice(self.user_agents)
         try:
-            options = Options()
-            if self.headless:
-                options.add_argument("--headless=new")
-
-            options.add_argument("--disable-blink-features=AutomationControlled")
-            options.add_argument("--disable-infobars")
-            options.add_argument("--disable-dev-shm-usage")
-            options.add_argument("--no-sandbox")
-            options.add_argument(f"user-agent={random.choice(self.user_agents)}")
-
-            if self.use_undetected and HAVE_UC:
-                self.driver = uc.Chrome(options=options, service=Service(ChromeDriverManager().install()))
-            else:
-                self.driver = webdriver.Chrome(service=Service(ChromeDriverManager().install()), options=options)
-                try:
-                    self.driver.execute_cdp_cmd(
-                        "Page.addScriptToEvaluateOnNewDocument",
-                        {"source": "Object.defineProperty(navigator, 'webdriver', {get: () => undefined});"}
-                    )
-                except Exception:
-                    pass
+            driver_path = resolve_driver_path()
+            try:
+                self._start_driver(driver_path, user_agent)
+            except Exception as e:
+                logger.warning(f"드라이버 세션 생성 실패, chromedriver 를 다시 받아 재시도합니다: {e}")
+                self._start_driver(resolve_driver_path(refresh=True), user_agent)
 
             self.wait = WebDriverWait(self.driver, 10)
             logger.info("드라이버 설정 완료")
@@ -101,12 +781,147 @@ class StealthNaverLandCrawler:
             logger.error("드라이버 설정에 실패했습니다.")
             # 예외 재전파 대신 False 반환으로 호출자에게 상태를 알린다.
             return False
-    
+
+    def _start_driver(self, driver_path, user_agent):
+        """주어진 chromedriver 로 브라우저 세션을 시작 (옵션은 시도마다 새로 만든다)"""
+        options = Options()
+        if self.headless:
+            options.add_argument("--headless=new")
+
+        options.add_argument("--disable-blink-features=AutomationControlled")
+        options.add_argument("--disable-infobars")
+        options.add_argument("--disable-dev-shm-usage")
+        options.add_argument("--no-sandbox")
+        options.add_argument(f"user-agent={user_agent}")
+        if self.profile_dir:
+            # 쿠키/캐시가 남은 프로필을 재사용해 콜드 스타트를 줄인다
+            options.add_argument(f"--user-data-dir={os.path.abspath(self.profile_dir)}")
+        if self.api_mode:
+            # XHR 엔드포인트 캡처(fetch_api_listings)를 위한 CDP 네트워크 이벤트 로그
+            # (모든 네트워크 이벤트를 쌓으므로 DOM 크롤링에서는 켜지 않는다)
+            options.set_capability("goog:loggingPrefs", {"performance": "ALL"})
+
+        if self.use_undetected and HAVE_UC:
+            self.driver = uc.Chrome(options=options, driver_executable_path=driver_path)
+        else:
+            self.driver = webdriver.Chrome(service=Service(driver_path), options=options)
+            try:
+                self.driver.execute_cdp_cmd(
+                    "Page.addScriptToEvaluateOnNewDocument",
+                    {"source": "Object.defineProperty(navigator, 'webdriver', {get: () => undefined});"}
+                )
+            except Exception:
+                pass
+
+    def ensure_driver(self, user_agent=None):
+        """
+        살아 있는 드라이버가 있으면 재사용하고, 없거나 죽었으면 새로 띄움
+
+        오래 실행되는 프로세스에서 여러 크롤링 작업이 Chrome 하나를 공유할 때 사용한다.
+
+        Returns:
+            bool: 사용할 수 있는 드라이버가 준비되었는지 여부
+        """
+        if self.driver:
+            try:
+                self.driver.current_url  # 세션 상태 확인
+                return True
+            except Exception:
+                logger.warning("기존 드라이버 세션이 끊어졌습니다. 다시 시작합니다.")
+                try:
+                    self.driver.quit()
+                except Exception:
+                    pass
+                self.driver = None
+        return self.setup_driver(user_agent=user_agent)
+
     def random_delay(self, min_seconds=1, max_seconds=4):
         """랜덤 지연으로 차단 방지"""
         delay = random.uniform(min_seconds, max_seconds)
         time.sleep(delay)
         logger.debug(f"랜덤 지연: {delay:.2f}초")
+
+    def settle_delay(self, min_seconds=1, max_seconds=4):
+        """
+        콘텐츠 로딩을 기다리는 지연 (적응형 모드에서는 jitter_floor 범위로 줄임)
+
+        요청 간격을 벌리는 random_delay 와 달리 준비 대기를 대신하는 자리에만 쓴다.
+        """
+        if self.adaptive_waits:
+            min_seconds, max_seconds = self.jitter_floor
+        self.random_delay(min_seconds, max_seconds)
+
+    def listing_ready_selectors(self):
+        """현재 URL 패턴에서 마지막으로 성공한 목록 선택자, 없으면 목록 전용 선택자 목록"""
+        cached = self.selector_cache.get('property', self.driver.current_url)
+        return [cached] if cached else LISTING_READY_SELECTORS
+
+    def wait_for_page_ready(self, label, selectors=None, timeout=15, quiet_period=0.5, fallback=(8, 12)):
+        """
+        페이지 준비 상태까지 이벤트 기반으로 대기
+
+        document.readyState 완료 -> (선택자가 있으면) 목록 요소 등장 ->
+        네트워크/DOM 변경이 quiet_period 동안 멈출 때까지 기다린 뒤,
+        jitter_floor 보다 빨리 끝났으면 남은 시간만큼 랜덤 지연한다.
+
+        Args:
+            label (str): 측정 기록에 남길 대기 이름
+            selectors (list): 등장을 기다릴 CSS 선택자 목록 (하나라도 있으면 통과)
+            timeout (int): 모든 단계를 합친 최대 대기 시간(초)
+            quiet_period (float): 네트워크/DOM 정지로 간주할 시간(초)
+            fallback (tuple): adaptive_waits=False 일 때의 고정 대기 범위(초)
+
+        Returns:
+            bool: 타임아웃 없이 준비 상태에 도달했는지 여부
+        """
+        if not self.adaptive_waits:
+            # 기존 고정 대기 방식
+            start = time.monotonic()
+            time.sleep(random.randint(*fallback))
+            self.wait_timings.append({'label': label, 'seconds': time.monotonic() - start, 'ready': True})
+            return True
+
+        start = time.monotonic()
+        deadline = start + timeout
+        floor = random.uniform(*self.jitter_floor)
+        ready = True
+
+        def wait_until(condition):
+            # 단계마다 남은 시간만 기다려 전체 대기가 timeout 을 넘지 않게 한다
+            remaining = max(deadline - time.monotonic(), 0)
+            WebDriverWait(self.driver, remaining, poll_frequency=0.1).until(condition)
+
+        try:
+            wait_until(lambda driver: driver.execute_script("return document.readyState") == "complete")
+            if selectors:
+                wait_until(EC.presence_of_element_located((By.CSS_SELECTOR, ", ".join(selectors))))
+            wait_until(_PageQuiet(quiet_period))
+        except Exception:
+            ready = False
+            logger.warning(f"페이지 준비 대기 타임아웃: {label}")
+
+        elapsed = time.monotonic() - start
+        if elapsed < floor:
+            time.sleep(floor - elapsed)
+
+        seconds = time.monotonic() - start
+        self.wait_timings.append({'label': label, 'seconds': seconds, 'ready': ready})
+        logger.debug(f"페이지 준비 대기 [{label}]: {seconds:.2f}초 (준비={ready})")
+        return ready
+
+    def wait_timing_summary(self):
+        """대기 이름별 횟수/평균/최대 대기 시간 요약 (튜닝용)"""
+        summary = {}
+        for timing in self.wait_timings:
+            stat = summary.setdefault(timing['label'], {'count': 0, 'total': 0.0, 'max': 0.0, 'timeouts': 0})
+            stat['count'] += 1
+            stat['total'] += timing['seconds']
+            stat['max'] = max(stat['max'], timing['seconds'])
+            if not timing['ready']:
+                stat['timeouts'] += 1
+        for stat in summary.values():
+            stat['avg'] = stat['total'] / stat['count']
+        return summary
     
     def human_like_behavior(self):
         """사람처럼 행동하기 — 요소가 뷰포트 밖일 때 예외 처리 포함"""
@@ -166,18 +981,32 @@ class StealthNaverLandCrawler:
         """Cloudflare 우회 시도"""
         try:
             # Cloudflare 체크 페이지 감지
-            if "cloudflare" in self.driver.page_source.lower() or "checking your browser" in self.driver.page_source.lower():
+            if self._is_cloudflare_page(self.driver):
                 logger.info("Cloudflare 감지됨. 우회 시도 중...")
                 
-                # 대기 시간 증가
-                time.sleep(random.randint(10, 20))
+                # 대기 시간 증가 (적응형 모드에서는 검사 페이지가 사라지는 즉시 진행)
+                if self.adaptive_waits:
+                    start = time.monotonic()
+                    try:
+                        WebDriverWait(self.driver, 20, poll_frequency=0.5).until(
+                            lambda driver: not self._is_cloudflare_page(driver)
+                        )
+                    except Exception:
+                        pass
+                    self.wait_timings.append({
+                        'label': 'Cloudflare검사',
+                        'seconds': time.monotonic() - start,
+                        'ready': not self._is_cloudflare_page(self.driver)
+                    })
+                else:
+                    time.sleep(random.randint(10, 20))
                 
                 # 사람처럼 행동
                 self.human_like_behavior()
                 
                 # 페이지 새로고침
                 self.driver.refresh()
-                time.sleep(random.randint(5, 10))
+                self.wait_for_page_ready('Cloudflare새로고침', fallback=(5, 10))
                 
                 return True
             return False
@@ -185,27 +1014,52 @@ class StealthNaverLandCrawler:
         except Exception as e:
             logger.warning(f"Cloudflare 우회 중 오류: {e}")
             return False
+
+    @staticmethod
+    def _is_cloudflare_page(driver):
+        """Cloudflare 검사 페이지 여부"""
+        page_source = driver.page_source.lower()
+        return "cloudflare" in page_source or "checking your browser" in page_source
     
-    def crawl_property_listings_stealth(self, url, max_pages=5):
+    def crawl_property_listings_stealth(self, url, max_pages=5, journal=None, sink=None):
         """
         Stealth 모드로 부동산 매물 목록 크롤링
         
         Args:
             url (str): 크롤링할 URL
             max_pages (int): 최대 페이지 수
+            journal (CrawlJournal): 페이지 단위 체크포인트 저널 (있으면 마지막 완료 페이지부터 재개)
+            sink (RecordSink): 페이지마다 매물을 바로 내보낼 출력 싱크
             
         Returns:
-            list: 매물 정보 리스트
+            list: 매물 정보 리스트 (저널 사용 시 이번 실행에서 새로 수집한 매물)
         """
         try:
             logger.info(f"Stealth 모드 매물 목록 크롤링 시작: {url}")
+
+            # 이미 떠 있는 브라우저가 있으면 재사용
+            if not self.ensure_driver():
+                return []
+            if self.dedup_index:
+                self.dedup_index.discard()  # 이전 작업에서 저장되지 않고 남은 대기 매물
             
+            # 저널이 있으면 기록된 페이지 커서부터 재개
+            start_page, start_url, replay_clicks = journal.resume_point(url) if journal else (0, url, 0)
+            if start_page is None:
+                logger.info(f"마지막 페이지까지 수집된 작업입니다: {url}")
+                return []
+            if start_page >= max_pages:
+                logger.info(f"이미 {max_pages}페이지까지 수집된 작업입니다: {url}")
+                return []
+            if start_page:
+                logger.info(f"페이지 {start_page + 1}부터 재개: {start_url} (다음 {replay_clicks}회)")
+
             # 초기 페이지 로드
             self.random_delay(3, 6)
-            self.driver.get(url)
+            self.driver.get(start_url)
             
-            # 페이지 로딩 대기
-            time.sleep(random.randint(8, 12))
+            # 페이지 로딩 대기 (목록 요소 등장 / 네트워크·DOM 정지 감지)
+            self.wait_for_page_ready('초기로드', self.listing_ready_selectors())
             
             # Cloudflare 우회 시도
             self.bypass_cloudflare()
@@ -220,14 +1074,30 @@ class StealthNaverLandCrawler:
             
             # 사람처럼 행동
             self.human_like_behavior()
+
+            # URL이 바뀌지 않는 페이지는 '다음'을 눌러 커서 위치까지 이동
+            for _ in range(replay_clicks):
+                if not self._go_to_next_page_stealth():
+                    logger.warning(f"재개 위치(페이지 {start_page + 1})로 이동하지 못했습니다: {url}")
+                    return []
             
             all_properties = []
             
-            for page in range(max_pages):
+            for page in range(start_page, max_pages):
                 logger.info(f"페이지 {page + 1}/{max_pages} 처리 중...")
                 
                 # 현재 페이지의 매물 정보 추출
                 page_properties = self._extract_properties_stealth()
+                page_url = self.driver.current_url
+                if journal:
+                    page_properties = journal.record_page(url, page, page_properties)
+                if sink:
+                    sink.write_many(page_properties)
+                if self.dedup_index and (journal or sink):
+                    # 저널/싱크에 기록된 뒤에만 본 매물로 확정한다
+                    if sink:
+                        sink.flush()
+                    self.dedup_index.commit()
                 all_properties.extend(page_properties)
                 
                 logger.info(f"페이지 {page + 1}에서 {len(page_properties)}개 매물 발견")
@@ -235,21 +1105,99 @@ class StealthNaverLandCrawler:
                 # 사람처럼 행동
                 self.human_like_behavior()
                 
-                # 다음 페이지로 이동 시도
+                # 다음 페이지로 이동 시도 (이동한 뒤에 커서를 기록)
                 if not self._go_to_next_page_stealth():
                     logger.info("더 이상 페이지가 없습니다.")
+                    if journal:
+                        journal.finish(url, page)
                     break
+                if journal:
+                    journal.advance(url, page + 1, page_url, self.driver.current_url)
                 
                 # 페이지 간 지연 (더 길게)
                 self.random_delay(5, 10)
             
+            if self.dedup_index and not (journal or sink):
+                # 반환 목록이 유일한 결과이므로 호출자에게 넘기기 직전에 확정한다
+                self.dedup_index.commit()
+
             logger.info(f"총 {len(all_properties)}개의 매물을 수집했습니다.")
+            for label, stat in self.wait_timing_summary().items():
+                logger.info(f"대기 통계 [{label}]: {stat['count']}회, 평균 {stat['avg']:.2f}초, 최대 {stat['max']:.2f}초, 타임아웃 {stat['timeouts']}회")
             return all_properties
             
         except Exception as e:
             logger.error(f"Stealth 매물 목록 크롤링 중 오류 발생: {e}")
             return []
     
+    def crawl_urls_pool(self, urls, num_workers=None, max_pages=5):
+        """
+        여러 단지/지역 URL을 워커 프로세스 풀로 병렬 크롤링
+
+        워커마다 독립된 드라이버와 고유 User-Agent를 사용하며,
+        페이지 간 지연은 워커 내부에서 그대로 유지된다.
+        워커 크롤러는 이 크롤러의 생성자 설정(대기 방식, 선택자 캐시, 중복 제거 인덱스 등)을 그대로 물려받는다.
+
+        Args:
+            urls (list): 크롤링할 URL 목록 (큐로 분배됨)
+            num_workers (int): 워커(드라이버) 수 (None이면 CPU 코어 수)
+            max_pages (int): URL별 최대 페이지 수
+
+        Yields:
+            dict: 매물 정보 ('수집URL' 키에 출처 URL 포함)
+        """
+        urls = list(urls)
+        if not urls:
+            return
+
+        num_workers = max(1, min(num_workers or os.cpu_count() or 1, len(urls)))
+        logger.info(f"크롤링 풀 시작: URL {len(urls)}개, 워커 {num_workers}개")
+
+        url_queue = mp.Queue()
+        result_queue = mp.Queue()
+        for url in urls:
+            url_queue.put(url)
+        for _ in range(num_workers):
+            url_queue.put(None)  # 워커 종료 신호
+
+        workers = []
+        for worker_id in range(num_workers):
+            user_agent = self.user_agents[worker_id % len(self.user_agents)]
+            process = mp.Process(
+                target=_pool_worker,
+                args=(worker_id, user_agent, self.settings, max_pages, url_queue, result_queue),
+                daemon=True,
+            )
+            process.start()
+            workers.append(process)
+
+        finished = 0
+        try:
+            while finished < num_workers:
+                try:
+                    kind, key, payload = result_queue.get(timeout=5)
+                except queue.Empty:
+                    # 종료 신호 없이 죽은 워커만 남았으면 중단
+                    if not any(p.is_alive() for p in workers):
+                        logger.warning("모든 워커가 종료되어 풀 수집을 중단합니다.")
+                        break
+                    continue
+
+                if kind == 'done':
+                    finished += 1
+                    continue
+
+                logger.info(f"풀 결과 수신: {key} ({len(payload)}개 매물)")
+                for property_info in payload:
+                    property_info['수집URL'] = key
+                    yield property_info
+        finally:
+            for process in workers:
+                process.join(timeout=30)
+                if process.is_alive():
+                    process.terminate()
+            logger.info("크롤링 풀 종료")
+
     def _extract_properties_stealth(self):
         """Stealth 모드로 현재 페이지에서 매물 정보 추출"""
         properties = []
@@ -259,36 +1207,18 @@ class StealthNaverLandCrawler:
             self.human_like_behavior()
             
             # 페이지 소스 분석
+            current_url = self.driver.current_url
             page_source = self.driver.page_source
-            soup = BeautifulSoup(page_source, 'html.parser')
-            
-            # 매물 관련 요소들 찾기 (더 많은 선택자)
-            property_selectors = [
-                ".item_list .item",
-                ".list .item", 
-                ".item",
-                "[class*='item']",
-                ".card",
-                "[class*='card']",
-                "li[class*='item']",
-                "div[class*='property']",
-                "tr[class*='item']",
-                ".complex_item",
-                "[data-testid*='item']",
-                ".article_item",
-                ".property_item",
-                ".listing_item",
-                "[class*='listing']",
-                "[class*='article']",
-                "[class*='property']"
-            ]
+            soup = make_soup(page_source, current_url)
             
+            # 매물 관련 요소들 찾기 (지난번 성공 선택자부터 시도)
             property_elements = []
-            for selector in property_selectors:
+            for selector in self.selector_cache.ordered('property', current_url, PROPERTY_SELECTORS):
                 try:
                     elements = soup.select(selector)
                     if elements and len(elements) > 1:
                         property_elements = elements
+                        self.selector_cache.remember('property', current_url, selector)
                         logger.info(f"매물 요소 발견: {selector} ({len(elements)}개)")
                         break
                 except:
@@ -307,6 +1237,9 @@ class StealthNaverLandCrawler:
                 except Exception as e:
                     logger.warning(f"매물 {i+1} 정보 추출 중 오류: {e}")
                     continue
+
+            if self.dedup_index:
+                logger.info(f"신규/변경 매물 {len(properties)}개 (변경 없는 매물은 건너뜀)")
             
             return properties
             
@@ -321,26 +1254,6 @@ class StealthNaverLandCrawler:
         try:
             all_text = soup.get_text()
             
-            # 더 정교한 패턴 매칭
-            price_patterns = [
-                r'(\d+억\s*\d*만원)',
-                r'(\d+,\d+만원)',
-                r'(\d+억원)',
-                r'(\d+만원)',
-                r'(\d+억\s*\d*천만원)',
-                r'(\d+억\s*\d*백만원)',
-                r'(\d+억\s*\d*십만원)'
-            ]
-            
-            area_patterns = [
-                r'(\d+\.\d+㎡)',
-                r'(\d+㎡)',
-                r'(\d+평)',
-                r'(\d+\.\d+평)',
-                r'(\d+\.\d+py)',
-                r'(\d+py)'
-            ]
-            
             # 텍스트를 라인별로 분석
             lines = all_text.split('\n')
             for i, line in enumerate(lines):
@@ -349,16 +1262,17 @@ class StealthNaverLandCrawler:
                     continue
                 
                 # 가격과 면적이 모두 있는지 확인
-                has_price = any(re.search(pattern, line) for pattern in price_patterns)
-                has_area = any(re.search(pattern, line) for pattern in area_patterns)
+                fields = scan_property_text(line)
+                has_price = fields['가격'] != NO_INFO
+                has_area = fields['면적'] != NO_INFO
                 
                 if has_price or has_area:
                     property_info = {
                         '매물번호': len(properties) + 1,
                         '전체텍스트': line[:200],
-                        '가격': self._extract_price_from_text(line),
-                        '면적': self._extract_area_from_text(line),
-                        '매물타입': self._extract_type_from_text(line),
+                        '가격': fields['가격'],
+                        '면적': fields['면적'],
+                        '매물타입': fields['매물타입'],
                         '추출방법': 'Stealth텍스트분석'
                     }
                     properties.append(property_info)
@@ -400,13 +1314,15 @@ class StealthNaverLandCrawler:
             except:
                 pass
             
-            # 각종 정보 추출
-            property_info['매물타입'] = self._extract_type_from_text(text)
-            property_info['가격'] = self._extract_price_from_text(text)
-            property_info['면적'] = self._extract_area_from_text(text)
-            property_info['층수'] = self._extract_floor_from_text(text)
-            property_info['방향'] = self._extract_direction_from_text(text)
-            property_info['주소'] = self._extract_address_from_text(text)
+            # 이전 실행에서 본 그대로인 매물은 파싱/저장하지 않음
+            if self.dedup_index:
+                status = self.dedup_index.observe(property_info['링크'], text)
+                if status is None:
+                    return None
+                property_info['수집상태'] = status
+            
+            # 각종 정보 추출 (단일 패스)
+            property_info.update(scan_property_text(text))
             
             return property_info
             
@@ -501,34 +1417,82 @@ class StealthNaverLandCrawler:
         
         return "정보 없음"
     
+    def benchmark_text_extraction(self, pattern="naver_land_stealth_result_*.json", repeat=1000):
+        """
+        저장된 결과 JSON의 '전체텍스트'로 필드 추출 속도 비교
+
+        기존 필드별 헬퍼(_extract_*_from_text) 6회 호출과 scan_property_text 단일 패스를 비교한다.
+
+        Args:
+            pattern (str): 결과 JSON 파일 glob 패턴
+            repeat (int): 텍스트 전체 반복 횟수
+
+        Returns:
+            dict: 텍스트 수, 각 방식 소요 시간(초), 속도 향상 배수, 결과가 다른 텍스트 수
+        """
+        texts = []
+        for path in sorted(glob.glob(pattern)):
+            with open(path, 'r', encoding='utf-8') as f:
+                texts.extend(item['전체텍스트'] for item in json.load(f) if item.get('전체텍스트'))
+        if not texts:
+            logger.warning(f"벤치마크할 텍스트가 없습니다: {pattern}")
+            return {}
+
+        def legacy(text):
+            return {
+                '매물타입': self._extract_type_from_text(text),
+                '가격': self._extract_price_from_text(text),
+                '면적': self._extract_area_from_text(text),
+                '층수': self._extract_floor_from_text(text),
+                '방향': self._extract_direction_from_text(text),
+                '주소': self._extract_address_from_text(text)
+            }
+
+        start = time.perf_counter()
+        for _ in range(repeat):
+            for text in texts:
+                legacy(text)
+        legacy_seconds = time.perf_counter() - start
+
+        start = time.perf_counter()
+        for _ in range(repeat):
+            for text in texts:
+                scan_property_text(text)
+        scan_seconds = time.perf_counter() - start
+
+        result = {
+            'texts': len(texts),
+            'legacy_seconds': legacy_seconds,
+            'scan_seconds': scan_seconds,
+            'speedup': legacy_seconds / scan_seconds if scan_seconds else float('inf'),
+            'mismatches': sum(1 for text in texts if legacy(text) != scan_property_text(text))
+        }
+        logger.info(
+            f"텍스트 {result['texts']}개 x {repeat}회: 기존 {legacy_seconds:.3f}초, "
+            f"단일 패스 {scan_seconds:.3f}초 ({result['speedup']:.1f}배), 결과 차이 {result['mismatches']}건"
+        )
+        return result
+
     def _go_to_next_page_stealth(self):
         """Stealth 모드로 다음 페이지로 이동"""
         try:
             # 사람처럼 행동
             self.human_like_behavior()
             
-            # 다음 페이지 버튼 찾기
-            next_button_selectors = [
-                "a[class*='next']",
-                "button[class*='next']",
-                ".pagination .next",
-                ".paging .next",
-                "a[aria-label*='다음']",
-                "button[aria-label*='다음']",
-                ".page_next",
-                "[data-testid*='next']",
-                "a[title*='다음']",
-                "button[title*='다음']"
-            ]
-            
-            for selector in next_button_selectors:
+            # 다음 페이지 버튼 찾기 (지난번 성공 선택자부터 시도)
+            current_url = self.driver.current_url
+            for selector in self.selector_cache.ordered('next_button', current_url, NEXT_BUTTON_SELECTORS):
                 try:
                     next_button = self.driver.find_element(By.CSS_SELECTOR, selector)
                     if next_button.is_enabled():
+                        self.selector_cache.remember('next_button', current_url, selector)
                         # 사람처럼 클릭
                         actions = ActionChains(self.driver)
                         actions.move_to_element(next_button).pause(random.uniform(0.5, 1.0)).click().perform()
-                        self.random_delay(3, 6)
+                        if self.adaptive_waits:
+                            self.wait_for_page_ready('다음페이지', self.listing_ready_selectors())
+                        else:
+                            self.random_delay(3, 6)
                         return True
                 except:
                     continue
@@ -536,7 +1500,7 @@ class StealthNaverLandCrawler:
             # 스크롤로 더 많은 매물 로드 시도
             try:
                 self.driver.execute_script("window.scrollTo(0, document.body.scrollHeight);")
-                self.random_delay(2, 4)
+                self.settle_delay(2, 4)
                 return True
             except:
                 pass
@@ -547,11 +1511,152 @@ class StealthNaverLandCrawler:
             logger.warning(f"Stealth 다음 페이지 이동 중 오류: {e}")
             return False
     
-    def save_results(self, data, filename="naver_land_stealth_result"):
-        """결과 저장"""
+    def capture_api_endpoints(self, url, url_filter="/api"):
+        """
+        브라우저로 페이지를 한 번 열어 매물 XHR JSON 엔드포인트를 캡처
+
+        CDP Network 이벤트(performance 로그)에서 JSON 응답을 돌려준 요청을 골라낸다.
+
+        Args:
+            url (str): 목록 페이지 URL
+            url_filter (str): 요청 URL에 포함되어야 하는 문자열
+
+        Returns:
+            list: {'url', 'method', 'headers', 'post_data'} 엔드포인트 목록
+        """
+        if not self.api_mode:
+            logger.error("엔드포인트 캡처에는 performance 로그가 필요합니다. api_mode=True 로 크롤러를 만드세요.")
+            return []
+        # 이미 떠 있는 브라우저가 있으면 재사용
+        if not self.ensure_driver():
+            return []
+        try:
+            self.driver.execute_cdp_cmd("Network.enable", {})
+            self.driver.get_log("performance")  # 이전 이벤트 비우기
+        except Exception as e:
+            logger.error(f"CDP 네트워크 이벤트를 사용할 수 없습니다: {e}")
+            return []
+
+        self.random_delay(3, 6)
+        self.driver.get(url)
+        self.wait_for_page_ready('API캡처', self.listing_ready_selectors())
+        self.bypass_cloudflare()
+
+        requests_by_id = {}
+        endpoints = {}
+        for entry in self.driver.get_log("performance"):
+            try:
+                message = json.loads(entry["message"])["message"]
+            except (KeyError, ValueError):
+                continue
+            params = message.get("params", {})
+
+            if message.get("method") == "Network.requestWillBeSent":
+                requests_by_id[params.get("requestId")] = params.get("request", {})
+            elif message.get("method") == "Network.responseReceived":
+                response = params.get("response", {})
+                request = requests_by_id.get(params.get("requestId"), {})
+                request_url = response.get("url", "")
+                if "json" not in response.get("mimeType", "") or url_filter not in request_url:
+                    continue
+                method = request.get("method", "GET")
+                endpoints[(method, request_url, request.get("postData"))] = {
+                    'url': request_url,
+                    'method': method,
+                    'headers': {
+                        key: value for key, value in request.get("headers", {}).items()
+                        if not key.startswith(":") and key.lower() not in ('cookie', 'content-length')
+                    },
+                    'post_data': request.get("postData")
+                }
+
+        logger.info(f"JSON 엔드포인트 {len(endpoints)}개 캡처")
+        return list(endpoints.values())
+
+    def sync_session_cookies(self):
+        """브라우저 쿠키와 User-Agent를 requests 세션(self.session)에 복사"""
+        for cookie in self.driver.get_cookies():
+            self.session.cookies.set(
+                cookie['name'], cookie['value'],
+                domain=cookie.get('domain'), path=cookie.get('path', '/')
+            )
+        try:
+            self.session.headers['User-Agent'] = self.driver.execute_script("return navigator.userAgent")
+        except Exception:
+            pass
+
+    def fetch_api_listings(self, url, max_pages=20, url_filter="/api"):
+        """
+        JSON API 모드: XHR 엔드포인트를 캡처한 뒤 브라우저 없이 HTTP로 페이지 순회
+
+        Args:
+            url (str): 목록 페이지 URL
+            max_pages (int): 엔드포인트별 최대 페이지 수
+            url_filter (str): 캡처할 요청 URL에 포함되어야 하는 문자열
+
+        Returns:
+            list: API 응답의 매물 레코드 ('수집API' 키에 엔드포인트 URL 포함)
+        """
+        # 엔드포인트 캡처와 쿠키 동기화 모두 브라우저가 필요하다
+        if not self.ensure_driver():
+            return []
+        endpoints = self.capture_api_endpoints(url, url_filter)
+        if not endpoints:
+            logger.warning("캡처된 JSON 엔드포인트가 없습니다. DOM 크롤링을 사용하세요.")
+            return []
+
+        self.sync_session_cookies()
+        all_records = []
+
+        for endpoint in endpoints:
+            seen = set()
+            for page in range(1, max_pages + 1):
+                request_url, post_data = _with_api_page(endpoint['url'], endpoint['post_data'], page)
+                try:
+                    response = self.session.request(
+                        endpoint['method'], request_url,
+                        headers=endpoint['headers'], data=post_data, timeout=10
+                    )
+                    response.raise_for_status()
+                    records = _find_record_list(response.json())
+                except (requests.RequestException, ValueError) as e:
+                    logger.warning(f"API 요청 실패 ({request_url}): {e}")
+                    break
+
+                # 페이지 파라미터가 없거나 마지막 페이지를 넘으면 같은/빈 결과가 온다
+                fingerprint = json.dumps(records, sort_keys=True, ensure_ascii=False)
+                if not records or fingerprint in seen:
+                    break
+                seen.add(fingerprint)
+
+                for record in records:
+                    record['수집API'] = endpoint['url']
+                all_records.extend(records)
+                logger.info(f"API 페이지 {page}: {len(records)}개 레코드 ({endpoint['url']})")
+
+                time.sleep(random.uniform(*self.jitter_floor))
+
+        logger.info(f"API 모드로 총 {len(all_records)}개 레코드 수집")
+        return all_records
+
+    def save_results(self, data, filename="naver_land_stealth_result", fmt="json", flush_interval=5.0):
+        """
+        결과 저장
+
+        Args:
+            data (iterable): 매물 레코드 (json 외 형식은 제너레이터도 그대로 스트리밍)
+            filename (str): 파일명 접두어 (타임스탬프와 확장자가 붙음)
+            fmt (str): 'json'(기존 형식 + Excel), 'jsonl', 'jsonl.gz', 'parquet', 'feather'
+            flush_interval (float): 스트리밍 싱크의 디스크 반영 간격(초)
+        """
         try:
             timestamp = time.strftime('%Y%m%d_%H%M%S')
             filename_with_timestamp = f"{filename}_{timestamp}"
+
+            if fmt != "json":
+                with open_sink(filename_with_timestamp, fmt, flush_interval) as sink:
+                    sink.write_many(data)
+                return
             
             # JSON 저장
             json_filename = f"{filename_with_timestamp}.json"
@@ -575,36 +1680,141 @@ class StealthNaverLandCrawler:
             logger.error(f"파일 저장 중 오류: {e}")
     
     def close(self):
-        """드라이버 종료"""
+        """중복 제거 인덱스와 드라이버 종료"""
+        if self.dedup_index:
+            self.dedup_index.close()
+            self.dedup_index = None
         if self.driver:
             self.driver.quit()
+            self.driver = None
             logger.info("브라우저가 종료되었습니다.")
 
 
+def _with_api_page(url, post_data, page):
+    """URL 쿼리스트링 또는 JSON 본문의 페이지 번호 파라미터를 page로 바꾼 요청 반환"""
+    parsed = urlparse(url)
+    query = parse_qsl(parsed.query, keep_blank_values=True)
+    if any(key in API_PAGE_KEYS for key, _ in query):
+        query = [(key, str(page) if key in API_PAGE_KEYS else value) for key, value in query]
+        url = urlunparse(parsed._replace(query=urlencode(query)))
+
+    if post_data:
+        try:
+            body = json.loads(post_data)
+        except ValueError:
+            body = None
+        if isinstance(body, dict) and any(key in body for key in API_PAGE_KEYS):
+            body.update({key: page for key in API_PAGE_KEYS if key in body})
+            post_data = json.dumps(body, ensure_ascii=False)
+
+    return url, post_data
+
+
+def _find_record_list(payload):
+    """JSON 응답에서 가장 큰 dict 리스트(매물 목록으로 추정)를 찾아 반환"""
+    best = []
+    stack = [payload]
+    while stack:
+        node = stack.pop()
+        if isinstance(node, dict):
+            stack.extend(node.values())
+        elif isinstance(node, list):
+            if node and all(isinstance(item, dict) for item in node) and len(node) > len(best):
+                best = node
+            stack.extend(node)
+    return best
+
+
+def _pool_worker(worker_id, user_agent, settings, max_pages, url_queue, result_queue):
+    """크롤링 풀 워커: 부모와 같은 설정의 독립 드라이버로 URL 큐를 소비하고 결과를 결과 큐로 전달"""
+    settings = dict(settings)
+    # Chrome 프로필은 동시에 하나의 프로세스만 쓸 수 있으므로 워커별로 분리
+    if settings.get('profile_dir'):
+        settings['profile_dir'] = f"{settings['profile_dir']}_{worker_id}"
+    crawler = StealthNaverLandCrawler(**settings)
+    try:
+        if not crawler.setup_driver(user_agent=user_agent):
+            logger.error(f"워커 {worker_id}: 드라이버 준비 실패")
+            return
+
+        while True:
+            url = url_queue.get()
+            if url is None:
+                break
+            properties = crawler.crawl_property_listings_stealth(url, max_pages=max_pages)
+            result_queue.put(('result', url, properties))
+    except Exception as e:
+        logger.error(f"워커 {worker_id} 처리 중 오류: {e}")
+    finally:
+        try:
+            crawler.close()
+        except Exception:
+            pass
+        result_queue.put(('done', worker_id, None))
+
+
 def main():
     """메인 실행 함수"""
-    target_url = "https://fin.land.naver.com/complexes/869?tab=article&transactionPyeongTypeNumber=1&transactionTradeType=A1&articleTradeTypes=A1"
-    crawler = StealthNaverLandCrawler(headless=False, use_undetected=True)
+    parser = argparse.ArgumentParser(description="네이버 부동산 Stealth 크롤러")
+    parser.add_argument("--url", default="https://fin.land.naver.com/complexes/869?tab=article&transactionPyeongTypeNumber=1&transactionTradeType=A1&articleTradeTypes=A1",
+                        help="크롤링할 목록 페이지 URL")
+    parser.add_argument("--max-pages", type=int, default=5, help="최대 페이지 수")
+    parser.add_argument("--journal", default="naver_land_crawl_journal", help="체크포인트 저널 파일 경로(확장자 제외)")
+    parser.add_argument("--resume", action="store_true", help="저널에 기록된 페이지 커서부터 이어서 수집")
+    parser.add_argument("--fresh", action="store_true", help="기록이 남은 저널을 지우고 새로 수집")
+    parser.add_argument("--output-format", default="json", choices=["json"] + list(SINK_EXTENSIONS),
+                        help="결과 저장 형식 (json 외에는 페이지마다 스트리밍 기록)")
+    parser.add_argument("--dedup-index", default=None,
+                        help="실행 간 중복 제거 인덱스(SQLite) 경로 — 지정하면 신규/변경 매물만 수집")
+    parser.add_argument("--flush-interval", type=float, default=5.0, help="스트리밍 출력의 디스크 반영 간격(초)")
+    parser.add_argument("--benchmark-extract", action="store_true",
+                        help="저장된 결과 JSON으로 매물 텍스트 추출 속도만 측정")
+    args = parser.parse_args()
+
+    target_url = args.url
+    crawler = StealthNaverLandCrawler(headless=False, use_undetected=True, dedup_index_path=args.dedup_index)
 
     try:
+        if args.benchmark_extract:
+            crawler.benchmark_text_extraction()
+            return
+
+        # 페이지마다 저널에 기록하므로 중간에 실패해도 --resume 으로 이어서 수집할 수 있다
+        # (브라우저를 띄우기 전에 열어 기존 저널 덮어쓰기를 먼저 거른다)
+        try:
+            journal = CrawlJournal(args.journal, resume=args.resume, fresh=args.fresh)
+        except FileExistsError as e:
+            logger.error(str(e))
+            return
+
         ok = crawler.setup_driver()
         if not ok:
             logger.error("드라이버 준비 실패로 크롤링을 중단합니다.")
             return
-
-        # 페이지 열기 예시 (원래 crawl 함수 호출로 교체)
-        crawler.driver.get(target_url)
-        logger.info("타깃 페이지 로드 완료")
-        # 여기에서 실제 크롤링 함수 호출
-        # crawler.crawl_property_listings_stealth(target_url, max_pages=5)
+        if args.output_format == "json":
+            crawler.crawl_property_listings_stealth(target_url, max_pages=args.max_pages, journal=journal)
+            crawler.save_results(journal.records())
+        else:
+            output_name = f"naver_land_stealth_result_{time.strftime('%Y%m%d_%H%M%S')}"
+            with open_sink(output_name, args.output_format, args.flush_interval) as sink:
+                crawler.crawl_property_listings_stealth(target_url, max_pages=args.max_pages,
+                                                        journal=journal, sink=sink)
+        # 브라우저는 엔드포인트 캡처에만 쓰고 JSON API로 페이지를 넘길 때 (api_mode=True 로 생성):
+        # api_crawler = StealthNaverLandCrawler(api_mode=True)
+        # api_records = api_crawler.fetch_api_listings(target_url, max_pages=20, url_filter="/front-api/")
+        # 여러 단지를 병렬로 수집할 때:
+        # for item in crawler.crawl_urls_pool([target_url, ...], num_workers=4):
+        #     ...
 
     except Exception as e:
         logger.error(f"크롤링 중 오류 발생: {e}")
     finally:
-        # 드라이버가 None이 아닐 때만 종료
+        # 드라이버가 없어도 중복 제거 인덱스는 닫아야 하므로 항상 호출 (close가 드라이버 유무를 확인)
         try:
-            if getattr(crawler, "driver", None):
-                crawler.close()
-                logger.info("브라우저가 종료되었습니다.")
+            crawler.close()
         except Exception as e:
             logger.warning(f"브라우저 종료 중 오류: {e}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,280 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+SQLite 연결 튜닝 프로파일과 쿼리 시간 측정 모듈
+
+프로파일 (연결마다 적용):
+    - 'oltp': WAL + synchronous=NORMAL, 짧은 읽기/쓰기가 섞인 일반 사용
+    - 'bulk_load': WAL + synchronous=OFF, 대량 적재 중에만 (적재 후 장애 시 유실 가능)
+    - 'read_only': 쓰기 금지(query_only), 큰 mmap/캐시로 읽기 전용 작업
+
+    conn = sqlite3.connect(path)
+    apply_profile(conn, "oltp")
+
+쿼리 시간 측정:
+    파이썬 호출 경계에서 잰다. TimedConnection 으로 연 연결의 커서는 execute/executemany 와
+    이어지는 fetch* 호출 시간을 문장 하나로 합산하고, 결과를 다 읽거나 커서가 다음 문장을
+    실행하거나 닫힐 때 확정한다 (COUNT(*) 처럼 한 번에 끝나는 문장도 그대로 잡힌다).
+
+    timer = QueryTimer(slow_ms=50)
+    conn = timer.connect(path)  # = sqlite3.connect(path, factory=TimedConnection) + attach
+    ...
+    timer.report()              # 문장별 지연 분포
+    timer.explain_slow(conn)    # 느린 문장의 EXPLAIN QUERY PLAN
+"""
+
+import functools
+import re
+import sqlite3
+import threading
+import time
+
+PROFILES = {
+    "oltp": {
+        "journal_mode": "WAL",
+        "synchronous": "NORMAL",
+        "mmap_size": 256 * 1024 * 1024,
+        "cache_size": -65536,  # 64MB (음수는 KiB 단위)
+        "temp_store": "MEMORY",
+    },
+    "bulk_load": {
+        "journal_mode": "WAL",
+        "synchronous": "OFF",
+        "mmap_size": 0,
+        "cache_size": -262144,  # 256MB
+        "temp_store": "MEMORY",
+    },
+    "read_only": {
+        "query_only": "ON",
+        "mmap_size": 1024 * 1024 * 1024,
+        "cache_size": -131072,  # 128MB
+        "temp_store": "MEMORY",
+    },
+}
+
+# 지연 분포 구간 상한(ms)
+LATENCY_BUCKETS_MS = (0.1, 0.5, 1, 5, 10, 50, 100, 500, 1000, float("inf"))
+
+# 리터럴을 ? 로 바꿔 같은 모양의 문장을 한 항목으로 모은다
+LITERAL_RE = re.compile(r"'(?:[^']|'')*'|\b\d+(?:\.\d+)?\b")
+SPACE_RE = re.compile(r"\s+")
+
+
+def apply_profile(conn, name):
+    """
+    연결에 프로파일의 PRAGMA 를 적용합니다 (journal_mode 는 트랜잭션 밖에서만 바뀐다).
+
+    Args:
+        conn (sqlite3.Connection): 대상 연결
+        name (str): PROFILES 의 키
+
+    Returns:
+        dict: PRAGMA 이름 -> 적용 후 값
+    """
+    if name not in PROFILES:
+        raise ValueError(f"알 수 없는 프로파일: {name}")
+    applied = {}
+    for pragma, value in PROFILES[name].items():
+        row = conn.execute(f"PRAGMA {pragma}={value}").fetchone()
+        applied[pragma] = row[0] if row else value
+    return applied
+
+
+def is_read_only(name):
+    """프로파일이 쓰기를 막는지 (query_only) 여부"""
+    return PROFILES.get(name, {}).get("query_only") == "ON"
+
+
+@functools.lru_cache(maxsize=4096)
+def normalize_sql(sql):
+    """리터럴을 ? 로 바꾸고 공백을 정리한 문장 (집계 키, 같은 SQL 은 캐시)"""
+    return SPACE_RE.sub(" ", LITERAL_RE.sub("?", sql)).strip()
+
+
+class TimedCursor(sqlite3.Cursor):
+    """
+    execute/executemany 와 fetch* 호출 시간을 연결의 query_timer 에 기록하는 커서.
+
+    문장 하나의 시간 = 실행 호출 + 그 결과를 읽는 fetch 호출들의 합.
+    """
+
+    _pending = None  # [sql, 매개변수, 누적 초]
+
+    def execute(self, sql, parameters=()):
+        self._finish()
+        start = time.perf_counter()
+        try:
+            return super().execute(sql, parameters)
+        finally:
+            self._begin(sql, parameters, time.perf_counter() - start)
+
+    def executemany(self, sql, seq_of_parameters):
+        self._finish()
+        start = time.perf_counter()
+        try:
+            return super().executemany(sql, seq_of_parameters)
+        finally:
+            self._begin(sql, None, time.perf_counter() - start)
+            self._finish()
+
+    def fetchone(self):
+        start = time.perf_counter()
+        row = super().fetchone()
+        self._add(time.perf_counter() - start, done=row is None)
+        return row
+
+    def fetchmany(self, size=None):
+        start = time.perf_counter()
+        rows = super().fetchmany(self.arraysize if size is None else size)
+        self._add(time.perf_counter() - start, done=not rows)
+        return rows
+
+    def fetchall(self):
+        start = time.perf_counter()
+        rows = super().fetchall()
+        self._add(time.perf_counter() - start, done=True)
+        return rows
+
+    def __next__(self):
+        start = time.perf_counter()
+        try:
+            row = super().__next__()
+        except StopIteration:
+            self._add(time.perf_counter() - start, done=True)
+            raise
+        self._add(time.perf_counter() - start, done=False)
+        return row
+
+    def close(self):
+        self._finish()
+        super().close()
+
+    def __del__(self):
+        self._finish()
+
+    def _begin(self, sql, parameters, elapsed):
+        if getattr(self.connection, "query_timer", None) is not None:
+            self._pending = [sql, parameters, elapsed]
+
+    def _add(self, elapsed, done):
+        pending = self._pending
+        if pending is not None:
+            pending[2] += elapsed
+            if done:
+                self._finish()
+
+    def _finish(self):
+        pending, self._pending = self._pending, None
+        timer = getattr(self.connection, "query_timer", None) if pending is not None else None
+        if timer is not None:
+            timer.record(*pending)
+
+
+class TimedConnection(sqlite3.Connection):
+    """커서를 TimedCursor 로 만드는 연결 (sqlite3.connect(..., factory=TimedConnection))."""
+
+    query_timer = None
+
+    def cursor(self, factory=None):
+        return super().cursor(factory or TimedCursor)
+
+    # Connection.execute 계열은 cursor() 를 거치지 않으므로 직접 TimedCursor 로 보낸다
+    def execute(self, sql, parameters=()):
+        return self.cursor().execute(sql, parameters)
+
+    def executemany(self, sql, seq_of_parameters):
+        return self.cursor().executemany(sql, seq_of_parameters)
+
+
+class QueryTimer:
+    """
+    TimedConnection 에 붙여 문장별 지연 분포를 모으는 측정기 (여러 연결/스레드에서 공유 가능).
+    """
+
+    def __init__(self, slow_ms=50.0, max_slow=100):
+        """
+        Args:
+            slow_ms (float): 이 시간 이상 걸린 문장을 느린 문장으로 기록
+            max_slow (int): 보관할 느린 문장 수
+        """
+        self.slow_ms = slow_ms
+        self.max_slow = max_slow
+        self.stats = {}  # 정규화 SQL -> {"count", "total_ms", "max_ms", "buckets"}
+        self.slow = []   # (소요 ms, SQL, 매개변수)
+        self._lock = threading.Lock()
+
+    def connect(self, database, **kwargs):
+        """측정이 붙은 연결을 엽니다 (sqlite3.connect 인자 그대로)."""
+        return self.attach(sqlite3.connect(database, factory=TimedConnection, **kwargs))
+
+    def attach(self, conn):
+        """TimedConnection 의 이후 문장을 이 측정기에 기록합니다."""
+        if not isinstance(conn, TimedConnection):
+            raise TypeError("QueryTimer 는 TimedConnection 연결에만 붙일 수 있습니다 "
+                            "(sqlite3.connect(..., factory=TimedConnection) 또는 QueryTimer.connect)")
+        conn.query_timer = self
+        return conn
+
+    def detach(self, conn):
+        """연결의 측정을 끕니다 (커서에 남아 있던 문장은 기록하지 않는다)."""
+        conn.query_timer = None
+
+    def record(self, sql, parameters, elapsed):
+        """문장 하나의 소요 시간(초)을 기록합니다."""
+        elapsed_ms = elapsed * 1000
+        key = normalize_sql(sql)
+        with self._lock:
+            entry = self.stats.get(key)
+            if entry is None:
+                entry = self.stats[key] = {"count": 0, "total_ms": 0.0, "max_ms": 0.0,
+                                           "buckets": [0] * len(LATENCY_BUCKETS_MS)}
+            entry["count"] += 1
+            entry["total_ms"] += elapsed_ms
+            entry["max_ms"] = max(entry["max_ms"], elapsed_ms)
+            for index, bound in enumerate(LATENCY_BUCKETS_MS):
+                if elapsed_ms <= bound:
+                    entry["buckets"][index] += 1
+                    break
+            if elapsed_ms >= self.slow_ms and len(self.slow) < self.max_slow:
+                self.slow.append((elapsed_ms, sql, parameters))
+
+    def explain_slow(self, conn, limit=10):
+        """
+        느린 문장의 EXPLAIN QUERY PLAN 을 출력합니다 (기록할 때의 매개변수로 계획을 구한다).
+
+        Returns:
+            list: (소요 ms, SQL, 계획 행 목록)
+        """
+        with self._lock:
+            slow = sorted(self.slow, key=lambda item: item[0], reverse=True)[:limit]
+        plans = []
+        for elapsed_ms, sql, parameters in slow:
+            if not sql.lstrip().upper().startswith(("SELECT", "WITH", "UPDATE", "DELETE", "INSERT")):
+                continue
+            if parameters is None:
+                parameters = (None,) * sql.count("?")  # executemany 는 매개변수를 남기지 않는다
+            try:
+                # 측정하지 않는 기본 커서로 실행
+                plan = sqlite3.Cursor(conn).execute("EXPLAIN QUERY PLAN " + sql, parameters).fetchall()
+            except Exception as e:
+                plan = [(None, None, None, f"계획을 구할 수 없음: {e}")]
+            plans.append((elapsed_ms, sql, plan))
+
+        for elapsed_ms, sql, plan in plans:
+            print(f"[{elapsed_ms:.1f}ms] {normalize_sql(sql)}")
+            for row in plan:
+                print(f"    {row[-1]}")
+        return plans
+
+    def report(self, top=10):
+        """총 소요 시간 순으로 문장별 횟수/평균/최대/분포를 출력합니다."""
+        with self._lock:
+            items = sorted(self.stats.items(), key=lambda item: item[1]["total_ms"], reverse=True)[:top]
+        labels = [f"≤{bound:g}" if bound != float("inf") else ">" + f"{LATENCY_BUCKETS_MS[-2]:g}"
+                  for bound in LATENCY_BUCKETS_MS]
+        print(f"쿼리 지연 통계 (상위 {len(items)}개, 구간 단위 ms: {' '.join(labels)})")
+        for sql, entry in items:
+            average = entry["total_ms"] / entry["count"]
+            print(f"  {entry['count']:>8}회  평균 {average:8.3f}ms  최대 {entry['max_ms']:8.2f}ms  "
+                  f"{entry['buckets']}  {sql[:80]}")
+        return items
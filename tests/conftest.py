@@ -0,0 +1,28 @@
+# -*- coding: utf-8 -*-
+"""테스트 공통 설정: 저장소 루트의 모듈(파일명에 하이픈/한글 포함)을 불러온다"""
+
+import importlib.util
+import os
+import sys
+
+import pytest
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if ROOT not in sys.path:
+    sys.path.insert(0, ROOT)
+
+
+def load_module(name, filename):
+    """파일 경로로 모듈 로드 (import 문으로 쓸 수 없는 파일명용)"""
+    spec = importlib.util.spec_from_file_location(name, os.path.join(ROOT, filename))
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+@pytest.fixture(scope="session")
+def naver_crawl():
+    """naver-crawl.py 모듈 (셀레니움 등 크롤링 의존성이 없으면 건너뜀)"""
+    for dependency in ("selenium", "webdriver_manager", "fake_useragent"):
+        pytest.importorskip(dependency)
+    return load_module("naver_crawl", "naver-crawl.py")
@@ -0,0 +1,49 @@
+# -*- coding: utf-8 -*-
+"""커서로생성한kospi200.py 의 Kospi200Table 단위 테스트"""
+
+import pytest
+
+from conftest import load_module
+
+
+@pytest.fixture(scope="module")
+def kospi():
+    return load_module("kospi200", "커서로생성한kospi200.py")
+
+
+def make_rows(kospi, values):
+    """(종목명, 전일비, 등락률) 목록으로 StockRow 목록 생성"""
+    return [
+        kospi.StockRow(종목명=name, 종목코드=f"{index:06d}", 현재가='1000', 전일비=change,
+                       등락률=rate, 거래량='10', 거래대금='20', 시가총액='30')
+        for index, (name, change, rate) in enumerate(values)
+    ]
+
+
+def test_sort_by_keeps_tie_order_in_both_directions(kospi):
+    table = kospi.Kospi200Table.from_rows(make_rows(kospi, [
+        ('가', '▲100', '+1.00%'),
+        ('나', '▲300', '+3.00%'),
+        ('다', '▲100', '+1.00%'),
+        ('라', '', ''),
+        ('마', '▲300', '+3.00%'),
+    ]))
+
+    assert table.sort_by('등락률')['종목명'].tolist() == ['가', '다', '나', '마', '라']
+    assert table.sort_by('등락률', descending=True)['종목명'].tolist() == ['나', '마', '가', '다', '라']
+    assert table.sort_by('전일비', descending=True)['종목명'].tolist() == ['나', '마', '가', '다', '라']
+
+
+def test_sort_by_descending_string_column(kospi):
+    table = kospi.Kospi200Table.from_rows(make_rows(kospi, [('나', '', ''), ('가', '', ''), ('나', '', '')]))
+
+    assert table.sort_by('종목명', descending=True)['종목코드'].tolist() == ['000000', '000002', '000001']
+
+
+def test_formatted_change_keeps_original_text(kospi):
+    table = kospi.Kospi200Table.from_rows(make_rows(kospi, [
+        ('가', '=0', '0.00%'), ('나', '▼하락610', '-1.20%'), ('다', '▲1,200', '+2.00%'),
+    ]))
+
+    assert table.formatted_columns()['전일비'] == ['=0', '▼하락610', '▲1,200']
+    assert table['전일비'].tolist() == [0, -610, 1200]
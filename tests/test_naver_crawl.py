@@ -0,0 +1,74 @@
+# -*- coding: utf-8 -*-
+"""naver-crawl.py 단위 테스트"""
+
+import pytest
+
+LEGACY_TEXTS = [
+    "매매 3.5억원 84.5㎡ 12층 남향 서울시 강남구",
+    "전세 3.5억 2000만원 1,234,567만원 3.5층",
+    "월세 1,000.5만원 25평 1,84.5㎡ 역삼동",
+    "아파트 12.5만원 2.5F 1,234㎡ 33.5평",
+    "매매 1,200억원 10억 5천만원 3.2py",
+]
+
+
+def legacy_fields(crawler, text):
+    """benchmark_text_extraction 의 legacy() 와 같은 기존 필드별 추출"""
+    return {
+        '매물타입': crawler._extract_type_from_text(text),
+        '가격': crawler._extract_price_from_text(text),
+        '면적': crawler._extract_area_from_text(text),
+        '층수': crawler._extract_floor_from_text(text),
+        '방향': crawler._extract_direction_from_text(text),
+        '주소': crawler._extract_address_from_text(text)
+    }
+
+
+@pytest.mark.parametrize("text", LEGACY_TEXTS)
+def test_scan_matches_legacy_for_decimal_numbers(naver_crawl, text):
+    crawler = naver_crawl.StealthNaverLandCrawler.__new__(naver_crawl.StealthNaverLandCrawler)
+    assert naver_crawl.scan_property_text(text) == legacy_fields(crawler, text)
+
+
+def test_decimal_eok_price_keeps_legacy_result(naver_crawl):
+    assert naver_crawl.scan_property_text("매매 3.5억원")['가격'] == '5억원'
+
+
+class RecordingChrome:
+    """생성자 인자를 기록하는 가짜 Chrome"""
+
+    calls = []
+
+    def __init__(self, **kwargs):
+        RecordingChrome.calls.append(kwargs)
+
+    def execute_cdp_cmd(self, cmd, params):
+        pass
+
+
+def bare_crawler(naver_crawl, use_undetected):
+    crawler = naver_crawl.StealthNaverLandCrawler.__new__(naver_crawl.StealthNaverLandCrawler)
+    crawler.headless = True
+    crawler.profile_dir = None
+    crawler.api_mode = False
+    crawler.use_undetected = use_undetected
+    return crawler
+
+
+def test_start_driver_passes_path_to_undetected_chrome(naver_crawl, monkeypatch):
+    RecordingChrome.calls = []
+    monkeypatch.setattr(naver_crawl, "uc", type("uc", (), {"Chrome": RecordingChrome}), raising=False)
+    monkeypatch.setattr(naver_crawl, "HAVE_UC", True)
+
+    bare_crawler(naver_crawl, use_undetected=True)._start_driver("/opt/chromedriver", "UA")
+
+    assert RecordingChrome.calls[0]["driver_executable_path"] == "/opt/chromedriver"
+
+
+def test_start_driver_passes_path_to_selenium_chrome(naver_crawl, monkeypatch):
+    RecordingChrome.calls = []
+    monkeypatch.setattr(naver_crawl.webdriver, "Chrome", RecordingChrome)
+
+    bare_crawler(naver_crawl, use_undetected=False)._start_driver("/opt/chromedriver", "UA")
+
+    assert RecordingChrome.calls[0]["service"].path == "/opt/chromedriver"
@@ -3,7 +3,7 @@
 import urllib.request
 
 #크롤링
-from bs4 import BeautifulSoup   
+from html_parsing import select_nodes
 #정규표현식: 특정 문자열 패턴 찾기
 import re
 
@@ -16,8 +16,8 @@ for n in range(0,10):
 
      data = urllib.request.urlopen(url).read()   
 
-     soup = BeautifulSoup(data, 'html.parser')
-     list = soup.find_all("span", attrs={"data-role":"list-title-text"})
+     #제목 텍스트만 필요하므로 CSS 선택자 빠른 경로 사용
+     list = select_nodes(data, 'span[data-role="list-title-text"]', url)
      for item in list:   
          title = item.text.strip()
          print(title)        
@@ -1,5 +1,5 @@
 # coding:utf-8
-from bs4 import BeautifulSoup
+from html_parsing import make_soup
 import urllib.request
 import re 
 
@@ -8,15 +8,15 @@ hdr = {'User-agent':'Mozilla/5.0 (iPhone; CPU iPhone OS 10_3 like Mac OS X) Appl
 
 for n in range(1,11):
     #오늘의유머 베스트게시판 주소 
-    data ='https://www.todayhumor.co.kr/board/list.php?table=bestofbest&page=' + str(n)
-    print(data)
+    url ='https://www.todayhumor.co.kr/board/list.php?table=bestofbest&page=' + str(n)
+    print(url)
     #웹브라우져 헤더 추가 
-    req = urllib.request.Request(data, headers = hdr)
+    req = urllib.request.Request(url, headers = hdr)
     data = urllib.request.urlopen(req).read()
 
     #혹시 한글이 깨지는 경우       
     page = data.decode('utf-8', 'ignore')
-    soup = BeautifulSoup(page, 'html.parser')
+    soup = make_soup(page, url)
     list = soup.find_all('td', attrs={"class":"subject"})
 
     for item in list:
@@ -5,15 +5,348 @@
 """
 
 import requests
+from requests.adapters import HTTPAdapter
 from bs4 import BeautifulSoup
+from html_parsing import make_soup
+from http_cache import HttpCache, cached_get, default_cache
 import time
 import csv
-from typing import List, Dict, Optional
+import os
+import argparse
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from urllib.parse import urlparse
+from datetime import datetime, date, time as dtime
+from typing import List, Dict, Optional, NamedTuple
 import re
 
+import numpy as np
+import pandas as pd
+
+try:
+    import pyarrow  # noqa: F401  (Parquet 저장소용)
+    HAVE_PYARROW = True
+except ImportError:
+    HAVE_PYARROW = False
+
+
+class Kospi200SnapshotStore:
+    """
+    코스피200 스냅샷 시계열 저장소 (추가 전용, Parquet)
+
+    스냅샷마다 <root>/<YYYY-MM-DD>/<HHMMSS>.parquet 파일 하나를 추가하며,
+    기존 파일은 수정하지 않는다. 숫자 컬럼은 저장 시점에 정수/실수로 변환된다.
+    """
+
+    INT_COLUMNS = ['순위', '현재가', '전일비', '거래량', '거래대금', '시가총액']
+
+    def __init__(self, root: str = "kospi200_snapshots"):
+        if not HAVE_PYARROW:
+            raise RuntimeError("스냅샷 저장소에는 pyarrow 설치가 필요합니다.")
+        self.root = root
+        os.makedirs(root, exist_ok=True)
+
+    def append(self, data: 'Kospi200Table', taken_at: Optional[datetime] = None) -> str:
+        """
+        스냅샷 하나를 타임스탬프와 함께 추가합니다.
+
+        Args:
+            data (Kospi200Table): get_kospi200_data() 결과 (딕셔너리 리스트도 허용)
+            taken_at (datetime): 스냅샷 시각 (기본값: 현재 시각)
+
+        Returns:
+            str: 저장된 파일 경로
+        """
+        taken_at = taken_at or datetime.now()
+        frame = self.to_frame(data, taken_at)
+
+        day_dir = os.path.join(self.root, taken_at.strftime('%Y-%m-%d'))
+        os.makedirs(day_dir, exist_ok=True)
+        path = os.path.join(day_dir, taken_at.strftime('%H%M%S') + ".parquet")
+        frame.to_parquet(path, index=False)
+        return path
+
+    @classmethod
+    def to_frame(cls, data, taken_at: datetime) -> pd.DataFrame:
+        """크롤링 결과를 타입이 지정된 DataFrame으로 변환합니다."""
+        if isinstance(data, Kospi200Table):
+            # 이미 숫자형 컬럼이므로 문자열 파싱 없이 nullable 타입으로만 맞춘다
+            frame = data.to_frame()
+            frame.insert(0, '시각', pd.Timestamp(taken_at))
+            for column in cls.INT_COLUMNS:
+                frame[column] = frame[column].astype('Int64')
+            return frame
+
+        frame = pd.DataFrame(data)
+        frame.insert(0, '시각', pd.Timestamp(taken_at))
+        if '종목코드' not in frame:
+            frame['종목코드'] = None
+
+        if '전일비' in frame:
+            # '▼1,200' / '하락1,200' 등 -> 부호 있는 정수
+            change = frame['전일비'].astype(str)
+            sign = change.str.contains(FALLING_CHANGE_RE).map({True: -1, False: 1})
+            frame['전일비'] = pd.to_numeric(change.str.replace(r'[^\d]', '', regex=True), errors='coerce') * sign
+        if '등락률' in frame:
+            frame['등락률'] = pd.to_numeric(
+                frame['등락률'].astype(str).str.replace(r'[%+,]', '', regex=True), errors='coerce'
+            ).astype('Float64')
+        for column in cls.INT_COLUMNS:
+            if column in frame:
+                frame[column] = pd.to_numeric(
+                    frame[column].astype(str).str.replace(',', '', regex=False), errors='coerce'
+                ).astype('Int64')
+        return frame
+
+    def query(self, ticker: Optional[str] = None, start: Optional[datetime] = None,
+              end: Optional[datetime] = None) -> pd.DataFrame:
+        """
+        저장된 스냅샷을 조회합니다.
+
+        Args:
+            ticker (str): 종목코드 또는 종목명 (None이면 전체)
+            start (datetime): 시작 시각(포함)
+            end (datetime): 종료 시각(포함)
+
+        Returns:
+            pd.DataFrame: 시각 순으로 정렬된 스냅샷 행
+        """
+        start_day = start.date() if start else date.min
+        end_day = end.date() if end else date.max
+
+        paths = []
+        for day_name in sorted(os.listdir(self.root)):
+            try:
+                day = datetime.strptime(day_name, '%Y-%m-%d').date()
+            except ValueError:
+                continue
+            if start_day <= day <= end_day:
+                day_dir = os.path.join(self.root, day_name)
+                paths.extend(os.path.join(day_dir, name) for name in sorted(os.listdir(day_dir))
+                             if name.endswith('.parquet'))
+        if not paths:
+            return pd.DataFrame()
+
+        frame = pd.concat((pd.read_parquet(path) for path in paths), ignore_index=True)
+        if ticker is not None:
+            frame = frame[(frame['종목코드'] == ticker) | (frame['종목명'] == ticker)]
+        if start is not None:
+            frame = frame[frame['시각'] >= pd.Timestamp(start)]
+        if end is not None:
+            frame = frame[frame['시각'] <= pd.Timestamp(end)]
+        return frame.sort_values(['시각', '순위']).reset_index(drop=True)
+
+
+class StockRow(NamedTuple):
+    """편입종목 테이블 한 행 (숫자 필드는 쉼표 제거)"""
+    종목명: str
+    종목코드: str
+    현재가: str
+    전일비: str
+    등락률: str
+    거래량: str
+    거래대금: str
+    시가총액: str
+
+
+# 편입종목 테이블 클래스 (우선순위 순)
+STOCK_TABLE_CLASSES = ['type_1', 'type_4', 'type_2', 'type_3', 'type_5']
+
+# 헤더 텍스트 접두어 -> 필드명 ('거래대금(백만)' 처럼 단위가 붙어도 매칭)
+HEADER_FIELDS = (
+    ('종목', '종목명'), ('현재가', '현재가'), ('전일비', '전일비'), ('등락률', '등락률'),
+    ('거래량', '거래량'), ('거래대금', '거래대금'), ('시가총액', '시가총액'),
+)
+
+# 헤더를 찾지 못했을 때의 기본 컬럼 위치
+DEFAULT_COLUMN_MAP = {'종목명': 0, '현재가': 1, '전일비': 2, '등락률': 3, '거래량': 4, '거래대금': 5, '시가총액': 6}
+
+# 전일비 아이콘 클래스 -> 방향 기호
+CHANGE_DIRECTIONS = {'bu_pdn': '▼', 'bu_pup': '▲', 'bu_pn': '='}
+
+# 전일비 텍스트가 하락을 뜻하는지 ('▼1,200' / '하락1,200' / '-1,200')
+FALLING_CHANGE_RE = re.compile('▼|하락|-')
+
+
+class Kospi200Table:
+    """
+    코스피200 편입종목 컬럼형 테이블 (NumPy 구조화 배열)
+
+    숫자 컬럼은 정수/실수로 저장하고 (전일비는 부호 있는 정수, 등락률은 % 값),
+    정렬·필터링·출력 포맷은 컬럼 단위 NumPy 연산으로 처리한다.
+    정수 컬럼의 결측값은 missing 마스크(True=결측)로 따로 들고 있다가
+    to_frame() 에서 <NA> 로, 출력에서는 빈 칸으로 되돌린다 (배열에는 0이 들어 있다).
+    전일비는 페이지의 원문('▲1,200', '=0' 등)도 전일비표시 컬럼에 남겨 출력에 그대로 쓴다.
+
+        table.sort_by('등락률')[:10]          # 등락률 하위 10개 (결측은 항상 뒤로)
+        table[table['거래대금'] > 100_000]    # 거래대금 1,000억 초과
+    """
+
+    # 결측이 있을 수 있는 정수 컬럼
+    NULLABLE_COLUMNS = ['현재가', '전일비', '거래량', '거래대금', '시가총액']
+    MISSING_DTYPE = np.dtype([(name, np.bool_) for name in NULLABLE_COLUMNS])
+
+    # 출력 컬럼과 표 너비 (display_data / save_to_txt 공통)
+    COLUMNS = ['순위', '종목명', '현재가', '전일비', '등락률', '거래량', '거래대금', '시가총액']
+    WIDTHS = [4, 12, 10, 10, 8, 12, 10, 10]
+
+    def __init__(self, array: np.ndarray, missing: Optional[np.ndarray] = None):
+        self.array = array
+        self.missing = missing if missing is not None else np.zeros(len(array), dtype=self.MISSING_DTYPE)
+
+    @staticmethod
+    def dtype(name_width: int = 1, code_width: int = 1, change_width: int = 1) -> np.dtype:
+        """종목명/종목코드/전일비표시 폭을 데이터에 맞춘 구조화 배열 dtype (문자열이 잘리지 않도록)"""
+        return np.dtype([
+            ('순위', np.int32),
+            ('종목명', f'U{max(name_width, 1)}'),
+            ('종목코드', f'U{max(code_width, 1)}'),
+            ('현재가', np.int64),
+            ('전일비', np.int64),
+            ('전일비표시', f'U{max(change_width, 1)}'),
+            ('등락률', np.float64),
+            ('거래량', np.int64),
+            ('거래대금', np.int64),
+            ('시가총액', np.int64),
+        ])
+
+    @classmethod
+    def from_rows(cls, rows: List[StockRow]) -> 'Kospi200Table':
+        """디코딩한 행 목록으로 테이블을 만듭니다 (순위는 행 순서대로 1부터)."""
+        if not rows:
+            return cls(np.zeros(0, dtype=cls.dtype()))
+
+        columns = list(zip(*rows))
+        fields = StockRow._fields
+        names = columns[fields.index('종목명')]
+        codes = columns[fields.index('종목코드')]
+        changes = columns[fields.index('전일비')]
+        array = np.zeros(len(rows), dtype=cls.dtype(max(map(len, names)), max(map(len, codes)),
+                                                    max(map(len, changes))))
+        missing = np.zeros(len(rows), dtype=cls.MISSING_DTYPE)
+
+        array['순위'] = np.arange(1, len(rows) + 1)
+        array['종목명'] = names
+        array['종목코드'] = codes
+        for name in ('현재가', '거래량', '거래대금', '시가총액'):
+            values = columns[fields.index(name)]
+            missing[name] = [not value.isdigit() for value in values]
+            array[name] = [int(value) if value.isdigit() else 0 for value in values]
+
+        # '▼하락610' -> -610, '▲상승1,200' -> 1200 (숫자가 없으면 결측)
+        array['전일비표시'] = changes
+        digits = [''.join(ch for ch in value if ch.isdigit()) for value in changes]
+        missing['전일비'] = [not d for d in digits]
+        array['전일비'] = [(-int(d) if FALLING_CHANGE_RE.search(value) else int(d)) if d else 0
+                          for value, d in zip(changes, digits)]
+        array['등락률'] = pd.to_numeric(
+            pd.Series(columns[fields.index('등락률')]).str.replace(r'[%+,]', '', regex=True), errors='coerce'
+        ).to_numpy(dtype=np.float64)
+        return cls(array, missing)
+
+    def __len__(self) -> int:
+        return len(self.array)
+
+    def __getitem__(self, key):
+        """컬럼명이면 컬럼 배열, 슬라이스/마스크/인덱스 배열이면 부분 테이블을 반환합니다."""
+        if isinstance(key, str):
+            return self.array[key]
+        return Kospi200Table(np.atleast_1d(self.array[key]), np.atleast_1d(self.missing[key]))
+
+    def is_missing(self, column: str) -> np.ndarray:
+        """컬럼의 결측 여부 (등락률은 NaN, 문자열/순위는 결측 없음)"""
+        if column in self.MISSING_DTYPE.names:
+            return self.missing[column]
+        if self.array.dtype[column].kind == 'f':
+            return np.isnan(self.array[column])
+        return np.zeros(len(self.array), dtype=np.bool_)
+
+    def sort_by(self, column: str, descending: bool = False) -> 'Kospi200Table':
+        """컬럼 기준으로 정렬한 테이블을 반환합니다 (결측값은 방향과 관계없이 맨 뒤, 같은 값은 원래 순서)."""
+        values = self.array[column]
+        if descending:
+            # 뒤집으면 같은 값의 순서도 뒤집히므로, 값의 순위를 음수로 바꿔 안정 정렬한다 (문자열 컬럼 포함)
+            ranks = np.unique(values, return_inverse=True)[1]
+            order = np.argsort(-ranks, kind='stable')
+        else:
+            order = np.argsort(values, kind='stable')
+        missing = self.is_missing(column)[order]
+        return self[np.concatenate([order[~missing], order[missing]])]
+
+    def to_frame(self) -> pd.DataFrame:
+        """pandas DataFrame으로 변환합니다 (결측값은 <NA>, 전일비표시 원문은 제외해 스냅샷 스키마를 유지)."""
+        frame = pd.DataFrame(self.array).drop(columns='전일비표시')
+        for column in self.NULLABLE_COLUMNS:
+            frame[column] = pd.arrays.IntegerArray(self.array[column], self.missing[column].copy())
+        frame['등락률'] = frame['등락률'].astype('Float64')
+        return frame
+
+    def formatted_columns(self) -> Dict[str, list]:
+        """출력용 컬럼을 만듭니다 (전일비는 페이지 원문, 결측은 빈 칸)."""
+        a = self.array
+        rates = a['등락률']
+        columns = {
+            '순위': a['순위'].tolist(),
+            '종목명': a['종목명'].tolist(),
+            '종목코드': a['종목코드'].tolist(),
+            '전일비': a['전일비표시'].tolist(),
+            '등락률': ['' if rate != rate else f"{rate:+.2f}%" for rate in rates.tolist()],
+        }
+        for column in ('현재가', '거래량', '거래대금', '시가총액'):
+            values = a[column].tolist()
+            if self.missing[column].any():
+                values = ['' if missing else value for value, missing in zip(values, self.missing[column].tolist())]
+            columns[column] = values
+        return columns
+
+    def format_lines(self) -> List[str]:
+        """고정폭 표 형식의 행 문자열을 만듭니다."""
+        formatted = self.formatted_columns()
+        line_format = self.line_format().format
+        return [line_format(*values) for values in zip(*(formatted[column] for column in self.COLUMNS))]
+
+    @classmethod
+    def line_format(cls) -> str:
+        return ' '.join(f"{{:<{width}}}" for width in cls.WIDTHS)
+
+    @classmethod
+    def header_line(cls) -> str:
+        return cls.line_format().format(*cls.COLUMNS)
+
+
+class HostRateLimiter:
+    """호스트별 최소 요청 간격을 지키는 스레드 안전 요청 제한기"""
+
+    def __init__(self, requests_per_second: float = 5.0):
+        self.interval = 1.0 / requests_per_second if requests_per_second else 0.0
+        self._lock = threading.Lock()
+        self._next_slot = {}
+
+    def wait(self, url: str):
+        """url 호스트의 다음 요청 가능 시각까지 대기합니다."""
+        host = urlparse(url).netloc
+        with self._lock:
+            now = time.monotonic()
+            slot = max(now, self._next_slot.get(host, now))
+            self._next_slot[host] = slot + self.interval
+        if slot > now:
+            time.sleep(slot - now)
+
+
 class Kospi200Crawler:
-    def __init__(self):
-        """코스피200 크롤러 초기화"""
+    ENTRY_URL = "https://finance.naver.com/sise/entryJongmok.naver?type=KPI200"
+
+    def __init__(self, max_workers: int = 4, requests_per_second: float = 5.0,
+                 use_cache: bool = True, cache: Optional[HttpCache] = None):
+        """
+        코스피200 크롤러 초기화
+
+        Args:
+            max_workers (int): 페이지 동시 요청 수
+            requests_per_second (float): 호스트별 초당 최대 요청 수
+            use_cache (bool): HTTP 디스크 캐시(조건부 GET) 사용 여부
+            cache (HttpCache): 사용할 캐시 (None이면 스크래퍼 공용 기본 캐시)
+        """
         self.headers = {
             'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36',
             'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8',
@@ -23,45 +356,74 @@ class Kospi200Crawler:
             'Upgrade-Insecure-Requests': '1',
         }
         self.base_url = "https://finance.naver.com/sise/sise_index.naver?code=KPI200"
+        self.max_workers = max_workers
+        self._column_maps = {}  # 헤더 구성 -> 컬럼 위치 맵 캐시
+        self.rate_limiter = HostRateLimiter(requests_per_second)
+        self.cache = (cache or default_cache()) if use_cache else None
+
+        # 모든 페이지 요청이 공유하는 keep-alive 세션
+        self.session = requests.Session()
+        self.session.headers.update(self.headers)
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=max_workers)
+        self.session.mount('https://', adapter)
+        self.session.mount('http://', adapter)
     
-    def get_kospi200_data(self) -> List[Dict[str, str]]:
+    def get_kospi200_data(self, all_pages: bool = True) -> Kospi200Table:
         """
         코스피200 편입종목상위 데이터를 크롤링합니다.
+
+        Args:
+            all_pages (bool): 모든 페이지(전체 편입종목)를 수집할지 여부 (False면 첫 페이지만)
         
         Returns:
-            List[Dict[str, str]]: 편입종목 데이터 리스트
+            Kospi200Table: 편입종목 테이블 (순위 순, 실패 시 빈 테이블)
         """
         try:
             print("코스피200 편입종목상위 페이지에 접속 중...")
             
-            # 편입종목상위 페이지 URL 직접 사용
-            entry_url = "https://finance.naver.com/sise/entryJongmok.naver?type=KPI200"
-            
-            # 페이지 요청
-            response = requests.get(
-                entry_url, 
-                headers=self.headers,
-                timeout=10
-            )
-            response.raise_for_status()
-            
-            # HTML 파싱
-            soup = BeautifulSoup(response.content, 'html.parser')
-            
-            # 편입종목상위 테이블 찾기
-            stock_data = self._extract_stock_data(soup)
+            # 첫 페이지로 마지막 페이지 번호 확인
+            first_soup = self._fetch_page(1)
+            last_page = self._find_last_page(first_soup) if all_pages else 1
+
+            # 나머지 페이지는 동시에 요청 (동시 요청 수/호스트별 속도 제한)
+            soups = [first_soup]
+            if last_page > 1:
+                with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+                    soups.extend(executor.map(self._fetch_page, range(2, last_page + 1)))
+
+            # 페이지 순서대로 합치고 순위를 전체 기준으로 매김
+            rows = [row for soup in soups for row in self._extract_stock_data(soup)]
+            stock_data = Kospi200Table.from_rows(rows)
             
-            print(f"총 {len(stock_data)}개의 편입종목 데이터를 추출했습니다.")
+            print(f"총 {last_page}페이지에서 {len(stock_data)}개의 편입종목 데이터를 추출했습니다.")
             return stock_data
             
         except requests.RequestException as e:
             print(f"페이지 요청 중 오류 발생: {e}")
-            return []
+            return Kospi200Table.from_rows([])
         except Exception as e:
             print(f"데이터 추출 중 오류 발생: {e}")
-            return []
+            return Kospi200Table.from_rows([])
     
-    def _extract_stock_data(self, soup: BeautifulSoup) -> List[Dict[str, str]]:
+    def _fetch_page(self, page: int) -> BeautifulSoup:
+        """편입종목상위 페이지 하나를 공유 세션으로 요청해 파싱합니다."""
+        url = f"{self.ENTRY_URL}&page={page}"
+        self.rate_limiter.wait(url)
+        if self.cache is not None:
+            response = cached_get(url, session=self.session, cache=self.cache, timeout=10)
+        else:
+            response = self.session.get(url, timeout=10)
+        response.raise_for_status()
+        return make_soup(response.content, url)
+
+    def _find_last_page(self, soup: BeautifulSoup) -> int:
+        """페이지 네비게이션에서 마지막 페이지 번호를 찾습니다."""
+        last_link = soup.select_one('td.pgRR a[href]')
+        links = [last_link] if last_link else soup.select('table.Nnavi a[href]')
+        pages = [int(m.group(1)) for link in links for m in [re.search(r'page=(\d+)', link['href'])] if m]
+        return max(pages, default=1)
+
+    def _extract_stock_data(self, soup: BeautifulSoup) -> List[StockRow]:
         """
         HTML에서 편입종목 데이터를 추출합니다.
         
@@ -69,225 +431,252 @@ class Kospi200Crawler:
             soup (BeautifulSoup): 파싱된 HTML 객체
             
         Returns:
-            List[Dict[str, str]]: 편입종목 데이터 리스트
+            List[StockRow]: 편입종목 행 리스트 (오류 시 빈 리스트)
         """
-        stock_data = []
-        
         try:
-            # 편입종목상위 페이지에서 테이블 찾기
-            table = soup.find('table', class_='type_1')
-            if not table:
-                # 다른 테이블 클래스들 시도
-                for class_name in ['type_4', 'type_2', 'type_3', 'type_5']:
-                    table = soup.find('table', class_=class_name)
-                    if table:
-                        print(f"테이블을 찾았습니다: {class_name}")
-                        break
-            
-            if not table:
-                print("편입종목 테이블을 찾을 수 없습니다.")
-                # 디버깅을 위해 모든 테이블 정보 출력
-                tables = soup.find_all('table')
-                print(f"페이지에서 발견된 테이블 수: {len(tables)}")
-                for i, t in enumerate(tables):
-                    print(f"테이블 {i+1}: {t.get('class', 'No class')} - {t.get('summary', 'No summary')}")
-                return []
-            
-            print("편입종목상위 테이블을 찾았습니다.")
-            
-            # 테이블 행들 추출
-            rows = table.find_all('tr')
-            print(f"테이블에서 {len(rows)}개의 행을 찾았습니다.")
-            
-            # 데이터 행들 처리 (헤더와 빈 행 제외)
-            data_rows = []
-            for i, row in enumerate(rows):
-                cells = row.find_all('td')
-                
-                # 종목명 링크가 있는 행만 데이터 행으로 간주 (컬럼 수에 관계없이)
-                if len(cells) >= 3:  # 최소 3개 컬럼만 있으면 확인
-                    # 다양한 링크 패턴 시도
-                    stock_link = None
-                    link_patterns = [
-                        '/item/main.naver',
-                        '/item/',
-                        'main.naver'
-                    ]
-                    
-                    for pattern in link_patterns:
-                        stock_link = cells[0].find('a', href=lambda x: x and pattern in x)
-                        if stock_link:
-                            break
-                    
-                    if stock_link:
-                        data_rows.append(row)
-                    else:
-                        # 텍스트가 종목명처럼 보이는지 확인
-                        first_cell_text = cells[0].get_text(strip=True)
-                        if first_cell_text and len(first_cell_text) > 1 and not first_cell_text.replace('.', '').replace('%', '').replace(',', '').isdigit():
-                            data_rows.append(row)
-            
-            print(f"데이터 행 {len(data_rows)}개를 찾았습니다.")
-            
-            for i, row in enumerate(data_rows):
-                try:
-                    cells = row.find_all('td')
-                    
-                    # 종목명 추출 (링크 텍스트)
-                    stock_name_cell = cells[0]
-                    stock_name_link = stock_name_cell.find('a', href='/item/main.naver')
-                    stock_name = stock_name_link.get_text(strip=True) if stock_name_link else ''
-                    
-                    # 링크가 없으면 첫 번째 셀의 텍스트를 종목명으로 사용
-                    if not stock_name:
-                        stock_name = stock_name_cell.get_text(strip=True)
-                    
-                    # 기본값 설정
-                    current_price = ''
-                    change_text = ''
-                    change_direction = ''
-                    change_rate = ''
-                    volume = ''
-                    amount = ''
-                    market_cap = ''
-                    
-                    # 컬럼 수에 따라 데이터 추출
-                    if len(cells) >= 2:
-                        current_price = cells[1].get_text(strip=True)
-                    
-                    if len(cells) >= 3:
-                        change_cell = cells[2]
-                        change_text = change_cell.get_text(strip=True)
-                        # 하락/상승 아이콘 확인
-                        if change_cell.find('em', class_='bu_pdn'):
-                            change_direction = '▼'
-                        elif change_cell.find('em', class_='bu_pup'):
-                            change_direction = '▲'
-                        elif change_cell.find('em', class_='bu_pn'):
-                            change_direction = '='
-                    
-                    if len(cells) >= 4:
-                        change_rate = cells[3].get_text(strip=True)
-                    
-                    if len(cells) >= 5:
-                        volume = cells[4].get_text(strip=True)
-                    
-                    if len(cells) >= 6:
-                        amount = cells[5].get_text(strip=True)
-                    
-                    if len(cells) >= 7:
-                        market_cap = cells[6].get_text(strip=True)
-                    
-                    # 데이터 정리
-                    stock_info = {
-                        '순위': i + 1,
-                        '종목명': stock_name,
-                        '현재가': current_price.replace(',', '') if current_price else '',
-                        '전일비': f"{change_direction}{change_text}" if change_text else '',
-                        '등락률': change_rate if change_rate else '',
-                        '거래량': volume.replace(',', '') if volume else '',
-                        '거래대금': amount.replace(',', '') if amount else '',
-                        '시가총액': market_cap.replace(',', '') if market_cap else ''
-                    }
-                    
-                    # 종목명이 있는 경우만 추가
-                    if stock_info['종목명']:
-                        stock_data.append(stock_info)
-                    
-                except Exception as e:
-                    print(f"행 {i+1} 처리 중 오류: {e}")
-                    continue
-            
+            return self._decode_stock_table(soup)
         except Exception as e:
             print(f"테이블 데이터 추출 중 오류: {e}")
-        
-        return stock_data
+            return []
+
+    def _decode_stock_table(self, soup: BeautifulSoup) -> List[StockRow]:
+        """
+        편입종목 테이블을 한 번에 훑어 행마다 StockRow 로 변환합니다.
+
+        테이블은 한 번만 찾고, 헤더 행에서 만든 컬럼 위치 맵은 캐시해서 재사용합니다.
+
+        Args:
+            soup (BeautifulSoup): 파싱된 HTML 객체
+
+        Returns:
+            List[StockRow]: 테이블 순서대로의 종목 행
+        """
+        table = soup.find('table', class_=STOCK_TABLE_CLASSES[0])
+        if table is None:
+            table = soup.select_one(', '.join(f"table.{name}" for name in STOCK_TABLE_CLASSES[1:]))
+        if table is None:
+            print(f"편입종목 테이블을 찾을 수 없습니다. (페이지의 테이블 수: {len(soup.find_all('table'))})")
+            return []
+
+        columns = self._column_map(table)
+        name_index = columns['종목명']
+        change_index = columns.get('전일비')
+
+        rows = []
+        for tr in table.find_all('tr'):
+            cells = tr.find_all('td')
+            # 종목명 링크가 있거나 종목명처럼 보이는 텍스트가 있는 행만 데이터 행으로 간주
+            if len(cells) < 3 or name_index >= len(cells):
+                continue
+
+            texts = [cell.get_text(strip=True) for cell in cells]
+            stock_name = texts[name_index]
+            link = cells[name_index].a
+            href = link.get('href', '') if link else ''
+            if '/item/' not in href and 'main.naver' not in href:
+                if len(stock_name) <= 1 or stock_name.replace('.', '').replace('%', '').replace(',', '').isdigit():
+                    continue
+            if not stock_name:
+                continue
+
+            change_text = self._cell_text(texts, change_index)
+            change_direction = ''
+            if change_text and change_index is not None:
+                icon = cells[change_index].em
+                for class_name in (icon.get('class', []) if icon else []):
+                    if class_name in CHANGE_DIRECTIONS:
+                        change_direction = CHANGE_DIRECTIONS[class_name]
+                        break
+
+            rows.append(StockRow(
+                종목명=stock_name,
+                종목코드=href.partition('code=')[2].partition('&')[0],
+                현재가=self._cell_text(texts, columns.get('현재가')).replace(',', ''),
+                전일비=f"{change_direction}{change_text}" if change_text else '',
+                등락률=self._cell_text(texts, columns.get('등락률')),
+                거래량=self._cell_text(texts, columns.get('거래량')).replace(',', ''),
+                거래대금=self._cell_text(texts, columns.get('거래대금')).replace(',', ''),
+                시가총액=self._cell_text(texts, columns.get('시가총액')).replace(',', ''),
+            ))
+
+        return rows
+
+    def _column_map(self, table) -> Dict[str, int]:
+        """헤더 행으로 필드명 -> 컬럼 위치 맵을 만듭니다 (헤더 구성별로 캐시)."""
+        header_cell = table.find('th')
+        labels = tuple(th.get_text(strip=True) for th in header_cell.parent.find_all('th')) if header_cell else ()
+
+        columns = self._column_maps.get(labels)
+        if columns is None:
+            columns = dict(DEFAULT_COLUMN_MAP)
+            for index, label in enumerate(labels):
+                for prefix, field in HEADER_FIELDS:
+                    if label.startswith(prefix):
+                        columns[field] = index
+                        break
+            self._column_maps[labels] = columns
+        return columns
+
+    @staticmethod
+    def _cell_text(texts: List[str], index: Optional[int]) -> str:
+        return texts[index] if index is not None and index < len(texts) else ''
+
+    def benchmark_extract(self, fixture_path: str = "kospi200_entry_fixture.html", repeat: int = 1000) -> float:
+        """
+        저장된 편입종목 페이지로 행 추출 속도를 측정합니다.
+
+        Args:
+            fixture_path (str): 저장된 HTML 파일 경로
+            repeat (int): 반복 횟수
+
+        Returns:
+            float: 초당 처리한 행 수
+        """
+        with open(fixture_path, 'rb') as f:
+            soup = make_soup(f.read(), self.ENTRY_URL)
+
+        rows = 0
+        start = time.perf_counter()
+        for _ in range(repeat):
+            rows += len(Kospi200Table.from_rows(self._extract_stock_data(soup)))
+        elapsed = time.perf_counter() - start
+
+        rows_per_second = rows / elapsed if elapsed else float('inf')
+        print(f"{fixture_path}: {repeat}회, {rows}행, {elapsed:.3f}초 ({rows_per_second:,.0f}행/초)")
+        return rows_per_second
     
-    def save_to_csv(self, data: List[Dict[str, str]], filename: str = "kospi200_top_stocks.csv"):
+    def save_to_csv(self, data: Kospi200Table, filename: str = "kospi200_top_stocks.csv"):
         """
         크롤링 결과를 CSV 파일로 저장합니다.
         
         Args:
-            data (List[Dict[str, str]]): 크롤링 결과
+            data (Kospi200Table): 크롤링 결과
             filename (str): 저장할 파일명
         """
         try:
-            if not data:
+            if not len(data):
                 print("저장할 데이터가 없습니다.")
                 return
             
-            # CSV 파일에 저장
+            # CSV 파일에 저장 (컬럼 단위로 포맷한 뒤 행으로 묶어 한 번에 기록)
+            formatted = data.formatted_columns()
             with open(filename, 'w', newline='', encoding='utf-8-sig') as csvfile:
-                fieldnames = ['순위', '종목명', '현재가', '전일비', '등락률', '거래량', '거래대금', '시가총액']
-                writer = csv.DictWriter(csvfile, fieldnames=fieldnames)
-                
-                # 헤더 작성
-                writer.writeheader()
-                
-                # 데이터 작성
-                for stock in data:
-                    writer.writerow(stock)
+                writer = csv.writer(csvfile)
+                writer.writerow(Kospi200Table.COLUMNS)
+                writer.writerows(zip(*(formatted[column] for column in Kospi200Table.COLUMNS)))
             
             print(f"데이터가 {filename} 파일에 저장되었습니다.")
             
         except Exception as e:
             print(f"CSV 파일 저장 중 오류 발생: {e}")
     
-    def save_to_txt(self, data: List[Dict[str, str]], filename: str = "kospi200_top_stocks.txt"):
+    def save_to_txt(self, data: Kospi200Table, filename: str = "kospi200_top_stocks.txt"):
         """
         크롤링 결과를 텍스트 파일로 저장합니다.
         
         Args:
-            data (List[Dict[str, str]]): 크롤링 결과
+            data (Kospi200Table): 크롤링 결과
             filename (str): 저장할 파일명
         """
         try:
             with open(filename, 'w', encoding='utf-8') as f:
                 f.write("코스피200 편입종목상위 데이터\n")
                 f.write("=" * 100 + "\n")
-                f.write(f"{'순위':<4} {'종목명':<12} {'현재가':<10} {'전일비':<10} {'등락률':<8} {'거래량':<12} {'거래대금':<10} {'시가총액':<10}\n")
+                f.write(Kospi200Table.header_line() + "\n")
                 f.write("-" * 100 + "\n")
-                
-                for stock in data:
-                    f.write(f"{stock['순위']:<4} {stock['종목명']:<12} {stock['현재가']:<10} {stock['전일비']:<10} {stock['등락률']:<8} {stock['거래량']:<12} {stock['거래대금']:<10} {stock['시가총액']:<10}\n")
+                f.writelines(line + "\n" for line in data.format_lines())
             
             print(f"데이터가 {filename} 파일에 저장되었습니다.")
             
         except Exception as e:
             print(f"텍스트 파일 저장 중 오류 발생: {e}")
     
-    def display_data(self, data: List[Dict[str, str]], limit: int = 20):
+    def display_data(self, data: Kospi200Table, limit: int = 20):
         """
         크롤링 결과를 콘솔에 출력합니다.
         
         Args:
-            data (List[Dict[str, str]]): 크롤링 결과
+            data (Kospi200Table): 크롤링 결과
             limit (int): 출력할 최대 개수
         """
-        if not data:
+        if not len(data):
             print("표시할 데이터가 없습니다.")
             return
         
         print(f"\n코스피200 편입종목상위 데이터 (상위 {min(limit, len(data))}개)")
         print("=" * 100)
-        print(f"{'순위':<4} {'종목명':<12} {'현재가':<10} {'전일비':<10} {'등락률':<8} {'거래량':<12} {'거래대금':<10} {'시가총액':<10}")
+        print(Kospi200Table.header_line())
         print("-" * 100)
-        
-        for i, stock in enumerate(data[:limit]):
-            print(f"{stock['순위']:<4} {stock['종목명']:<12} {stock['현재가']:<10} {stock['전일비']:<10} {stock['등락률']:<8} {stock['거래량']:<12} {stock['거래대금']:<10} {stock['시가총액']:<10}")
+        print("\n".join(data[:limit].format_lines()))
+
+    def run_snapshot_scheduler(self, store: Kospi200SnapshotStore, interval: int = 60,
+                               market_open: dtime = dtime(9, 0), market_close: dtime = dtime(15, 30),
+                               max_snapshots: Optional[int] = None) -> int:
+        """
+        장중에 주기적으로 스냅샷을 수집해 저장소에 추가합니다.
+
+        장 시작 전이면 시작 시각까지 기다리고, 장 마감 후나 주말에는 종료합니다.
+
+        Args:
+            store (Kospi200SnapshotStore): 스냅샷 저장소
+            interval (int): 수집 간격(초)
+            market_open (time): 장 시작 시각
+            market_close (time): 장 마감 시각
+            max_snapshots (int): 최대 수집 횟수 (None이면 장 마감까지)
+
+        Returns:
+            int: 저장한 스냅샷 수
+        """
+        saved = 0
+        while max_snapshots is None or saved < max_snapshots:
+            now = datetime.now()
+            if now.weekday() >= 5 or now.time() > market_close:
+                print("장 운영 시간이 아니므로 스냅샷 수집을 종료합니다.")
+                break
+            if now.time() < market_open:
+                wait_seconds = (datetime.combine(now.date(), market_open) - now).total_seconds()
+                print(f"장 시작까지 {wait_seconds:.0f}초 대기합니다.")
+                time.sleep(wait_seconds)
+                continue
+
+            started = time.monotonic()
+            stock_data = self.get_kospi200_data()
+            if len(stock_data):
+                path = store.append(stock_data, now)
+                saved += 1
+                print(f"[{now:%H:%M:%S}] 스냅샷 {saved}회 저장: {path}")
+
+            time.sleep(max(0.0, interval - (time.monotonic() - started)))
+        return saved
 
 def main():
     """메인 함수"""
+    parser = argparse.ArgumentParser(description="네이버 코스피200 편입종목상위 크롤러")
+    parser.add_argument("--schedule", action="store_true", help="장중 주기적 스냅샷 수집 모드")
+    parser.add_argument("--interval", type=int, default=60, help="스냅샷 수집 간격(초)")
+    parser.add_argument("--store", default="kospi200_snapshots", help="스냅샷 저장 폴더")
+    parser.add_argument("--no-cache", action="store_true", help="HTTP 디스크 캐시를 쓰지 않고 항상 전체 페이지를 받음")
+    parser.add_argument("--benchmark", metavar="HTML", help="저장된 페이지로 행 추출 속도만 측정")
+    args = parser.parse_args()
+
     print("네이버 코스피200 편입종목상위 크롤러를 시작합니다.")
     print("=" * 60)
     
     # 크롤러 인스턴스 생성
-    crawler = Kospi200Crawler()
+    crawler = Kospi200Crawler(use_cache=not args.no_cache)
+
+    if args.benchmark:
+        crawler.benchmark_extract(args.benchmark)
+        return
+
+    if args.schedule:
+        crawler.run_snapshot_scheduler(Kospi200SnapshotStore(args.store), interval=args.interval)
+        return
     
     # 데이터 크롤링
     stock_data = crawler.get_kospi200_data()
     
-    if not stock_data:
+    if not len(stock_data):
         print("데이터를 가져올 수 없습니다. 페이지 구조가 변경되었을 수 있습니다.")
         return
     
@@ -1,19 +1,241 @@
+import argparse
+import asyncio
+import csv
+import functools
+import itertools
 import os
+import queue
 import sqlite3
 import random
+import shutil
 import string
+import tempfile
+import threading
 import time
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from contextlib import contextmanager
+from pathlib import Path
+
+from sqlite_tuning import QueryTimer, TimedConnection, apply_profile, is_read_only
+
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+    HAVE_PYARROW = True
+except ImportError:
+    HAVE_PYARROW = False
+
+try:
+    import xlsxwriter
+    HAVE_XLSXWRITER = True
+except ImportError:
+    HAVE_XLSXWRITER = False
+
+# 보조 인덱스: 이름 -> 컬럼 정의 (대량 적재 시에는 적재 후에 한 번에 만든다)
+SECONDARY_INDEXES = {
+    "idx_products_price": "productPrice",
+    "idx_products_name": "productName COLLATE NOCASE",
+}
+
+PRICE_RANGE = range(100, 10001)
+
+# 부분 문자열 검색용 FTS5 테이블과 Products 동기화 트리거 (trigram: SQLite 3.34+)
+FULLTEXT_SCHEMA = (
+    """
+    CREATE VIRTUAL TABLE IF NOT EXISTS ProductsFTS USING fts5(
+        productName, content='Products', content_rowid='productID', tokenize='trigram'
+    )
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS products_fts_insert AFTER INSERT ON Products BEGIN
+        INSERT INTO ProductsFTS(rowid, productName) VALUES (new.productID, new.productName);
+    END
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS products_fts_delete AFTER DELETE ON Products BEGIN
+        INSERT INTO ProductsFTS(ProductsFTS, rowid, productName) VALUES ('delete', old.productID, old.productName);
+    END
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS products_fts_update AFTER UPDATE OF productName ON Products BEGIN
+        INSERT INTO ProductsFTS(ProductsFTS, rowid, productName) VALUES ('delete', old.productID, old.productName);
+        INSERT INTO ProductsFTS(rowid, productName) VALUES (new.productID, new.productName);
+    END
+    """,
+)
+
+SEARCH_ORDERS = {
+    "id": "productID",
+    "name": "productName COLLATE NOCASE, productID",
+    "price": "productPrice, productID",
+    "price_desc": "productPrice DESC, productID",
+}
+
+
+def _chunked(iterable, size):
+    """iterable 을 size 개씩 리스트로 나눕니다 (마지막 묶음은 짧을 수 있다)."""
+    iterator = iter(iterable)
+    while True:
+        chunk = list(itertools.islice(iterator, size))
+        if not chunk:
+            return
+        yield chunk
+
+
+def _like_prefix(prefix):
+    """LIKE 접두어 패턴 (%, _ 는 문자 그대로 검색)"""
+    return prefix.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_") + "%"
+
+
+def generate_products(total, start_id=1, name_prefix="Product", chunk_size=100_000):
+    """
+    (productID, productName, productPrice) 튜플을 하나씩 생성합니다.
+    가격은 chunk_size 개씩 random.choices 로 한 번에 뽑는다.
+    """
+    end_id = start_id + total
+    for chunk_start in range(start_id, end_id, chunk_size):
+        chunk_end = min(chunk_start + chunk_size, end_id)
+        prices = random.choices(PRICE_RANGE, k=chunk_end - chunk_start)
+        for pid, pprice in zip(range(chunk_start, chunk_end), prices):
+            yield (pid, f"{name_prefix}_{pid}", pprice)
+
+
+class ProductCache:
+    """
+    productID -> 행 튜플 LRU 캐시 (스레드 안전, 항목별 TTL).
+    존재하는 행만 담는다 (없는 ID 는 매번 DB 에서 확인).
+    무효화할 때마다 version 이 올라가며, 읽기 전에 받아 둔 version 과 다르면
+    put() 은 채우지 않는다 (읽는 사이 커밋된 쓰기의 무효화보다 늦게 옛 행을 넣지 않도록).
+    """
+
+    def __init__(self, max_entries=10_000, ttl=60.0):
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self.hits = 0
+        self.misses = 0
+        self.version = 0
+        self._entries = OrderedDict()  # productID -> (만료 시각, 행)
+        self._lock = threading.Lock()
+
+    def get(self, productID):
+        with self._lock:
+            entry = self._entries.get(productID)
+            if entry is None or entry[0] < time.monotonic():
+                if entry is not None:
+                    del self._entries[productID]
+                self.misses += 1
+                return None
+            self._entries.move_to_end(productID)
+            self.hits += 1
+            return entry[1]
+
+    def put(self, productID, row, version=None):
+        with self._lock:
+            if version is not None and version != self.version:
+                return False
+            self._entries[productID] = (time.monotonic() + self.ttl, row)
+            self._entries.move_to_end(productID)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+            return True
+
+    def invalidate(self, productIDs):
+        with self._lock:
+            self.version += 1
+            for productID in productIDs:
+                self._entries.pop(productID, None)
+
+    def clear(self):
+        with self._lock:
+            self.version += 1
+            self._entries.clear()
+
+    def stats(self):
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {"hits": self.hits, "misses": self.misses, "size": len(self._entries),
+                    "hit_rate": self.hits / lookups if lookups else 0.0}
+
 
 class ProductDB:
-    def __init__(self, db_path=None):
+    def __init__(self, db_path=None, reuse_connections=False, cached_statements=256,
+                 cache_size=0, cache_ttl=60.0, profile=None, query_timer=None):
+        """
+        reuse_connections=True 이면 스레드마다 연결 하나를 열어 두고 계속 재사용한다
+        (호출마다 connect 하는 비용과 페이지 캐시 초기화가 없어진다). 다 쓰면 close().
+        cache_size > 0 이면 select(productID=...) 앞에 LRU+TTL 캐시를 두고,
+        update/delete/*_many 가 커밋 후 해당 ID 를 무효화한다.
+        profile 은 새 연결마다 적용할 sqlite_tuning 프로파일 ('oltp', 'bulk_load', 'read_only'),
+        'read_only' 이면 스키마/인덱스를 만들지 않으며 (기존 DB 전용) 대량 삽입을 거부한다.
+        query_timer(QueryTimer)를 주면 모든 연결의 문장별 지연을 기록한다 (대량 적재 연결 제외).
+        """
         self.db_path = db_path or os.path.join(os.getcwd(), "MyProduct.db")
-        self._ensure_db()
+        self.reuse_connections = reuse_connections
+        self.cached_statements = cached_statements
+        self.profile = profile
+        self.read_only = is_read_only(profile)
+        self.query_timer = query_timer
+        self.cache = ProductCache(cache_size, cache_ttl) if cache_size else None
+        self._local = threading.local()
+        self._open_connections = []
+        self._pool_lock = threading.Lock()
+        self._generation = 0  # close() 할 때마다 증가 -> 스레드별 연결을 새로 연다
+        if not self.read_only:
+            self._ensure_db()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
 
-    def _connect(self):
-        return sqlite3.connect(self.db_path)
+    def close(self):
+        """재사용 중인 연결을 모두 닫습니다 (이후 호출은 새 연결을 연다)."""
+        with self._pool_lock:
+            self._generation += 1
+            connections, self._open_connections = self._open_connections, []
+        for conn in connections:
+            conn.close()
+
+    def _connect(self, timed=True, **kwargs):
+        timed = timed and self.query_timer is not None
+        conn = sqlite3.connect(self.db_path, cached_statements=self.cached_statements,
+                               factory=TimedConnection if timed else sqlite3.Connection, **kwargs)
+        if self.profile:
+            apply_profile(conn, self.profile)
+        if timed:
+            self.query_timer.attach(conn)
+        return conn
+
+    def _thread_connection(self):
+        conn = getattr(self._local, "conn", None)
+        if conn is None or self._local.generation != self._generation:
+            # 연결은 만든 스레드만 쓰지만 close() 는 다른 스레드에서 할 수 있게 한다
+            conn = self._connect(check_same_thread=False)
+            with self._pool_lock:
+                self._open_connections.append(conn)
+                self._local.generation = self._generation
+            self._local.conn = conn
+        return conn
+
+    @contextmanager
+    def _conn(self):
+        """트랜잭션 범위의 연결 (재사용 모드가 아니면 끝나고 닫는다)."""
+        if self.reuse_connections:
+            conn = self._thread_connection()
+            with conn:
+                yield conn
+            return
+        conn = self._connect()
+        try:
+            with conn:
+                yield conn
+        finally:
+            conn.close()
 
     def _ensure_db(self):
-        with self._connect() as conn:
+        with self._conn() as conn:
             cur = conn.cursor()
             cur.execute(
                 """
@@ -25,28 +247,73 @@ class ProductDB:
                 """
             )
             conn.commit()
+        self.ensure_indexes()
+
+    def ensure_indexes(self):
+        """검색용 보조 인덱스(가격 B-tree, 이름 NOCASE)를 만듭니다."""
+        with self._conn() as conn:
+            self._create_indexes(conn)
+
+    def enable_fulltext(self):
+        """
+        상품명 부분 문자열 검색용 FTS5 테이블과 동기화 트리거를 만들고 기존 행을 색인합니다.
+
+        Returns:
+            bool: FTS5(trigram)를 쓸 수 있으면 True
+        """
+        try:
+            with self._conn() as conn:
+                created = not self._has_fulltext(conn)
+                for statement in FULLTEXT_SCHEMA:
+                    conn.execute(statement)
+                if created:
+                    conn.execute("INSERT INTO ProductsFTS(ProductsFTS) VALUES ('rebuild')")
+            return True
+        except sqlite3.OperationalError:
+            return False
+
+    @staticmethod
+    def _has_fulltext(conn):
+        return conn.execute(
+            "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'ProductsFTS'"
+        ).fetchone() is not None
 
     def insert(self, productID, productName, productPrice):
-        with self._connect() as conn:
-            cur = conn.cursor()
-            try:
-                cur.execute(
-                    "INSERT INTO Products (productID, productName, productPrice) VALUES (?, ?, ?)",
-                    (productID, productName, productPrice),
-                )
-                conn.commit()
-                return True
-            except sqlite3.IntegrityError:
-                return False
+        with self._conn() as conn:
+            inserted = self._insert_row(conn.cursor(), productID, productName, productPrice)
+            conn.commit()
+            return inserted
+
+    @staticmethod
+    def _insert_row(cur, productID, productName, productPrice):
+        """커밋 없이 한 행을 삽입합니다 (ID 중복이면 False)."""
+        try:
+            cur.execute(
+                "INSERT INTO Products (productID, productName, productPrice) VALUES (?, ?, ?)",
+                (productID, productName, productPrice),
+            )
+            return True
+        except sqlite3.IntegrityError:
+            return False
 
-    def bulk_insert(self, total=100_000, start_id=1, batch_size=1000, name_prefix="Product"):
+    def bulk_insert(self, total=100_000, start_id=1, batch_size=1000, name_prefix="Product",
+                    fast=False, build_indexes=False):
         """
         빠른 대량 삽입: total 개수 생성. batch_size 단위로 커밋.
         각 항목: (productID, productName, productPrice)
+
+        fast=True 이면 'bulk_load' 프로파일(WAL, synchronous=OFF, 큰 cache_size)을 걸고
+        생성기를 executemany 에 바로 넘겨 전체를 한 트랜잭션으로 적재한다 (batch_size 무시).
+        build_indexes=True 이면 보조 인덱스를 적재 전에 지우고 적재 후에 다시 만든다.
         """
+        if self.read_only:
+            raise ValueError(f"'{self.profile}' 프로파일에서는 삽입할 수 없습니다.")
+        if fast:
+            return self._bulk_load(total, start_id, name_prefix, build_indexes)
+
         start_time = time.time()
         inserted = 0
-        with self._connect() as conn:
+        with self._conn() as conn:
             cur = conn.cursor()
             for batch_start in range(start_id, start_id + total, batch_size):
                 batch = []
@@ -62,9 +329,113 @@ class ProductDB:
                 conn.commit()
                 inserted += len(batch)
         elapsed = time.time() - start_time
-        return {"inserted": inserted, "elapsed_seconds": elapsed}
+        return {"inserted": inserted, "elapsed_seconds": elapsed,
+                "rows_per_second": inserted / elapsed if elapsed else None}
+
+    def _bulk_load(self, total, start_id, name_prefix, build_indexes):
+        """대량 적재 모드: 단일 트랜잭션 + 생성기 executemany (inserted 는 실제 삽입된 행 수)"""
+        start_time = time.time()
+        conn = self._connect(timed=False)  # 적재 연결에는 측정을 붙이지 않는다 (반환값의 elapsed_seconds 로 충분)
+        try:
+            apply_profile(conn, "bulk_load")
+            if build_indexes:
+                for name in SECONDARY_INDEXES:
+                    conn.execute(f"DROP INDEX IF EXISTS {name}")
+
+            before = conn.total_changes
+            with conn:
+                conn.executemany(
+                    "INSERT OR IGNORE INTO Products (productID, productName, productPrice) VALUES (?, ?, ?)",
+                    generate_products(total, start_id, name_prefix),
+                )
+            inserted = conn.total_changes - before
+            load_elapsed = time.time() - start_time
+
+            if build_indexes:
+                self._create_indexes(conn)
+        finally:
+            conn.close()
+
+        elapsed = time.time() - start_time
+        return {"inserted": inserted, "elapsed_seconds": elapsed,
+                "rows_per_second": inserted / load_elapsed if load_elapsed else None}
+
+    def _create_indexes(self, conn):
+        with conn:
+            for name, column in SECONDARY_INDEXES.items():
+                conn.execute(f"CREATE INDEX IF NOT EXISTS {name} ON Products ({column})")
+
+    def upsert_many(self, rows, chunk_size=5000):
+        """
+        (productID, productName, productPrice) 행들을 삽입하거나, 이미 있으면 갱신합니다.
+        값이 같은 행은 건드리지 않으며, chunk_size 개마다 한 트랜잭션으로 커밋한다.
+
+        Returns:
+            dict: {"affected": 전체 변경 행 수, "batches": 묶음별 변경 행 수, "elapsed_seconds": 소요 시간}
+        """
+        return self._run_batches(
+            """
+            INSERT INTO Products (productID, productName, productPrice) VALUES (?, ?, ?)
+            ON CONFLICT(productID) DO UPDATE SET
+                productName = excluded.productName,
+                productPrice = excluded.productPrice
+            WHERE productName IS NOT excluded.productName OR productPrice IS NOT excluded.productPrice
+            """,
+            rows, chunk_size, key_index=0,
+        )
+
+    def update_many(self, rows, chunk_size=5000):
+        """
+        (productID, productName, productPrice) 행들로 기존 상품을 갱신합니다.
+        productName/productPrice 가 None 이면 그 컬럼은 그대로 둔다.
+
+        Returns:
+            dict: upsert_many 와 같은 형식
+        """
+        return self._run_batches(
+            """
+            UPDATE Products SET
+                productName = COALESCE(?, productName),
+                productPrice = COALESCE(?, productPrice)
+            WHERE productID = ?
+            """,
+            ((name, price, pid) for pid, name, price in rows), chunk_size, key_index=2,
+        )
+
+    def delete_many(self, productIDs, chunk_size=5000):
+        """
+        productID 목록의 상품을 삭제합니다.
+
+        Returns:
+            dict: upsert_many 와 같은 형식
+        """
+        return self._run_batches(
+            "DELETE FROM Products WHERE productID = ?",
+            ((pid,) for pid in productIDs), chunk_size, key_index=0,
+        )
+
+    def _run_batches(self, sql, params, chunk_size, key_index):
+        start_time = time.time()
+        batches = []
+        with self._conn() as conn:
+            for chunk in _chunked(params, chunk_size):
+                with conn:
+                    batches.append(conn.executemany(sql, chunk).rowcount)
+                self._invalidate(row[key_index] for row in chunk)
+        return {"affected": sum(batches), "batches": batches, "elapsed_seconds": time.time() - start_time}
 
     def update(self, productID, productName=None, productPrice=None):
+        if productName is None and productPrice is None:
+            return False
+        with self._conn() as conn:
+            updated = self._update_row(conn.cursor(), productID, productName, productPrice)
+            conn.commit()
+            self._invalidate((productID,))
+            return updated
+
+    @staticmethod
+    def _update_row(cur, productID, productName=None, productPrice=None):
+        """커밋 없이 한 행을 갱신합니다."""
         if productName is None and productPrice is None:
             return False
         parts = []
@@ -77,25 +448,42 @@ class ProductDB:
             params.append(productPrice)
         params.append(productID)
         sql = f"UPDATE Products SET {', '.join(parts)} WHERE productID = ?"
-        with self._connect() as conn:
-            cur = conn.cursor()
-            cur.execute(sql, params)
-            conn.commit()
-            return cur.rowcount > 0
+        cur.execute(sql, params)
+        return cur.rowcount > 0
 
     def delete(self, productID):
-        with self._connect() as conn:
-            cur = conn.cursor()
-            cur.execute("DELETE FROM Products WHERE productID = ?", (productID,))
+        with self._conn() as conn:
+            deleted = self._delete_row(conn.cursor(), productID)
             conn.commit()
-            return cur.rowcount > 0
+            self._invalidate((productID,))
+            return deleted
+
+    @staticmethod
+    def _delete_row(cur, productID):
+        """커밋 없이 한 행을 삭제합니다."""
+        cur.execute("DELETE FROM Products WHERE productID = ?", (productID,))
+        return cur.rowcount > 0
+
+    def _invalidate(self, productIDs):
+        # insert/bulk_insert 는 기존 행을 바꾸지 않고 캐시에는 있는 행만 있으므로 무효화가 필요 없다
+        if self.cache is not None:
+            self.cache.invalidate(productIDs)
 
     def select(self, productID=None, limit=None, offset=None):
-        with self._connect() as conn:
+        version = None
+        if productID is not None and self.cache is not None:
+            row = self.cache.get(productID)
+            if row is not None:
+                return row
+            version = self.cache.version  # 읽기 전에 받아 두고, 그 사이 무효화가 있었으면 채우지 않는다
+        with self._conn() as conn:
             cur = conn.cursor()
             if productID is not None:
                 cur.execute("SELECT productID, productName, productPrice FROM Products WHERE productID = ?", (productID,))
-                return cur.fetchone()
+                row = cur.fetchone()
+                if row is not None and self.cache is not None:
+                    self.cache.put(productID, row, version)
+                return row
             sql = "SELECT productID, productName, productPrice FROM Products"
             params = []
             if limit is not None:
@@ -107,21 +495,722 @@ class ProductDB:
             cur.execute(sql, params)
             return cur.fetchall()
 
+    def select_page(self, after_id=0, page_size=1000):
+        """
+        키셋 페이지네이션: productID 가 after_id 보다 큰 행을 page_size 개 반환합니다.
+        OFFSET 과 달리 페이지 깊이와 무관하게 기본키 탐색 한 번으로 시작 위치를 찾는다.
+        다음 페이지는 select_page(after_id=rows[-1][0]) 로 요청한다.
+        """
+        with self._conn() as conn:
+            cur = conn.execute(
+                "SELECT productID, productName, productPrice FROM Products"
+                " WHERE productID > ? ORDER BY productID LIMIT ?",
+                (after_id, page_size),
+            )
+            return cur.fetchall()
+
+    def iter_products(self, after_id=0, arraysize=1000):
+        """
+        전체(또는 after_id 이후) 행을 productID 순으로 하나씩 내보내는 생성기.
+        fetchmany 로 arraysize 개씩 읽으므로 메모리에는 한 묶음만 올라간다.
+        """
+        with self._conn() as conn:
+            cur = conn.cursor()
+            cur.arraysize = arraysize
+            cur.execute(
+                "SELECT productID, productName, productPrice FROM Products"
+                " WHERE productID > ? ORDER BY productID",
+                (after_id,),
+            )
+            while True:
+                rows = cur.fetchmany()
+                if not rows:
+                    break
+                yield from rows
+
+    def search_by_name_prefix(self, prefix, limit=100):
+        """상품명이 prefix 로 시작하는 행 (대소문자 무시, 이름순)"""
+        return self.search(name_prefix=prefix, order_by="name", limit=limit)
+
+    def search_price_range(self, min_price=None, max_price=None, limit=100, descending=False):
+        """가격이 min_price 이상 max_price 이하인 행 (가격순)"""
+        return self.search(min_price=min_price, max_price=max_price,
+                           order_by="price_desc" if descending else "price", limit=limit)
+
+    def search_by_name_contains(self, text, limit=100):
+        """
+        상품명에 text 가 들어 있는 행. FTS5 테이블이 있고 text 가 3자 이상이면 trigram 색인을,
+        아니면 LIKE 전체 검색을 쓴다.
+        """
+        return self.search(name_contains=text, order_by="id", limit=limit)
+
+    def search(self, name_prefix=None, name_contains=None, min_price=None, max_price=None,
+               order_by="id", limit=100):
+        """
+        조건을 조합한 검색. 지정한 조건만 WHERE 에 AND 로 붙는다.
+
+        Args:
+            name_prefix (str): 상품명 접두어 (대소문자 무시)
+            name_contains (str): 상품명 부분 문자열
+            min_price (int): 최저 가격 (포함)
+            max_price (int): 최고 가격 (포함)
+            order_by (str): SEARCH_ORDERS 의 키 ('id', 'name', 'price', 'price_desc')
+            limit (int): 최대 행 수 (None이면 제한 없음)
+
+        Returns:
+            list: (productID, productName, productPrice) 튜플 목록
+        """
+        if order_by not in SEARCH_ORDERS:
+            raise ValueError(f"지원하지 않는 정렬: {order_by}")
+
+        with self._conn() as conn:
+            parts = []
+            params = []
+            if name_prefix is not None:
+                parts.append("productName LIKE ? ESCAPE '\\'")
+                params.append(_like_prefix(name_prefix))
+            if name_contains is not None:
+                if len(name_contains) >= 3 and self._has_fulltext(conn):
+                    parts.append("productID IN (SELECT rowid FROM ProductsFTS WHERE ProductsFTS MATCH ?)")
+                    params.append('"' + name_contains.replace('"', '""') + '"')
+                else:
+                    parts.append("productName LIKE ? ESCAPE '\\'")
+                    params.append("%" + _like_prefix(name_contains))
+            if min_price is not None:
+                parts.append("productPrice >= ?")
+                params.append(min_price)
+            if max_price is not None:
+                parts.append("productPrice <= ?")
+                params.append(max_price)
+
+            sql = "SELECT productID, productName, productPrice FROM Products"
+            if parts:
+                sql += f" WHERE {' AND '.join(parts)}"
+            sql += f" ORDER BY {SEARCH_ORDERS[order_by]}"
+            if limit is not None:
+                sql += " LIMIT ?"
+                params.append(limit)
+            return conn.execute(sql, params).fetchall()
+
     def count(self):
-        with self._connect() as conn:
+        with self._conn() as conn:
             cur = conn.cursor()
             cur.execute("SELECT COUNT(*) FROM Products")
             return cur.fetchone()[0]
 
+class AsyncProductDB:
+    """
+    asyncio 용 ProductDB 래퍼.
+
+    읽기(select/count/search)는 작은 스레드 풀에서 각자의 연결로 실행하고,
+    쓰기(insert/update/delete)는 전용 쓰기 스레드 하나가 큐에 쌓인 요청을
+    최대 max_batch 개씩 묶어 한 트랜잭션으로 커밋한다 (그룹 커밋).
+    묶음 처리 중 예상 밖의 오류가 나면 그 묶음의 요청에만 예외를 돌려주고 계속 돌며,
+    쓰기 스레드가 끝난 뒤(close 또는 연결 실패)의 쓰기는 기다리지 않고 바로 RuntimeError 를 낸다.
+    읽기와 쓰기가 서로 막지 않도록 DB 를 WAL 모드로 연다.
+
+        async with AsyncProductDB("MyProduct.db") as db:
+            await db.insert(1, "Product_1", 1000)
+            row = await db.select(1)
+    """
+
+    _STOP = object()
+
+    def __init__(self, db_path=None, read_workers=4, max_batch=500, cache_size=0, cache_ttl=60.0,
+                 profile=None, query_timer=None):
+        self.db = ProductDB(db_path, reuse_connections=True, cache_size=cache_size, cache_ttl=cache_ttl,
+                            profile=profile, query_timer=query_timer)
+        if not self.db.read_only:
+            with self.db._conn() as conn:
+                conn.execute("PRAGMA journal_mode=WAL")
+        self.max_batch = max_batch
+        self.batch_sizes = []  # 그룹 커밋마다 묶인 쓰기 수
+        self._readers = ThreadPoolExecutor(max_workers=read_workers, thread_name_prefix="product-reader")
+        self._writes = queue.Queue()
+        self._writer_done = False  # 쓰기 스레드가 큐를 더 이상 읽지 않음
+        self._writer_error = None  # 쓰기 스레드를 끝낸 예외
+        self._writer_lock = threading.Lock()  # 큐에 넣기와 쓰기 스레드 종료 처리를 직렬화
+        self._writer = threading.Thread(target=self._writer_loop, name="product-writer", daemon=True)
+        self._writer.start()
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        await self.close()
+
+    async def close(self):
+        """대기 중인 쓰기를 모두 커밋한 뒤 스레드와 연결을 정리합니다."""
+        self._writes.put(self._STOP)
+        loop = asyncio.get_running_loop()
+        await loop.run_in_executor(None, self._writer.join)
+        self._readers.shutdown(wait=True)
+        self.db.close()
+
+    # 읽기: 스레드 풀
+    async def select(self, productID=None, limit=None, offset=None):
+        return await self._read(self.db.select, productID, limit, offset)
+
+    async def count(self):
+        return await self._read(self.db.count)
+
+    async def search(self, **filters):
+        return await self._read(functools.partial(self.db.search, **filters))
+
+    async def _read(self, func, *args):
+        return await asyncio.get_running_loop().run_in_executor(self._readers, func, *args)
+
+    # 쓰기: 전용 쓰기 스레드
+    async def insert(self, productID, productName, productPrice):
+        return await self._write(ProductDB._insert_row, productID, productID, productName, productPrice)
+
+    async def update(self, productID, productName=None, productPrice=None):
+        return await self._write(ProductDB._update_row, productID, productID, productName, productPrice)
+
+    async def delete(self, productID):
+        return await self._write(ProductDB._delete_row, productID, productID)
+
+    async def _write(self, func, productID, *args):
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        with self._writer_lock:
+            if self._writer_done:
+                raise RuntimeError("쓰기 스레드가 종료되어 쓰기를 처리할 수 없습니다") from self._writer_error
+            self._writes.put((func, productID, args, loop, future))
+        return await future
+
+    def _writer_loop(self):
+        try:
+            conn = self.db._thread_connection()
+            stopping = False
+            while not stopping:
+                batch = [self._writes.get()]
+                while len(batch) < self.max_batch:
+                    try:
+                        batch.append(self._writes.get_nowait())
+                    except queue.Empty:
+                        break
+                if batch[-1] is self._STOP:
+                    batch.pop()
+                    stopping = True
+                elif self._STOP in batch:
+                    # 종료 요청 뒤에 들어온 쓰기는 없다고 보지만, 있다면 함께 처리한다
+                    batch.remove(self._STOP)
+                    stopping = True
+                if batch:
+                    try:
+                        self._commit_batch(conn, batch)
+                    except BaseException as e:
+                        # 캐시 무효화 등 묶음 처리 자체의 오류: 이 묶음만 실패시키고 계속 돈다
+                        self._fail_batch(batch, e)
+        except BaseException as e:
+            with self._writer_lock:
+                self._writer_error = e
+            raise
+        finally:
+            # 더 이상 처리할 스레드가 없으므로 큐에 남은 쓰기를 모두 실패시킨다
+            with self._writer_lock:
+                self._writer_done = True
+                leftover = []
+                while True:
+                    try:
+                        item = self._writes.get_nowait()
+                    except queue.Empty:
+                        break
+                    if item is not self._STOP:
+                        leftover.append(item)
+                self._fail_batch(leftover, self._writer_error or RuntimeError("쓰기 스레드가 종료되었습니다"))
+
+    @staticmethod
+    def _fail_batch(batch, error):
+        for _, _, _, loop, future in batch:
+            try:
+                loop.call_soon_threadsafe(_resolve, future, False, error)
+            except RuntimeError:
+                pass  # 이벤트 루프가 이미 닫힘
+
+    def _commit_batch(self, conn, batch):
+        """쓰기 묶음을 한 트랜잭션으로 실행합니다. 개별 문장의 오류는 해당 요청에만 전달한다."""
+        cur = conn.cursor()
+        results = []
+        try:
+            with conn:
+                for func, productID, args, loop, future in batch:
+                    try:
+                        results.append((True, func(cur, *args)))
+                    except Exception as e:
+                        results.append((False, e))
+        except Exception as e:
+            results = [(False, e)] * len(batch)
+
+        self.db._invalidate(productID for _, productID, _, _, _ in batch)
+        self.batch_sizes.append(len(batch))
+        for (ok, value), (_, _, _, loop, future) in zip(results, batch):
+            loop.call_soon_threadsafe(_resolve, future, ok, value)
+
+
+def _resolve(future, ok, value):
+    if future.done():
+        return
+    if ok:
+        future.set_result(value)
+    else:
+        future.set_exception(value)
+
+
+EXPORT_COLUMNS = ["productID", "productName", "productPrice"]
+EXPORT_FORMATS = {".csv": "csv", ".parquet": "parquet", ".xlsx": "xlsx"}
+XLSX_MAX_ROWS = 1_048_575  # 시트당 데이터 행 수 (헤더 제외)
+
+# 구간별 임시 파일 형식: CSV 는 그대로 이어 붙이고, Parquet 은 인코딩 없이 읽히는 Arrow IPC 로 받아
+# 본 파일에서 한 번만 인코딩하며, XLSX 는 이어 붙일 수 없으므로 CSV 로 받아 다시 쓴다
+PART_FORMATS = {"csv": "csv", "parquet": "arrow", "xlsx": "csv"}
+
+
+class _CsvExport:
+    def __init__(self, path, header=True):
+        # 구간 파일(header=False)은 BOM/헤더 없이 써서 본 파일 뒤에 바이트 그대로 이어 붙인다
+        self._file = open(path, "w", newline="", encoding="utf-8-sig" if header else "utf-8")
+        self._writer = csv.writer(self._file)
+        if header:
+            self._writer.writerow(EXPORT_COLUMNS)
+
+    def write(self, rows):
+        self._writer.writerows(rows)
+
+    def append_part(self, path):
+        self._file.flush()
+        with open(path, "rb") as part:
+            shutil.copyfileobj(part, self._file.buffer, 1024 * 1024)
+
+    def close(self):
+        self._file.close()
+
+
+class _ParquetExport:
+    SCHEMA = pa.schema([("productID", pa.int64()), ("productName", pa.string()), ("productPrice", pa.int64())]) \
+        if HAVE_PYARROW else None
+
+    def __init__(self, path):
+        self._writer = pq.ParquetWriter(path, self.SCHEMA)
+
+    @classmethod
+    def to_table(cls, rows):
+        columns = list(zip(*rows))
+        return pa.Table.from_arrays(
+            [pa.array(column, type=field.type) for column, field in zip(columns, cls.SCHEMA)], schema=cls.SCHEMA)
+
+    def write(self, rows):
+        self._writer.write_table(self.to_table(rows))
+
+    def append_part(self, path):
+        with pa.memory_map(path) as source:
+            reader = pa.ipc.open_file(source)
+            for index in range(reader.num_record_batches):
+                self._writer.write_table(pa.Table.from_batches([reader.get_batch(index)]))
+
+    def close(self):
+        self._writer.close()
+
+
+class _ArrowPart:
+    """Parquet 내보내기의 구간 파일 (Arrow IPC, 변환만 하고 인코딩은 본 파일에서)."""
+
+    def __init__(self, path):
+        self._writer = pa.ipc.new_file(path, _ParquetExport.SCHEMA)
+
+    def write(self, rows):
+        self._writer.write_table(_ParquetExport.to_table(rows))
+
+    def close(self):
+        self._writer.close()
+
+
+class _XlsxExport:
+    """xlsxwriter constant_memory 모드: 행을 쓰는 즉시 디스크로 내보내므로 메모리가 일정하다."""
+
+    def __init__(self, path):
+        self._workbook = xlsxwriter.Workbook(path, {"constant_memory": True})
+        self._sheet = None
+        self._row = XLSX_MAX_ROWS + 1
+
+    def write(self, rows):
+        # 컬럼 타입이 정해져 있으므로 write_row 의 셀별 타입 판별 없이 바로 쓴다
+        for pid, name, price in rows:
+            if self._row > XLSX_MAX_ROWS:
+                self._sheet = self._workbook.add_worksheet(f"Products{len(self._workbook.worksheets()) + 1}")
+                self._sheet.write_row(0, 0, EXPORT_COLUMNS)
+                self._row = 1
+            self._sheet.write_number(self._row, 0, pid)
+            self._sheet.write_string(self._row, 1, name)
+            self._sheet.write_number(self._row, 2, price)
+            self._row += 1
+
+    def append_part(self, path):
+        with open(path, newline="", encoding="utf-8") as part:
+            self.write((int(pid), name, int(price)) for pid, name, price in csv.reader(part))
+
+    def close(self):
+        self._workbook.close()
+
+
+def _open_export(path, fmt, header=True):
+    if fmt in ("parquet", "arrow") and not HAVE_PYARROW:
+        raise RuntimeError("Parquet 내보내기에는 pyarrow 설치가 필요합니다.")
+    if fmt == "xlsx" and not HAVE_XLSXWRITER:
+        raise RuntimeError("XLSX 내보내기에는 xlsxwriter 설치가 필요합니다.")
+    if fmt == "csv":
+        return _CsvExport(path, header)
+    return {"parquet": _ParquetExport, "arrow": _ArrowPart, "xlsx": _XlsxExport}[fmt](path)
+
+
+def _connect_read_only(db_path):
+    conn = sqlite3.connect(Path(db_path).resolve().as_uri() + "?mode=ro", uri=True, check_same_thread=False)
+    apply_profile(conn, "read_only")
+    return conn
+
+
+def _export_range(db_path, lo, hi, part_path, part_fmt, chunk_rows):
+    """productID [lo, hi) 구간을 구간 파일 하나로 기록합니다 (작업자 프로세스에서 실행)."""
+    conn = _connect_read_only(db_path)
+    part = _open_export(part_path, part_fmt, header=False)
+    written = 0
+    try:
+        cur = conn.cursor()
+        cur.arraysize = chunk_rows
+        cur.execute(
+            "SELECT productID, productName, productPrice FROM Products"
+            " WHERE productID >= ? AND productID < ? ORDER BY productID",
+            (lo, hi),
+        )
+        while True:
+            rows = cur.fetchmany()
+            if not rows:
+                break
+            part.write(rows)
+            written += len(rows)
+    finally:
+        part.close()
+        conn.close()
+    return written
+
+
+def export_products(db_path, out_path, fmt=None, partitions=4, workers=4, chunk_rows=20_000):
+    """
+    Products 테이블을 기본키 범위로 나눠 병렬로 읽고 CSV/Parquet/XLSX 파일 하나로 내보냅니다.
+
+    구간마다 작업자 프로세스가 읽기 전용 연결을 따로 열어 fetchmany 로 chunk_rows 개씩 읽고
+    구간별 임시 파일(PART_FORMATS)에 독립적으로 기록하면, 앞 구간부터 끝나는 대로
+    본 파일에 이어 붙인다 (CSV 는 바이트 복사, Parquet 은 Arrow 묶음을 인코딩만).
+    구간끼리 서로 기다리지 않으므로 workers 개 구간을 동시에 읽고 변환하며, 메모리에는
+    작업자마다 chunk_rows 묶음 하나만 올라간다. 실패하면 만들던 출력 파일을 지운다.
+
+    Args:
+        db_path (str): ProductDB 파일 경로
+        out_path (str): 출력 파일 경로
+        fmt (str): 'csv', 'parquet', 'xlsx' (None이면 확장자로 판단)
+        partitions (int): 기본키 구간 수
+        workers (int): 동시에 읽는 구간 수 (작업자 프로세스 수, CPU 코어 수를 넘기지 않는다)
+        chunk_rows (int): fetchmany 묶음 크기
+
+    Returns:
+        dict: {"rows", "elapsed_seconds", "rows_per_second", "path"}
+    """
+    fmt = fmt or EXPORT_FORMATS.get(Path(out_path).suffix.lower())
+    if fmt not in EXPORT_FORMATS.values():
+        raise ValueError(f"지원하지 않는 내보내기 형식: {fmt or out_path}")
+
+    start_time = time.time()
+    conn = _connect_read_only(db_path)
+    try:
+        low, high = conn.execute("SELECT MIN(productID), MAX(productID) FROM Products").fetchone()
+    finally:
+        conn.close()
+
+    ranges = []
+    if low is not None:
+        step = max(1, -(-(high - low + 1) // partitions))
+        ranges = [(start, min(start + step, high + 1)) for start in range(low, high + 1, step)]
+    part_fmt = PART_FORMATS[fmt]
+    workers = max(1, min(workers, len(ranges), os.cpu_count() or 1))
+
+    exported = 0
+    out_dir = os.path.dirname(os.path.abspath(out_path))
+    part_dir = tempfile.mkdtemp(prefix=".export-", dir=out_dir)
+    sink = None
+    try:
+        sink = _open_export(out_path, fmt)
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            part_paths = [os.path.join(part_dir, f"part-{index:05d}.{part_fmt}") for index in range(len(ranges))]
+            futures = [pool.submit(_export_range, db_path, lo, hi, part_path, part_fmt, chunk_rows)
+                       for (lo, hi), part_path in zip(ranges, part_paths)]
+            try:
+                for future, part_path in zip(futures, part_paths):
+                    exported += future.result()
+                    sink.append_part(part_path)
+                    os.remove(part_path)
+            finally:
+                for future in futures:
+                    future.cancel()  # 실패 시 아직 시작하지 않은 구간은 건너뛴다
+        sink.close()
+    except BaseException:
+        if sink is not None:
+            try:
+                sink.close()
+            except Exception:
+                pass
+            try:
+                os.remove(out_path)  # 반쯤 쓴 파일을 남기지 않는다
+            except OSError:
+                pass
+        raise
+    finally:
+        shutil.rmtree(part_dir, ignore_errors=True)
+
+    elapsed = time.time() - start_time
+    return {"rows": exported, "elapsed_seconds": elapsed,
+            "rows_per_second": exported / elapsed if elapsed else None, "path": out_path}
+
+
+def benchmark_connection_reuse(db_path, ops=20_000):
+    """
+    같은 DB 에서 연결을 매번 여는 방식과 재사용하는 방식의 점 조회 처리량을 비교합니다.
+
+    Returns:
+        dict: 방식별 초당 처리 건수
+    """
+    total = ProductDB(db_path).count()
+    if not total:
+        print("벤치마크할 데이터가 없습니다.")
+        return {}
+    ids = [random.randint(1, total) for _ in range(ops)]
+
+    results = {}
+    for label, reuse in (("connect-per-call", False), ("reuse", True)):
+        with ProductDB(db_path, reuse_connections=reuse) as db:
+            start = time.perf_counter()
+            for pid in ids:
+                db.select(productID=pid)
+            results[label] = ops / (time.perf_counter() - start)
+
+    print(f"점 조회 {ops:,}회 ({total:,}건 테이블)")
+    for label, rate in results.items():
+        print(f"  {label:<17} {rate:,.0f} ops/sec")
+    return results
+
+
+def benchmark_pagination(db_path, page_size=100, depths=(0.01, 0.5, 0.99)):
+    """
+    OFFSET 페이지네이션과 키셋 페이지네이션의 깊은 페이지 조회 시간을 비교합니다.
+
+    Args:
+        depths (tuple): 테이블 크기 대비 페이지 위치 비율
+
+    Returns:
+        dict: 페이지 위치 -> (OFFSET 초, 키셋 초)
+    """
+    with ProductDB(db_path, reuse_connections=True) as db:
+        total = db.count()
+        results = {}
+        for depth in depths:
+            offset = int(total * depth)
+            start = time.perf_counter()
+            by_offset = db.select(limit=page_size, offset=offset)
+            offset_seconds = time.perf_counter() - start
+
+            # 키셋은 직전 페이지의 마지막 productID 를 알고 있다고 가정
+            after_id = by_offset[0][0] - 1 if by_offset else offset
+            start = time.perf_counter()
+            db.select_page(after_id=after_id, page_size=page_size)
+            results[offset] = (offset_seconds, time.perf_counter() - start)
+
+    print(f"페이지 크기 {page_size} ({total:,}건 테이블)")
+    for offset, (offset_seconds, keyset_seconds) in results.items():
+        print(f"  {offset:>10,}번째부터  OFFSET {offset_seconds * 1000:8.2f}ms  키셋 {keyset_seconds * 1000:6.2f}ms")
+    return results
+
+
+def benchmark_search(db_path, repeat=200):
+    """
+    이름 접두어/가격 범위/부분 문자열 검색을 인덱스 사용 시와 전체 스캔(NOT INDEXED) 시로 비교합니다.
+
+    Returns:
+        dict: 검색 종류 -> (전체 스캔 ms, 인덱스 ms)
+    """
+    db = ProductDB(db_path, reuse_connections=True)
+    fulltext = db.enable_fulltext()
+    conn = db._thread_connection()
+    total = db.count()
+
+    cases = {
+        "이름 접두어": (
+            "SELECT * FROM Products NOT INDEXED WHERE productName LIKE 'product_9999%' ORDER BY productName COLLATE NOCASE LIMIT 100",
+            lambda: db.search_by_name_prefix("product_9999"),
+        ),
+        "가격 범위": (
+            "SELECT * FROM Products NOT INDEXED WHERE productPrice BETWEEN 5000 AND 5010 ORDER BY productPrice, productID LIMIT 100",
+            lambda: db.search_price_range(5000, 5010),
+        ),
+        "접두어+가격": (
+            "SELECT * FROM Products NOT INDEXED WHERE productName LIKE 'product_99%' AND productPrice < 200 ORDER BY productID LIMIT 100",
+            lambda: db.search(name_prefix="product_99", max_price=199),
+        ),
+    }
+    if fulltext:
+        cases["부분 문자열"] = (
+            "SELECT * FROM Products WHERE productName LIKE '%t_4242%' ORDER BY productID LIMIT 100",
+            lambda: db.search_by_name_contains("t_4242"),
+        )
+
+    results = {}
+    for label, (scan_sql, indexed) in cases.items():
+        start = time.perf_counter()
+        for _ in range(max(1, repeat // 20)):
+            conn.execute(scan_sql).fetchall()
+        scan_ms = (time.perf_counter() - start) / max(1, repeat // 20) * 1000
+        start = time.perf_counter()
+        for _ in range(repeat):
+            indexed()
+        results[label] = (scan_ms, (time.perf_counter() - start) / repeat * 1000)
+    db.close()
+
+    print(f"검색 벤치마크 ({total:,}건 테이블, FTS5 {'사용' if fulltext else '없음'})")
+    for label, (scan_ms, indexed_ms) in results.items():
+        print(f"  {label:<8} 전체 스캔 {scan_ms:8.2f}ms  인덱스 {indexed_ms:6.3f}ms")
+    return results
+
+
+def benchmark_point_cache(db_path, ops=50_000, hot_ids=500, hot_ratio=0.9):
+    """
+    소수의 인기 상품에 조회가 몰리는 패턴으로 캐시 유무에 따른 점 조회 처리량을 비교합니다.
+
+    Returns:
+        dict: 방식별 초당 처리 건수
+    """
+    total = ProductDB(db_path).count()
+    if not total:
+        print("벤치마크할 데이터가 없습니다.")
+        return {}
+    hot = random.sample(range(1, total + 1), min(hot_ids, total))
+    ids = [random.choice(hot) if random.random() < hot_ratio else random.randint(1, total) for _ in range(ops)]
+
+    results = {}
+    for label, cache_size in (("캐시 없음", 0), ("LRU 캐시", 10_000)):
+        with ProductDB(db_path, reuse_connections=True, cache_size=cache_size) as db:
+            start = time.perf_counter()
+            for pid in ids:
+                db.select(productID=pid)
+            results[label] = ops / (time.perf_counter() - start)
+            stats = db.cache.stats() if db.cache else None
+
+    print(f"점 조회 {ops:,}회 (인기 상품 {len(hot)}개에 {hot_ratio:.0%} 집중, {total:,}건 테이블)")
+    for label, rate in results.items():
+        print(f"  {label:<8} {rate:,.0f} ops/sec")
+    print(f"  캐시 통계: {stats}")
+    return results
+
+
+def benchmark_async_writes(db_path, writes=5_000, concurrency=200):
+    """
+    동시 쓰기 요청을 스레드 풀에서 동기 ProductDB 로 처리할 때와
+    AsyncProductDB 그룹 커밋으로 처리할 때의 처리량을 비교합니다 (새 ID 로 삽입 후 삭제).
+
+    Returns:
+        dict: 방식별 초당 쓰기 수
+    """
+    start_id = ProductDB(db_path).count() + 10_000_000
+    ids = range(start_id, start_id + writes)
+
+    async def run_sync():
+        db = ProductDB(db_path, reuse_connections=True)
+        loop = asyncio.get_running_loop()
+        with ThreadPoolExecutor(max_workers=8) as pool:
+            semaphore = asyncio.Semaphore(concurrency)
+
+            async def one(pid):
+                async with semaphore:
+                    await loop.run_in_executor(pool, db.insert, pid, f"Bench_{pid}", 100)
+            await asyncio.gather(*(one(pid) for pid in ids))
+        db.close()
+
+    async def run_async():
+        async with AsyncProductDB(db_path) as db:
+            semaphore = asyncio.Semaphore(concurrency)
+
+            async def one(pid):
+                async with semaphore:
+                    await db.insert(pid, f"Bench_{pid}", 100)
+            await asyncio.gather(*(one(pid) for pid in ids))
+            return db.batch_sizes
+
+    results = {}
+    for label, runner in (("동기+스레드 풀", run_sync), ("그룹 커밋", run_async)):
+        start = time.perf_counter()
+        batch_sizes = asyncio.run(runner())
+        results[label] = writes / (time.perf_counter() - start)
+        ProductDB(db_path).delete_many(ids)
+
+    print(f"동시 쓰기 {writes:,}건 (동시 요청 {concurrency}개)")
+    for label, rate in results.items():
+        print(f"  {label:<10} {rate:,.0f} writes/sec")
+    print(f"  그룹 커밋 평균 묶음 크기: {sum(batch_sizes) / len(batch_sizes):.1f}")
+    return results
+
+
 if __name__ == "__main__":
     # 간단 사용 예: 데이터베이스 생성 및 100,000건 샘플 데이터 삽입
-    db = ProductDB()  # MyProduct.db 생성
+    parser = argparse.ArgumentParser(description="ProductDB 샘플 데이터 생성")
+    parser.add_argument("--db", help="DB 파일 경로 (기본값: MyProduct.db)")
+    parser.add_argument("--total", type=int, default=100_000, help="목표 레코드 수")
+    parser.add_argument("--fast", action="store_true", help="대량 적재 모드 (단일 트랜잭션, 적재용 PRAGMA)")
+    parser.add_argument("--build-indexes", action="store_true", help="적재 후 보조 인덱스 생성 (--fast 와 함께)")
+    parser.add_argument("--benchmark-connections", action="store_true", help="연결 재사용 전후 점 조회 처리량 비교")
+    parser.add_argument("--benchmark-pagination", action="store_true", help="OFFSET / 키셋 페이지네이션 비교")
+    parser.add_argument("--benchmark-search", action="store_true", help="인덱스 검색 / 전체 스캔 비교")
+    parser.add_argument("--benchmark-cache", action="store_true", help="점 조회 캐시 유무 처리량 비교")
+    parser.add_argument("--benchmark-async", action="store_true", help="동시 쓰기: 스레드 풀 / 그룹 커밋 비교")
+    parser.add_argument("--export", metavar="PATH", help="Products 를 .csv/.parquet/.xlsx 파일로 내보내기")
+    parser.add_argument("--export-partitions", type=int, default=4, help="내보내기 기본키 구간 수")
+    parser.add_argument("--profile", choices=["oltp", "bulk_load", "read_only"], help="연결 PRAGMA 프로파일")
+    parser.add_argument("--trace-queries", action="store_true", help="문장별 지연 통계와 느린 문장 실행 계획 출력")
+    parser.add_argument("--slow-ms", type=float, default=50.0, help="느린 문장 기준(ms)")
+    args = parser.parse_args()
+
+    timer = QueryTimer(slow_ms=args.slow_ms) if args.trace_queries else None
+    db = ProductDB(args.db, profile=args.profile, query_timer=timer)  # MyProduct.db 생성
     print("DB 파일:", db.db_path)
     existing = db.count()
     print("기존 레코드 수:", existing)
-    if existing < 100_000:
-        to_add = 100_000 - existing
+    if existing < args.total and db.read_only:
+        print(f"'{args.profile}' 프로파일이므로 레코드를 삽입하지 않습니다.")
+    elif existing < args.total:
+        to_add = args.total - existing
         print(f"{to_add}개 레코드 삽입 시작...")
-        result = db.bulk_insert(total=to_add, start_id=existing + 1, batch_size=5000)
+        result = db.bulk_insert(total=to_add, start_id=existing + 1, batch_size=5000,
+                                fast=args.fast, build_indexes=args.build_indexes)
         print("삽입 완료:", result)
-    print("총 레코드 수:", db.count())
\ No newline at end of file
+    print("총 레코드 수:", db.count())
+    if timer is not None:
+        # 측정용 표본 조회: 점 조회, 키셋 페이지, 검색
+        for pid in random.sample(range(1, db.count() + 1), min(100, db.count())):
+            db.select(productID=pid)
+        db.select_page(after_id=db.count() // 2, page_size=1000)
+        db.search_by_name_prefix("Product_99")
+        db.search_price_range(5000, 5100, limit=None)
+        db.search(name_contains="_123", order_by="price")
+        timer.report()
+        with db._conn() as conn:
+            timer.explain_slow(conn)
+
+    if args.benchmark_connections:
+        benchmark_connection_reuse(db.db_path)
+    if args.benchmark_pagination:
+        benchmark_pagination(db.db_path)
+    if args.benchmark_search:
+        benchmark_search(db.db_path)
+    if args.benchmark_cache:
+        benchmark_point_cache(db.db_path)
+    if args.benchmark_async:
+        benchmark_async_writes(db.db_path)
+    if args.export:
+        print("내보내기 완료:", export_products(db.db_path, args.export, partitions=args.export_partitions))
\ No newline at end of file
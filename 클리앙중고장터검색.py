@@ -1,5 +1,5 @@
 # coding:utf-8
-from bs4 import BeautifulSoup
+from html_parsing import select_nodes
 import urllib.request
 import re 
 
@@ -8,15 +8,14 @@ hdr = {'User-agent':'Mozilla/5.0 (iPhone; CPU iPhone OS 10_3 like Mac OS X) Appl
 
 for n in range(0,10):
         #클리앙의 중고장터 주소 
-        data ='https://www.clien.net/service/board/sold?&od=T31&po=' + str(n)
+        url ='https://www.clien.net/service/board/sold?&od=T31&po=' + str(n)
         #웹브라우져 헤더 추가 
-        req = urllib.request.Request(data, headers = hdr)
+        req = urllib.request.Request(url, headers = hdr)
         data = urllib.request.urlopen(req).read()
  
         #혹시 한글이 깨지는 경우       
         page = data.decode('utf-8', 'ignore')
-        soup = BeautifulSoup(page, 'html.parser')
-        list = soup.find_All('span', attrs={'class':'list_subject'})
+        list = select_nodes(page, 'span.list_subject', url)
 
         for item in list:
                 try: